@@ -0,0 +1,101 @@
+"""오타, 공백, 대소문자가 섞인 회사 이름 10만 개를 해석하는 속도와 정확도를 측정합니다.
+
+    python -m benchmarks.company_resolver --count 100000
+"""
+import argparse
+import logging
+import random
+import statistics
+import time
+from typing import Callable, List, Optional, Tuple
+
+from stock_news_analyzer.utils.company_code import COMPANY_CODE
+from stock_news_analyzer.utils.company_resolver import get_resolver, resolve_code
+
+HANGUL_BASE = 0xAC00
+VOWELS = 21
+FINALS = 28
+
+
+def change_vowel(ch: str, rng: random.Random) -> str:
+    """한글 음절의 모음을 하나 바꿉니다('자' -> '쟈')."""
+    offset = ord(ch) - HANGUL_BASE
+    if not 0 <= offset < 11172:
+        return ch
+    initial, rest = divmod(offset, VOWELS * FINALS)
+    _, final = divmod(rest, FINALS)
+    return chr(HANGUL_BASE + (initial * VOWELS + rng.randrange(VOWELS)) * FINALS + final)
+
+
+def add_noise(name: str, rng: random.Random) -> str:
+    noise = rng.randrange(6)
+    if noise == 0:
+        return f" {name} "
+    if noise == 1 and len(name) > 1:
+        i = rng.randrange(1, len(name))
+        return f"{name[:i]} {name[i:]}"
+    if noise == 2:
+        return name.lower() if rng.random() < 0.5 else name.upper()
+    if noise == 3 and len(name) > 3:
+        i = rng.randrange(1, len(name))
+        return name[:i] + name[i + 1:]
+    if noise == 4:
+        i = rng.randrange(len(name))
+        return name[:i] + change_vowel(name[i], rng) + name[i + 1:]
+    if noise == 5 and len(name) > 3:
+        return name[:-1]
+    return name
+
+
+def make_queries(count: int, seed: int) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    names = list(COMPANY_CODE)
+    queries = []
+    for _ in range(count):
+        name = rng.choice(names)
+        queries.append((add_noise(name, rng), COMPANY_CODE[name]))
+    return queries
+
+
+def run(resolve: Callable[[str], Optional[str]], queries: List[Tuple[str, str]]) -> None:
+    latencies = []
+    correct = unresolved = 0
+    for query, expected in queries:
+        started = time.perf_counter()
+        code = resolve(query)
+        latencies.append(time.perf_counter() - started)
+        if code == expected:
+            correct += 1
+        elif code is None:
+            unresolved += 1
+    latencies.sort()
+    total = len(queries)
+    wrong = total - correct - unresolved
+    print(f"  {total / sum(latencies):,.0f} names/s, "
+          f"평균 {statistics.fmean(latencies) * 1e6:.0f}us, "
+          f"p99 {latencies[int(total * 0.99)] * 1e6:.0f}us, "
+          f"최대 {latencies[-1] * 1e6:.0f}us")
+    print(f"  정확 {correct / total:.1%}, 찾지 못함 {unresolved / total:.1%}, "
+          f"잘못 해석 {wrong / total:.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="회사 이름 해석 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="해석할 이름 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    started = time.perf_counter()
+    get_resolver()
+    print(f"색인 생성: {(time.perf_counter() - started) * 1e3:.1f}ms, 회사 {len(COMPANY_CODE)}개")
+
+    queries = make_queries(args.count, args.seed)
+    print("캐시 없이:")
+    run(resolve_code.__wrapped__, queries)
+    print("캐시 사용:")
+    run(resolve_code, queries)
+
+
+if __name__ == "__main__":
+    main()
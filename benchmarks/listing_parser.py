@@ -0,0 +1,141 @@
+"""목록 페이지 파서의 처리량(rows/s)을 BeautifulSoup 기반 기준 구현과 비교합니다.
+
+    python -m benchmarks.listing_parser                     # 만든 페이지로 측정
+    python -m benchmarks.listing_parser --record pages/     # 실제 목록 페이지를 저장
+    python -m benchmarks.listing_parser --pages pages/      # 저장한 페이지로 측정
+"""
+import argparse
+import asyncio
+import re
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+from stock_news_analyzer.finder import fetch, listing_url
+from stock_news_analyzer.listing import ListingWindow, parse_listing
+from stock_news_analyzer.utils.http import create_session
+
+from .naver_pages import make_listing_page
+
+Parser = Callable[[str, date, Optional[date], Optional[date]], Tuple[List[Dict[str, Any]], bool]]
+
+
+def parse_with_bs4(
+    html_content: str,
+    today: date,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """기존 `finder.parse_news_page` 구현 (로그 제외)."""
+    html = BeautifulSoup(html_content, "lxml")
+    for relation_lst in html.select("tr.relation_lst"):
+        relation_lst.decompose()
+
+    crawled_links: List[Dict[str, Any]] = []
+    for item in html.select("table.type5 tbody tr:not(.hide_news)"):
+        date_elem = item.select_one(".date")
+        title_elem = item.select_one(".title")
+        if not date_elem or not isinstance(title_elem, Tag):
+            continue
+        info_elem = item.select_one(".info")
+        link_elem = title_elem.find("a")
+        if not isinstance(link_elem, Tag):
+            continue
+        match = re.search(r'article_id=(\d+)&office_id=(\d+)', str(link_elem.get("href", "")))
+        if not match:
+            continue
+        news_date_text = date_elem.get_text().strip()
+        try:
+            news_date = datetime.strptime(news_date_text, "%Y.%m.%d %H:%M")
+        except ValueError:
+            continue
+        if news_date.date() > today:
+            continue
+        if start_date and news_date.date() < start_date:
+            return crawled_links, True
+        if end_date and news_date.date() > end_date:
+            continue
+        crawled_links.append({
+            "date": news_date_text,
+            "source": info_elem.get_text().strip() if info_elem else "",
+            "title": title_elem.get_text(strip=True),
+            "link": f"https://n.news.naver.com/mnews/article/{match.group(2)}/{match.group(1)}",
+        })
+    return crawled_links, False
+
+
+def parse_with_lxml(
+    html_content: str,
+    today: date,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    return parse_listing(html_content, ListingWindow(today, start_date, end_date))
+
+
+def make_pages(num_pages: int) -> List[str]:
+    now = datetime.now().replace(second=0, microsecond=0)
+    pages = []
+    for page in range(num_pages):
+        rows = [
+            (now - timedelta(days=page, minutes=i), "009", f"{page * 20 + i:010d}",
+             f"[특징주] 뉴스 제목 {page}-{i}", "매일경제")
+            for i in range(20)
+        ]
+        pages.append(make_listing_page(rows))
+    return pages
+
+
+def load_pages(directory: Path) -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(directory.glob("*.html"))]
+
+
+async def record_pages(directory: Path, code: str, num_pages: int) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    async with create_session() as session:
+        for page in range(1, num_pages + 1):
+            html = await fetch(session, listing_url(code, page))
+            (directory / f"{code}-{page:04d}.html").write_text(html, encoding="utf-8")
+
+
+def measure(parser: Parser, pages: List[str], repeat: int) -> Tuple[int, float]:
+    today = datetime.now().date()
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            news_items, _ = parser(html, today, None, None)
+            rows += len(news_items)
+    return rows, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 페이지 파서 벤치마크")
+    parser.add_argument("--pages", type=Path, help="저장한 목록 페이지(*.html) 디렉토리")
+    parser.add_argument("--record", type=Path, help="실제 목록 페이지를 저장할 디렉토리")
+    parser.add_argument("--code", default="000660", help="저장할 회사 코드")
+    parser.add_argument("--num-pages", type=int, default=50, help="만들거나 저장할 페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record_pages(args.record, args.code, args.num_pages))
+        return
+
+    pages = load_pages(args.pages) if args.pages else make_pages(args.num_pages)
+    baseline = parse_with_bs4(pages[0], datetime.now().date())
+    assert parse_with_lxml(pages[0], datetime.now().date()) == baseline
+
+    results = {}
+    for name, parse in [("bs4", parse_with_bs4), ("lxml", parse_with_lxml)]:
+        rows, elapsed = measure(parse, pages, args.repeat)
+        results[name] = rows / elapsed
+        print(f"{name:>5}: {rows}행 {elapsed:.3f}초, {rows / elapsed:,.0f} rows/s")
+    print(f"{results['lxml'] / results['bs4']:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""finance.naver.com 목록 페이지와 같은 구조의 HTML을 만듭니다. 벤치마크와 테스트가 함께 씁니다."""
+from datetime import datetime
+from typing import List, Tuple
+
+NewsRow = Tuple[datetime, str, str, str, str]
+
+
+def make_listing_page(rows: List[NewsRow]) -> str:
+    """finance.naver.com 종목뉴스 목록 페이지와 같은 구조의 HTML을 만듭니다."""
+    body = []
+    for i, (news_date, office_id, article_id, title, source) in enumerate(rows):
+        href = (f"/item/news_read.naver?article_id={article_id}&office_id={office_id}"
+                f"&code=000660&page=1&sm=title_entity_id.basic")
+        related = f"/item/news_read.naver?article_id=9{article_id}&office_id={office_id}"
+        hidden = f"/item/news_read.naver?article_id=8{article_id}&office_id={office_id}"
+        body.append(f"""
+        <tr class="{'first' if i == 0 else ''}">
+            <td class="title"><a href="{href}" class="tit" target="_top">{title}</a></td>
+            <td class="info">{source}</td>
+            <td class="date"> {news_date.strftime('%Y.%m.%d %H:%M')}</td>
+        </tr>
+        <tr class="relation_lst">
+            <td colspan="3">
+                <table class="type5"><tbody><tr>
+                    <td class="title"><a href="{related}">관련 뉴스</a></td>
+                    <td class="info">{source}</td>
+                    <td class="date"> {news_date.strftime('%Y.%m.%d %H:%M')}</td>
+                </tr></tbody></table>
+            </td>
+        </tr>
+        <tr class="hide_news">
+            <td class="title"><a href="{hidden}">숨김 뉴스</a></td>
+            <td class="info">{source}</td>
+            <td class="date"> {news_date.strftime('%Y.%m.%d %H:%M')}</td>
+        </tr>""")
+    head = '<meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+    return f"""<html><head>{head}</head>
+<body><div class="tb_cont">
+<table class="type5" summary="종목뉴스의 제목, 정보제공, 날짜">
+<caption>종목뉴스</caption>
+<thead><tr>
+<th scope="col">제목</th><th scope="col">정보제공</th><th scope="col">날짜</th>
+</tr></thead>
+<tbody>{''.join(body)}
+</tbody></table>
+</div></body></html>"""
@@ -0,0 +1,59 @@
+"""뉴스 100만 개를 딕셔너리와 `NewsItem`으로 들고 있을 때의 항목당 메모리를 비교합니다.
+
+    python -m benchmarks.news_memory --count 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, List
+
+from stock_news_analyzer.news import NewsItem
+
+SOURCES = [
+    "매일경제", "한국경제", "연합뉴스", "머니투데이",
+    "이데일리", "서울경제", "뉴스1", "파이낸셜뉴스",
+]
+
+
+def make_dict(i: int, published: datetime) -> Any:
+    # 기존 파서처럼 페이지마다 새로 만든 문자열을 담습니다.
+    return {
+        "date": published.strftime("%Y.%m.%d %H:%M"),
+        "source": "".join(SOURCES[i % len(SOURCES)]),
+        "title": f"[특징주] 뉴스 제목 {i}",
+        "link": f"https://n.news.naver.com/mnews/article/{i % 300:03d}/{i:010d}",
+    }
+
+
+def make_news_item(i: int, published: datetime) -> Any:
+    return NewsItem(
+        i % 300, i, published, "".join(SOURCES[i % len(SOURCES)]), f"[특징주] 뉴스 제목 {i}")
+
+
+def measure(factory: Callable[[int, datetime], Any], count: int) -> float:
+    start = datetime(2024, 1, 1)
+    gc.collect()
+    tracemalloc.start()
+    items: List[Any] = [factory(i, start + timedelta(minutes=i)) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="뉴스 항목 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=1_000_000, help="만들 뉴스 수")
+    args = parser.parse_args()
+
+    results = {}
+    for name, factory in [("dict", make_dict), ("NewsItem", make_news_item)]:
+        results[name] = measure(factory, args.count)
+        print(f"{name:>8}: {results[name]:,.0f} bytes/item "
+              f"({results[name] * args.count / 2 ** 20:,.0f} MiB / {args.count:,}개)")
+    print(f"{results['dict'] / results['NewsItem']:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
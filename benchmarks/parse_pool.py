@@ -0,0 +1,70 @@
+"""작업자 수에 따른 목록 페이지와 기사 본문 파싱 처리량(pages/s)을 측정합니다.
+
+    python -m benchmarks.parse_pool --workers 0 1 2 4 8
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, List
+
+from stock_news_analyzer.listing import ListingWindow, parse_listing
+from stock_news_analyzer.parsing import PARSE_EXECUTORS, ParsePool, parse_article
+
+from .listing_parser import make_pages
+
+ARTICLE_HTML = """<html><body>
+<div class="media_end_head_title"><h2>제목 {n}</h2></div>
+<div class="newsct_article _article_body"><article>{body}</article></div>
+</body></html>"""
+
+
+def make_articles(count: int) -> List[str]:
+    paragraph = "<p>반도체 업황 회복과 고대역폭 메모리 수요 증가에 대한 기사 본문입니다.</p>"
+    return [ARTICLE_HTML.format(n=n, body=paragraph * 200) for n in range(count)]
+
+
+async def measure(
+    pool: ParsePool, func: Callable[..., Any], inputs: List[Any], concurrency: int,
+) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def parse(args: Any) -> None:
+        async with semaphore:
+            await pool.run(func, *args)
+
+    # 작업자를 미리 띄워 두어 시작 시간을 재지 않습니다.
+    await asyncio.gather(*(parse(args) for args in inputs[:pool.workers]))
+    started = time.perf_counter()
+    await asyncio.gather(*(parse(args) for args in inputs))
+    return len(inputs) / (time.perf_counter() - started)
+
+
+async def run(workers: int, executor: str, num_pages: int, concurrency: int) -> None:
+    window = ListingWindow(datetime.now().date())
+    listings = [(html, window) for html in make_pages(num_pages)]
+    articles = [(html,) for html in make_articles(num_pages)]
+    async with ParsePool(workers, executor) as pool:
+        listing_rate = await measure(pool, parse_listing, listings, concurrency)
+        article_rate = await measure(pool, parse_article, articles, concurrency)
+    print(f"workers={workers:>2} ({executor}): 목록 {listing_rate:,.0f} pages/s, "
+          f"본문 {article_rate:,.0f} pages/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="파싱 작업자 풀 벤치마크")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({0, 1, 2, os.cpu_count() or 1}),
+        help="측정할 작업자 수")
+    parser.add_argument("--executor", choices=PARSE_EXECUTORS, default="process")
+    parser.add_argument("--num-pages", type=int, default=400, help="파싱할 페이지 수")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시에 보낼 파싱 작업 수")
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        asyncio.run(run(workers, args.executor, args.num_pages, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
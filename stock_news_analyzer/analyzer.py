@@ -1,91 +1,681 @@
-from typing import Any, Dict, List
+import asyncio
+import hashlib
+import time
+import zlib
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
-import bs4
-from langchain.chains.summarize import load_summarize_chain
+import aiohttp
+from langchain.chains.summarize import map_reduce_prompt
 from langchain.prompts import PromptTemplate
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_core.language_models.llms import BaseLLM
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableConfig
 
+from stock_news_analyzer.dedup import ContentDeduplicator
+from stock_news_analyzer.finder import fetch
+from stock_news_analyzer.model import get_chunk_token_budget
+from stock_news_analyzer.news import parse_article_link
+from stock_news_analyzer.parsing import ParsePool, parse_article
+from stock_news_analyzer.store import NewsStore
+from stock_news_analyzer.utils.article_index import ArticleIndex
+from stock_news_analyzer.utils.cache import ResponseCache, ResultCache, SummaryCache
+from stock_news_analyzer.utils.company_resolver import resolve_code
+from stock_news_analyzer.utils.http import create_session
 from stock_news_analyzer.utils.logger import get_logger
+from stock_news_analyzer.utils.ratelimit import Throttle
 
 logger = get_logger(__name__)
 
 
-async def fetch_news_content(news_links: List[Dict[str, Any]]) -> List[str]:
-    contents = []
-    for news in news_links:
-        try:
-            loader = WebBaseLoader(
-                web_path=news['link'],
-                bs_kwargs=dict(
-                    parse_only=bs4.SoupStrainer(
-                        "div",
-                        attrs={"class": ["newsct_article _article_body", "media_end_head_title"]},
-                    )
-                ),
-            )
-            docs = loader.load()
-            contents.append(docs[0].page_content)
-        except Exception as e:
-            logger.error(f"뉴스 내용 가져오기 중 오류 발생: {e}")
-    return contents
-
-
-async def summarize_news(news_contents: List[str], llm: BaseLLM) -> str:
-    text_splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=0)
-    split_docs = text_splitter.create_documents(news_contents)
-
-    chain = load_summarize_chain(
-        llm,
-        chain_type="map_reduce",
-        combine_prompt=PromptTemplate(
-            template="""아래와 같이 간결한 요약을 작성해줘:
+async def fetch_article(
+    session: aiohttp.ClientSession,
+    news: Mapping[str, Any],
+    semaphore: asyncio.Semaphore,
+    cache: Optional[ResponseCache] = None,
+    news_store: Optional[NewsStore] = None,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> Optional[str]:
+    if article_index is not None and article_index.seen(news):
+        # 다른 회사의 목록에서 동시에 찾은 기사를 먼저 가져간 경우입니다.
+        logger.debug(f"이미 처리한 기사를 건너뜁니다: {news['link']}")
+        return None
+    if news_store is not None:
+        stored = news_store.get_body(news['link'])
+        if stored:
+            return stored
+    try:
+        async with semaphore:
+            html = await fetch(session, news['link'], cache, throttle)
+        if parse_pool is None:
+            content = parse_article(html)
+        else:
+            content = await parse_pool.run(parse_article, html)
+        if not content.strip():
+            logger.warning(f"뉴스 본문을 찾지 못했습니다: {news['link']}")
+            return None
+        if news_store is not None:
+            news_store.add_body(news, content)
+        return content
+    except Exception as e:
+        logger.error(f"뉴스 내용 가져오기 중 오류 발생: {news['link']} - {e}")
+        return None
+
+
+async def fetch_news_content(
+    news_links: Sequence[Mapping[str, Any]],
+    cache: Optional[ResponseCache] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    concurrency: int = 8,
+    news_store: Optional[NewsStore] = None,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> List[str]:
+    """뉴스 본문을 최대 `concurrency`개씩 동시에 가져옵니다.
+
+    가져오지 못한 기사는 건너뛰며, 나머지 본문은 입력 순서대로 반환합니다.
+    `news_store`가 주어지면 저장된 본문은 다시 가져오지 않고, 새로 가져온 본문은 저장합니다.
+    `throttle`이 주어지면 호스트별 속도 제한과 재시도를 거쳐 요청합니다.
+    `parse_pool`이 주어지면 본문 파싱을 이벤트 루프 밖의 작업자에서 실행합니다.
+    `article_index`가 주어지면 색인에 있는 기사는 가져오지 않습니다. 색인에는 분석이 끝난
+    기사만 기록하므로 여기서는 기록하지 않습니다(`analyze_news` 참고).
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    if session is None:
+        async with create_session(concurrency) as own_session:
+            return await fetch_news_content(
+                news_links, cache, own_session, concurrency, news_store, throttle, parse_pool,
+                article_index)
+
+    if article_index is not None:
+        unseen = [news for news in news_links if not article_index.seen(news)]
+        if len(unseen) < len(news_links):
+            logger.info(f"이전에 처리한 뉴스 {len(news_links) - len(unseen)}개를 건너뜁니다.")
+        news_links = unseen
+
+    contents = await asyncio.gather(*(
+        fetch_article(
+            session, news, semaphore, cache, news_store, throttle, parse_pool, article_index)
+        for news in news_links
+    ))
+    fetched = [content for content in contents if content is not None]
+    if len(fetched) < len(contents):
+        logger.warning(f"뉴스 {len(contents)}개 중 {len(contents) - len(fetched)}개의 본문을 "
+                       "가져오지 못했습니다.")
+    return fetched
+
+
+MAP_PROMPT = map_reduce_prompt.PROMPT
+
+COMBINE_PROMPT = PromptTemplate(
+    template="""아래와 같이 간결한 요약을 작성해줘:
 
 
                 "{text}"
 
 
                 간결한 요약:""",
-            input_variables=["text"]
+    input_variables=["text"]
+)
+
+SENTIMENT_PROMPT = PromptTemplate(
+    input_variables=["company", "summary"],
+    template="다음은 {company}에 관한 여러 뉴스의 종합 요약입니다:\n\n{summary}\n\n"
+             "이 요약을 바탕으로 {company}에 대한 전반적인 뉴스 논조가 긍정적인지, 부정적인지, "
+             "중립적인지 판단하고, 그 이유를 간단히 설명해주세요. 또한, 가장 중요해 보이는 "
+             "3가지 핵심 포인트를 추출하여 나열해주세요."
+)
+
+# 요약들을 합칠 때 한 번의 호출에 넣을 최대 토큰 수
+REDUCE_TOKEN_MAX = 3000
+
+SUMMARY_SEPARATOR = "\n\n"
+
+SENTIMENT_FAILURE = "감정 분석 실패"
+
+# 본문 해시가 이 값으로 나누어떨어지는 기사 뒤에서 조각을 끊습니다(평균 4개 기사마다).
+PACK_BOUNDARY_EVERY = 4
+
+
+class SummaryStats:
+    """요약 전략과 LLM 호출 수를 기록합니다.
+
+    - stuff: 전체 본문이 조각 하나의 예산 안에 들어가 한 번에 요약
+    - map_reduce: 조각별로 요약한 뒤 한 번에 병합
+    - tree_reduce: 조각 요약이 병합 한도를 넘어 여러 단계에 걸쳐 병렬로 병합
+    """
+
+    def __init__(self) -> None:
+        self.strategy = ""
+        self.llm_calls = 0
+        self.cached_calls = 0
+        self.levels = 0
+        self.started_at = time.perf_counter()
+
+    def report(self) -> str:
+        elapsed = time.perf_counter() - self.started_at
+        levels = f", 병합 단계 {self.levels}개" if self.levels else ""
+        return (f"요약 전략: {self.strategy}, LLM 호출 {self.llm_calls}회"
+                f"(캐시 {self.cached_calls}회{levels}), {elapsed:.1f}초")
+
+
+def prompt_version(prompt: PromptTemplate) -> str:
+    """프롬프트 내용으로 만든 버전. 프롬프트가 바뀌면 캐시된 요약을 다시 쓰지 않습니다."""
+    return hashlib.sha256(prompt.template.encode("utf-8")).hexdigest()[:12]
+
+
+def model_name(llm: BaseChatModel) -> str:
+    return str(getattr(llm, "model_name", None) or llm._llm_type)
+
+
+async def summarize_texts(
+    prompt: PromptTemplate,
+    texts: List[str],
+    llm: BaseChatModel,
+    max_concurrency: int = 4,
+    summary_cache: Optional[SummaryCache] = None,
+    stats: Optional[SummaryStats] = None,
+) -> List[str]:
+    """각 텍스트를 `prompt`로 요약합니다. 캐시에 있는 요약은 LLM을 호출하지 않습니다."""
+    model, version = model_name(llm), prompt_version(prompt)
+    summaries: List[Optional[str]] = [
+        summary_cache.get_summary(text, model, version) if summary_cache is not None else None
+        for text in texts
+    ]
+    missing = [index for index, summary in enumerate(summaries) if summary is None]
+    if missing:
+        chain = prompt | llm | StrOutputParser()
+        results = await chain.abatch(
+            [{"text": texts[index]} for index in missing],
+            config=RunnableConfig(max_concurrency=max_concurrency),
         )
+        for index, result in zip(missing, results):
+            summaries[index] = result
+            if summary_cache is not None:
+                summary_cache.set_summary(texts[index], model, version, result)
+    logger.debug(f"요약 {len(texts)}개 중 {len(texts) - len(missing)}개를 캐시에서 가져왔습니다.")
+    if stats is not None:
+        stats.llm_calls += len(missing)
+        stats.cached_calls += len(texts) - len(missing)
+    return [summary for summary in summaries if summary is not None]
+
+
+def group_by_tokens(
+    texts: List[str],
+    llm: BaseChatModel,
+    token_max: int,
+) -> List[List[str]]:
+    groups: List[List[str]] = []
+    group_tokens = 0
+    for text in texts:
+        num_tokens = llm.get_num_tokens(text)
+        if groups and group_tokens + num_tokens <= token_max:
+            groups[-1].append(text)
+            group_tokens += num_tokens
+        else:
+            groups.append([text])
+            group_tokens = num_tokens
+    return groups
+
+
+def split_oversized(texts: List[str], llm: BaseChatModel, token_max: int) -> List[str]:
+    """`token_max`보다 긴 텍스트를 `token_max` 이하의 조각으로 나눕니다."""
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=token_max,
+        chunk_overlap=0,
+        length_function=llm.get_num_tokens,
     )
-    summary = chain.invoke(split_docs)
-    return summary
+    pieces: List[str] = []
+    for text in texts:
+        if llm.get_num_tokens(text) > token_max:
+            pieces.extend(splitter.split_text(text))
+        else:
+            pieces.append(text)
+    return pieces
 
 
-def analyze_sentiment(summary: str, company: str, llm: BaseLLM) -> str:
-    sentiment_prompt = PromptTemplate(
-        input_variables=["company", "summary"],
-        template="다음은 {company}에 관한 여러 뉴스의 종합 요약입니다:\n\n{summary}\n\n"
-                 "이 요약을 바탕으로 {company}에 대한 전반적인 뉴스 논조가 긍정적인지, 부정적인지, "
-                 "중립적인지 판단하고, 그 이유를 간단히 설명해주세요. 또한, 가장 중요해 보이는 "
-                 "3가지 핵심 포인트를 추출하여 나열해주세요."
+def truncate_to_budget(texts: List[str], llm: BaseChatModel, token_max: int) -> List[str]:
+    """합친 길이가 대략 `token_max` 안에 들도록 각 텍스트의 앞부분만 남깁니다."""
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=max(1, token_max // max(1, len(texts))),
+        chunk_overlap=0,
+        length_function=llm.get_num_tokens,
     )
+    return [(splitter.split_text(text) or [""])[0] for text in texts]
+
+
+async def reduce_summaries(
+    summaries: List[str],
+    llm: BaseChatModel,
+    max_concurrency: int = 4,
+    token_max: Optional[int] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    stats: Optional[SummaryStats] = None,
+) -> str:
+    """요약들을 하나로 합칩니다.
+
+    합친 요약이 `token_max`를 넘으면 `token_max` 이하의 묶음으로 나누어 병합하는 단계를
+    반복합니다(tree reduce). `token_max`보다 긴 요약은 먼저 나누어 묶으므로 어떤 호출도
+    한도를 넘지 않습니다. 병합해도 전체 길이가 줄지 않으면 각 요약을 잘라 마지막 병합에
+    넣습니다. 각 단계의 병합 호출은 최대 `max_concurrency`개씩 동시에 실행됩니다.
+    """
+    token_max = token_max if token_max is not None else REDUCE_TOKEN_MAX
+    stats = stats if stats is not None else SummaryStats()
+    stats.strategy = "map_reduce"
+
+    merged = False
+    total_tokens = llm.get_num_tokens(SUMMARY_SEPARATOR.join(summaries))
+    while total_tokens > token_max:
+        groups = group_by_tokens(split_oversized(summaries, llm, token_max), llm, token_max)
+        stats.strategy = "tree_reduce"
+        stats.levels += 1
+        summaries = await summarize_texts(
+            COMBINE_PROMPT,
+            [SUMMARY_SEPARATOR.join(group) for group in groups],
+            llm, max_concurrency, summary_cache, stats,
+        )
+        reduced_tokens = llm.get_num_tokens(SUMMARY_SEPARATOR.join(summaries))
+        if reduced_tokens >= total_tokens:
+            logger.warning(f"병합해도 요약이 줄지 않아 {token_max} 토큰에 맞춰 자릅니다.")
+            summaries = truncate_to_budget(summaries, llm, token_max)
+            break
+        total_tokens = reduced_tokens
+        merged = True
+
+    # 마지막 단계가 이미 하나로 병합했다면 같은 요약을 다시 병합하지 않습니다.
+    if merged and len(summaries) == 1:
+        return summaries[0]
+    return (await summarize_texts(
+        COMBINE_PROMPT, [SUMMARY_SEPARATOR.join(summaries)], llm, 1, summary_cache, stats,
+    ))[0]
+
+
+async def stuff_summary(
+    chunks: List[str],
+    llm: BaseChatModel,
+    summary_cache: Optional[SummaryCache] = None,
+    stats: Optional[SummaryStats] = None,
+) -> str:
+    """본문 전체를 한 번의 호출로 요약합니다."""
+    if stats is not None:
+        stats.strategy = "stuff"
+    return (await summarize_texts(
+        COMBINE_PROMPT, [SUMMARY_SEPARATOR.join(chunks)], llm, 1, summary_cache, stats,
+    ))[0]
+
+
+class ChunkPacker:
+    """뉴스 본문을 토큰 예산 크기의 조각으로 묶습니다.
+
+    기사는 들어온 순서대로 통째로 묶이고, 예산보다 긴 기사만 문단/문장 단위로 나뉩니다.
+    본문 해시로 정해지는 경계에서도 조각을 끊으므로, 기간 앞뒤로 기사가 추가되거나 빠져도
+    나머지 조각의 내용이 그대로 유지되어 요약 캐시를 다시 쓸 수 있습니다.
+
+    Args:
+        llm (BaseChatModel): 토큰 수를 셀 모델.
+        token_budget (int): 조각 하나의 최대 토큰 수.
+    """
 
+    def __init__(self, llm: BaseChatModel, token_budget: int) -> None:
+        self.llm = llm
+        self.token_budget = token_budget
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=token_budget,
+            chunk_overlap=0,
+            length_function=llm.get_num_tokens,
+        )
+        self.num_articles = 0
+        self.num_chunks = 0
+        self.num_tokens = 0
+        self._pending: List[str] = []
+        self._pending_tokens = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """지금까지 추가된 본문의 토큰 수."""
+        return self.num_tokens + self._pending_tokens
+
+    def add(self, content: str) -> List[str]:
+        """본문을 추가하고, 완성된 조각들을 반환합니다."""
+        self.num_articles += 1
+        num_tokens = self.llm.get_num_tokens(content)
+        if num_tokens > self.token_budget:
+            chunks = self.flush()
+            for piece in self.splitter.split_text(content):
+                chunks.append(self._emit([piece], self.llm.get_num_tokens(piece)))
+            return chunks
+
+        chunks = []
+        if self._pending and self._pending_tokens + num_tokens > self.token_budget:
+            chunks.extend(self.flush())
+        self._pending.append(content)
+        self._pending_tokens += num_tokens
+        if zlib.crc32(content.encode("utf-8")) % PACK_BOUNDARY_EVERY == 0:
+            chunks.extend(self.flush())
+        return chunks
+
+    def flush(self) -> List[str]:
+        """아직 조각이 되지 않은 본문들을 하나의 조각으로 반환합니다."""
+        if not self._pending:
+            return []
+        chunk = self._emit(self._pending, self._pending_tokens)
+        self._pending, self._pending_tokens = [], 0
+        return [chunk]
+
+    def _emit(self, texts: List[str], num_tokens: int) -> str:
+        self.num_chunks += 1
+        self.num_tokens += num_tokens
+        return SUMMARY_SEPARATOR.join(texts)
+
+    def report(self) -> str:
+        return (f"본문 {self.num_articles}개를 {self.num_chunks}개 조각"
+                f"({self.num_tokens} 토큰, 조각당 최대 {self.token_budget} 토큰)으로 나눴습니다.")
+
+
+def chunk_token_budget(llm: BaseChatModel, chunk_tokens: Optional[int] = None) -> int:
+    return chunk_tokens if chunk_tokens is not None else get_chunk_token_budget(model_name(llm))
+
+
+async def summarize_news(
+    news_contents: List[str],
+    llm: BaseChatModel,
+    max_concurrency: int = 4,
+    summary_cache: Optional[SummaryCache] = None,
+    chunk_tokens: Optional[int] = None,
+) -> str:
+    """뉴스 본문을 요약합니다.
+
+    본문은 모델별 토큰 예산(`chunk_tokens`) 크기의 조각으로 묶습니다. 전체가 예산 안에
+    들어가면 한 번에 요약(stuff)하고, 그렇지 않으면 조각별로 요약한 뒤 병합합니다
+    (map_reduce, 병합할 요약이 많으면 tree_reduce). map 단계와 병합 단계의 LLM 호출은 최대
+    `max_concurrency`개까지 동시에 실행되며, `summary_cache`에 있는 요약은 다시 만들지 않습니다.
+    """
+    stats = SummaryStats()
+    packer = ChunkPacker(llm, chunk_token_budget(llm, chunk_tokens))
+    chunks = [chunk for content in news_contents for chunk in packer.add(content)]
+    chunks.extend(packer.flush())
+    logger.info(packer.report())
+
+    if packer.total_tokens <= packer.token_budget:
+        summary = await stuff_summary(chunks, llm, summary_cache, stats)
+    else:
+        summaries = await summarize_texts(
+            MAP_PROMPT, chunks, llm, max_concurrency, summary_cache, stats)
+        summary = await reduce_summaries(
+            summaries, llm, max_concurrency, summary_cache=summary_cache, stats=stats)
+    logger.info(stats.report())
+    return summary
+
+
+async def analyze_sentiment(summary: str, company: str, llm: BaseChatModel) -> str:
+    sentiment_chain = SENTIMENT_PROMPT | llm | StrOutputParser()
     try:
-        sentiment_analysis = llm.invoke(sentiment_prompt.format(company=company, summary=summary))
-        return sentiment_analysis
+        return await sentiment_chain.ainvoke({"company": company, "summary": summary})
     except Exception as e:
         logger.error(f"감정 분석 중 오류 발생: {e}")
-        return "감정 분석 실패"
+        return SENTIMENT_FAILURE
+
+
+async def _iterate(
+    news_links: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+) -> AsyncIterator[Mapping[str, Any]]:
+    if isinstance(news_links, AsyncIterable):
+        async for news in news_links:
+            yield news
+    else:
+        for news in news_links:
+            yield news
+
+
+async def summarize_news_stream(
+    news_links: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+    llm: BaseChatModel,
+    cache: Optional[ResponseCache] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    fetch_concurrency: int = 8,
+    max_concurrency: int = 4,
+    queue_size: int = 16,
+    summary_cache: Optional[SummaryCache] = None,
+    chunk_tokens: Optional[int] = None,
+    dedup_contents: bool = True,
+    news_store: Optional[NewsStore] = None,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+    fetched: Optional[List[Mapping[str, Any]]] = None,
+) -> Optional[str]:
+    """뉴스 링크를 받는 대로 본문을 가져와 요약합니다.
+
+    링크 수집, 본문 가져오기, 조각 묶기, map 요약이 크기 `queue_size`의 큐로 연결되어
+    동시에 진행되므로 첫 번째 조각의 요약은 나머지 기사를 내려받는 동안 시작됩니다.
+    큐가 가득 차면 앞 단계가 기다리므로 메모리 사용량은 일정하게 유지됩니다.
+    조각은 도착 순서와 관계없이 기사 순서대로 묶입니다.
+
+    `dedup_contents`가 설정되면 앞서 가져온 본문과 거의 같은 본문(SimHash)은 요약하지 않습니다.
+    본문 전체가 조각 하나의 예산을 넘기 전까지는 조각을 map 단계로 보내지 않고 모아 두며,
+    끝까지 넘지 않으면 한 번에 요약(stuff)합니다. 요약 전략은 `summarize_news`와 같습니다.
+    `news_store`, `throttle`, `parse_pool`, `article_index`는 `fetch_news_content`와 같이
+    씁니다. `fetched`가 주어지면 본문을 얻은 뉴스를 기사 순서와 관계없이 추가합니다.
+
+    Returns:
+        str | None: 요약. 가져온 본문이 없으면 None.
+    """
+    if session is None:
+        async with create_session(fetch_concurrency) as own_session:
+            return await summarize_news_stream(
+                news_links, llm, cache, own_session, fetch_concurrency,
+                max_concurrency, queue_size, summary_cache, chunk_tokens, dedup_contents,
+                news_store, throttle, parse_pool, article_index, fetched)
+
+    stats = SummaryStats()
+    packer = ChunkPacker(llm, chunk_token_budget(llm, chunk_tokens))
+    deduplicator = ContentDeduplicator() if dedup_contents else None
+    semaphore = asyncio.Semaphore(max(1, fetch_concurrency))
+    link_queue: asyncio.Queue[Optional[tuple[int, Mapping[str, Any]]]] = asyncio.Queue(queue_size)
+    content_queue: asyncio.Queue[Optional[tuple[int, Optional[str]]]] = asyncio.Queue(queue_size)
+    chunk_queue: asyncio.Queue[Optional[tuple[int, str]]] = asyncio.Queue(queue_size)
+    held_chunks: List[str] = []
+    summaries: Dict[int, str] = {}
+
+    async def produce_links() -> None:
+        index = 0
+        async for news in _iterate(news_links):
+            await link_queue.put((index, news))
+            index += 1
+        for _ in range(fetch_concurrency):
+            await link_queue.put(None)
+
+    async def fetch_contents() -> None:
+        while (entry := await link_queue.get()) is not None:
+            index, news = entry
+            # 가져오지 못한 기사도 None으로 알려야 다음 기사를 묶을 수 있습니다.
+            content = await fetch_article(
+                session, news, semaphore, cache, news_store, throttle, parse_pool,
+                article_index)
+            if content is not None and fetched is not None:
+                fetched.append(news)
+            await content_queue.put((index, content))
+
+    async def pack_contents() -> None:
+        pending: Dict[int, Optional[str]] = {}
+        next_index = 0
+        sequence = 0
+
+        async def put_chunks(chunks: List[str]) -> None:
+            nonlocal sequence
+            held_chunks.extend(chunks)
+            if packer.total_tokens <= packer.token_budget:
+                return
+            for chunk in held_chunks:
+                await chunk_queue.put((sequence, chunk))
+                sequence += 1
+            held_chunks.clear()
+
+        while (entry := await content_queue.get()) is not None:
+            pending[entry[0]] = entry[1]
+            while next_index in pending:
+                content = pending.pop(next_index)
+                next_index += 1
+                if content is None:
+                    continue
+                if deduplicator is not None and deduplicator.is_duplicate(content):
+                    continue
+                await put_chunks(packer.add(content))
+        await put_chunks(packer.flush())
+        for _ in range(max_concurrency):
+            await chunk_queue.put(None)
+
+    async def map_chunks() -> None:
+        while (entry := await chunk_queue.get()) is not None:
+            sequence, chunk = entry
+            summaries[sequence] = (
+                await summarize_texts(MAP_PROMPT, [chunk], llm, 1, summary_cache, stats)
+            )[0]
+
+    async def fetch_then_close() -> None:
+        async with asyncio.TaskGroup() as fetch_group:
+            fetch_group.create_task(produce_links())
+            for _ in range(fetch_concurrency):
+                fetch_group.create_task(fetch_contents())
+        await content_queue.put(None)
+
+    async with asyncio.TaskGroup() as group:
+        group.create_task(fetch_then_close())
+        group.create_task(pack_contents())
+        for _ in range(max_concurrency):
+            group.create_task(map_chunks())
+
+    if deduplicator is not None and deduplicator.duplicates:
+        logger.info(f"본문이 중복된 뉴스 {deduplicator.duplicates}개를 제외했습니다.")
+    logger.info(packer.report())
+    if held_chunks:
+        summary = await stuff_summary(held_chunks, llm, summary_cache, stats)
+    elif summaries:
+        summary = await reduce_summaries(
+            [summaries[sequence] for sequence in sorted(summaries)],
+            llm, max_concurrency, summary_cache=summary_cache, stats=stats,
+        )
+    else:
+        return None
+    logger.info(stats.report())
+    return summary
+
+
+def article_ids(news_links: Sequence[Mapping[str, Any]]) -> List[str]:
+    ids = []
+    for news in news_links:
+        office_id, article_id = parse_article_link(news['link'])
+        ids.append(f"{office_id}/{article_id}" if office_id else news['link'])
+    return ids
+
+
+def result_key(
+    news_links: Sequence[Mapping[str, Any]],
+    company: str,
+    llm: BaseChatModel,
+    chunk_tokens: Optional[int] = None,
+    dedup_contents: bool = True,
+) -> str:
+    """분석 결과 캐시의 키. 회사 이름과 코드는 같은 회사 코드로 바꿔 같은 키가 됩니다."""
+    return ResultCache.key_for(
+        resolve_code(company) or company,
+        article_ids(news_links),
+        model_name(llm),
+        [prompt_version(prompt) for prompt in (MAP_PROMPT, COMBINE_PROMPT, SENTIMENT_PROMPT)],
+        {
+            "chunk_tokens": chunk_token_budget(llm, chunk_tokens),
+            "dedup_contents": dedup_contents,
+        },
+    )
 
 
 async def analyze_news(
-    news_links: List[Dict[str, Any]],
+    news_links: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
     company: str,
-    llm: BaseLLM
-) -> Dict[str, Any]:
-    logger.info("뉴스 내용 가져오기 시작...")
-    news_contents = await fetch_news_content(news_links)
+    llm: BaseChatModel,
+    cache: Optional[ResponseCache] = None,
+    max_concurrency: int = 4,
+    fetch_concurrency: int = 8,
+    summary_cache: Optional[SummaryCache] = None,
+    result_cache: Optional[ResultCache] = None,
+    chunk_tokens: Optional[int] = None,
+    dedup_contents: bool = True,
+    session: Optional[aiohttp.ClientSession] = None,
+    news_store: Optional[NewsStore] = None,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> Optional[Dict[str, Any]]:
+    """뉴스를 가져와 요약하고 감정을 분석합니다.
 
-    logger.info("뉴스 요약 시작...")
-    summary = await summarize_news(news_contents, llm)
+    `news_links`에는 리스트뿐 아니라 `finder.iter_news_links`와 같은 비동기 제너레이터도
+    넘길 수 있으며, 이 경우 링크를 찾는 대로 본문 가져오기와 요약이 시작됩니다.
+    `result_cache`가 주어지면 기사 목록 전체로 캐시를 확인해야 하므로 링크를 먼저 모두
+    모은 뒤, 같은 회사/기사/모델/프롬프트의 결과가 있으면 그대로 반환합니다.
+    `session`이 주어지면 기사 본문을 그 세션으로 가져오므로 여러 회사를 분석할 때
+    연결 풀을 함께 쓸 수 있습니다. `news_store`가 주어지면 저장된 본문을 먼저 사용합니다.
+    `article_index`가 주어지면 색인에 있는 기사는 건너뛰고, 요약과 감정 분석이 모두 끝난
+    뒤에 본문을 얻은 기사만 색인에 기록합니다. 분석이 실패한 기사는 다음 실행에서 다시
+    분석합니다. 분석할 뉴스 본문이 없으면 None을 반환합니다.
+    """
+    key = None
+    if result_cache is not None:
+        news_links = [news async for news in _iterate(news_links)]
+        if not news_links:
+            return None
+        key = result_key(news_links, company, llm, chunk_tokens, dedup_contents)
+        cached = result_cache.get_result(key)
+        if cached is not None:
+            logger.info("캐시된 분석 결과를 사용합니다.")
+            if article_index is not None:
+                for news in news_links:
+                    article_index.add(news)
+            return cached
+
+    fetched: List[Mapping[str, Any]] = []
+    logger.info("뉴스 내용 가져오기 및 요약 시작...")
+    summary = await summarize_news_stream(
+        news_links, llm, cache, session,
+        fetch_concurrency=fetch_concurrency,
+        max_concurrency=max_concurrency,
+        summary_cache=summary_cache,
+        chunk_tokens=chunk_tokens,
+        dedup_contents=dedup_contents,
+        news_store=news_store,
+        throttle=throttle,
+        parse_pool=parse_pool,
+        article_index=article_index,
+        fetched=fetched,
+    )
+    if summary is None:
+        return None
 
     logger.info("감정 분석 시작...")
-    sentiment_analysis = analyze_sentiment(summary, company, llm)
+    sentiment_analysis = await analyze_sentiment(summary, company, llm)
 
-    return {
+    analysis_result = {
         "summary": summary,
         "sentiment_analysis": sentiment_analysis
     }
+    if sentiment_analysis == SENTIMENT_FAILURE:
+        return analysis_result
+    if result_cache is not None and key is not None:
+        result_cache.set_result(key, analysis_result)
+    if article_index is not None:
+        for news in fetched:
+            article_index.add(news)
+    return analysis_result
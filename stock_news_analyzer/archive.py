@@ -0,0 +1,165 @@
+"""Partitioned Parquet archive of crawled news for backtests.
+
+`pyarrow`가 필요합니다: `pip install "stock_news_analyzer[archive]"`
+"""
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Parquet 아카이브에는 pyarrow가 필요합니다: "
+        "pip install \"stock_news_analyzer[archive]\""
+    ) from e
+
+from stock_news_analyzer.news import parse_article_link
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["ARCHIVE_SCHEMA", "read_archive", "write_archive"]
+
+logger = get_logger(__name__)
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("company_code", pa.string()),
+    ("date", pa.date32()),
+    ("datetime", pa.timestamp("s")),
+    ("office_id", pa.string()),
+    ("article_id", pa.string()),
+    ("source", pa.string()),
+    ("title", pa.string()),
+    ("link", pa.string()),
+    ("body", pa.string()),
+    ("summary", pa.string()),
+    ("sentiment", pa.string()),
+    ("archived_at", pa.timestamp("us")),
+])
+
+# 같은 기사는 이 열이 같은 행이며, 읽을 때 가장 최근에 저장한 행만 남깁니다.
+KEY_COLUMNS = ["company_code", "office_id", "article_id"]
+
+# 하루 단위로 나누면 회사마다 작은 파일이 너무 많아지므로 월 단위로 나눕니다.
+# 행마다 있는 `date` 열의 통계로 월 안의 날짜 범위도 걸러낼 수 있습니다.
+PARTITIONING = ds.partitioning(
+    pa.schema([("month", pa.string()), ("company_code", pa.string())]), flavor="hive")
+
+
+def to_record(
+    company_code: str,
+    news: Mapping[str, Any],
+    archived_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    published = datetime.strptime(news["date"], "%Y.%m.%d %H:%M")
+    office_id, article_id = parse_article_link(news["link"])
+    return {
+        "company_code": company_code,
+        "date": published.date(),
+        "datetime": published,
+        "office_id": office_id,
+        "article_id": article_id,
+        "source": news.get("source"),
+        "title": news["title"],
+        "link": news["link"],
+        "body": news.get("body"),
+        "summary": news.get("summary"),
+        "sentiment": news.get("sentiment"),
+        "archived_at": archived_at or datetime.now(),
+    }
+
+
+def write_archive(
+    base_dir: Union[str, Path],
+    company_code: str,
+    news_items: Iterable[Mapping[str, Any]],
+) -> int:
+    """뉴스를 `month=YYYY-MM/company_code=...` 구조의 Parquet 데이터셋에 추가합니다.
+
+    실행마다 새 파일을 쓰므로 이전 실행의 파일은 그대로 남습니다. 겹치는 기간을 다시
+    저장하면 같은 기사의 행이 여러 개가 되며, `read_archive`는 그중 마지막 행만 읽습니다.
+
+    Args:
+        base_dir (str | Path): 데이터셋 디렉토리.
+        company_code (str): 회사 코드.
+        news_items (Iterable[dict[str, str]]): `finder.get_news_link`가 반환한 형태의 뉴스.
+            'body', 'summary', 'sentiment'가 있으면 함께 저장합니다.
+    Returns:
+        int: 저장한 뉴스 수.
+    """
+    archived_at = datetime.now()
+    records = [to_record(company_code, news, archived_at) for news in news_items]
+    if not records:
+        return 0
+
+    table = pa.Table.from_pylist(records, schema=ARCHIVE_SCHEMA)
+    month = pa.array([record["date"].strftime("%Y-%m") for record in records], pa.string())
+    table = table.append_column("month", month)
+    ds.write_dataset(
+        table,
+        base_dir,
+        format="parquet",
+        partitioning=PARTITIONING,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    logger.debug(f"[{company_code}] 뉴스 {len(records)}개를 아카이브에 저장했습니다: {base_dir}")
+    return len(records)
+
+
+def read_archive(
+    base_dir: Union[str, Path],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    company_codes: Optional[Sequence[str]] = None,
+    columns: Optional[List[str]] = None,
+) -> "pa.Table":
+    """아카이브에서 기간과 회사로 걸러낸 뉴스를 읽습니다.
+
+    조건은 파티션(월, 회사 코드)과 Parquet 행 그룹 통계(날짜)에 적용되므로 범위 밖의 파일은
+    읽지 않으며, `columns`에 있는 열만 읽습니다. 여러 번 저장된 기사는 (회사 코드,
+    office_id, article_id)마다 가장 최근에 저장한 행만 반환합니다.
+
+    Args:
+        base_dir (str | Path): 데이터셋 디렉토리.
+        start_date (date | None, optional): 시작 날짜.
+        end_date (date | None, optional): 종료 날짜.
+        company_codes (Sequence[str] | None, optional): 회사 코드 목록. 없으면 모든 회사.
+        columns (list[str] | None, optional): 읽을 열. 없으면 `ARCHIVE_SCHEMA`의 모든 열.
+    Returns:
+        pyarrow.Table: 뉴스 테이블.
+    """
+    dataset = ds.dataset(base_dir, format="parquet", partitioning=PARTITIONING)
+
+    conditions = []
+    if start_date is not None:
+        conditions.append(ds.field("month") >= start_date.strftime("%Y-%m"))
+        conditions.append(ds.field("date") >= pa.scalar(start_date, pa.date32()))
+    if end_date is not None:
+        conditions.append(ds.field("month") <= end_date.strftime("%Y-%m"))
+        conditions.append(ds.field("date") <= pa.scalar(end_date, pa.date32()))
+    if company_codes is not None:
+        conditions.append(ds.field("company_code").isin(list(company_codes)))
+
+    predicate = None
+    for condition in conditions:
+        predicate = condition if predicate is None else predicate & condition
+
+    columns = columns or ARCHIVE_SCHEMA.names
+    scanned = [*KEY_COLUMNS, "archived_at"]
+    scanned += [column for column in columns if column not in scanned]
+    table = latest_rows(dataset.to_table(columns=scanned, filter=predicate))
+    return table.select(columns)
+
+
+def latest_rows(table: "pa.Table") -> "pa.Table":
+    """`KEY_COLUMNS`가 같은 행 중 `archived_at`이 가장 늦은 행만 남깁니다."""
+    if table.num_rows == 0:
+        return table
+    table = table.sort_by([("archived_at", "descending")])
+    table = table.append_column("_row", pa.array(range(table.num_rows), pa.int64()))
+    first_rows = table.group_by(KEY_COLUMNS).aggregate([("_row", "min")])["_row_min"]
+    first_rows = first_rows.take(pc.sort_indices(first_rows))
+    return table.take(first_rows).drop_columns(["_row"])
@@ -0,0 +1,364 @@
+"""Resumable listing backfill for the COMPANY_CODE universe."""
+import argparse
+import asyncio
+import sqlite3
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import aiohttp
+
+from stock_news_analyzer.finder import fetch, inspect_date_format, listing_url
+from stock_news_analyzer.listing import ListingWindow, parse_listing
+from stock_news_analyzer.news import NewsItem
+from stock_news_analyzer.parsing import PARSE_EXECUTORS, ParsePool
+from stock_news_analyzer.store import NewsStore
+from stock_news_analyzer.utils.cache import DEFAULT_CACHE_DIR
+from stock_news_analyzer.utils.company_code import COMPANY_CODE
+from stock_news_analyzer.utils.company_resolver import resolve_code
+from stock_news_analyzer.utils.http import create_session
+from stock_news_analyzer.utils.logger import get_logger
+from stock_news_analyzer.utils.ratelimit import CircuitOpenError, Throttle
+from stock_news_analyzer.utils.watchlist import read_watchlist
+
+logger = get_logger(__name__)
+
+
+class BackfillCheckpoint:
+    """회사별 백필 진행 상황을 SQLite 파일에 저장합니다.
+
+    페이지 하나를 저장할 때마다 다음에 가져올 페이지를 기록하므로, 중단된 뒤 다시 실행하면
+    끝난 회사는 건너뛰고 나머지 회사는 멈춘 페이지부터 이어서 가져옵니다.
+
+    Args:
+        path (str | Path): 저장 파일 경로.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS progress ("
+                " code TEXT PRIMARY KEY,"
+                " next_page INTEGER NOT NULL,"
+                " last_link TEXT,"
+                " items INTEGER NOT NULL,"
+                " reached TEXT,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    def get(self, code: str) -> Tuple[int, Optional[str], Optional[date]]:
+        """(다음 페이지, 마지막으로 저장한 페이지의 첫 링크, 끝까지 가져온 날짜)."""
+        row = self._conn.execute(
+            "SELECT next_page, last_link, reached FROM progress WHERE code = ?", (code,)
+        ).fetchone()
+        if row is None:
+            return 1, None, None
+        reached = datetime.strptime(row[2], "%Y.%m.%d").date() if row[2] else None
+        return row[0], row[1], reached
+
+    def advance(
+        self,
+        code: str,
+        next_page: int,
+        last_link: Optional[str],
+        items: int,
+        reached: Optional[date] = None,
+    ) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO progress (code, next_page, last_link, items, reached, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (code) DO UPDATE SET"
+                " next_page = excluded.next_page, last_link = excluded.last_link,"
+                " items = progress.items + excluded.items,"
+                " reached = COALESCE(excluded.reached, progress.reached),"
+                " updated_at = excluded.updated_at",
+                (code, next_page, last_link, items,
+                 reached.strftime("%Y.%m.%d") if reached else None, time.time()),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class BackfillProgress:
+    """백필 처리량을 기록합니다."""
+
+    def __init__(self, total_companies: int) -> None:
+        self.total_companies = total_companies
+        self.finished_companies = 0
+        self.failed_companies = 0
+        self.pages = 0
+        self.items = 0
+        self.started_at = time.perf_counter()
+
+    def report(self) -> str:
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        return (f"회사 {self.finished_companies}/{self.total_companies}개 완료"
+                f"(실패 {self.failed_companies}개), "
+                f"페이지 {self.pages}개 ({self.pages / elapsed:.1f}/s), "
+                f"뉴스 {self.items}개 ({self.items / elapsed:.1f}/s), {elapsed:.1f}초")
+
+
+async def backfill_company(
+    session: aiohttp.ClientSession,
+    code: str,
+    until: date,
+    news_store: NewsStore,
+    checkpoint: BackfillCheckpoint,
+    throttle: Throttle,
+    progress: BackfillProgress,
+    max_pages: Optional[int] = None,
+    parse_pool: Optional[ParsePool] = None,
+) -> None:
+    """회사 하나의 목록 페이지를 `until`까지 거슬러 올라가며 저장합니다."""
+    page, last_link, reached = checkpoint.get(code)
+    if reached is not None and reached <= until:
+        logger.debug(f"[{code}] 이미 {reached}까지 가져왔습니다.")
+        return
+
+    window = ListingWindow(datetime.now().date(), start_date=until)
+
+    async def read_page(page: int) -> Tuple[List[NewsItem], bool]:
+        html = await fetch(session, listing_url(code, page), None, throttle)
+        if parse_pool is None:
+            return parse_listing(html, window)
+        return await parse_pool.run(parse_listing, html, window)
+
+    # 이번 실행에서 바로 앞에 가져온 페이지의 링크
+    previous_links: Optional[List[str]] = None
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        news_items, reached_start = await read_page(page)
+        pages += 1
+        progress.pages += 1
+
+        links = [news["link"] for news in news_items]
+        first_link = links[0] if links else None
+        if not reached_start and (first_link is None or first_link == last_link):
+            # 마지막 페이지를 넘으면 네이버는 마지막 페이지를 다시 보여줍니다. 다만 목록은
+            # 최신순이라 이전 실행 뒤에 한 페이지만큼 새 뉴스가 올라오면 페이지가 밀려 첫
+            # 링크가 같아질 수 있으므로, 앞 페이지 전체가 같은지 확인합니다.
+            if previous_links is None and first_link is not None and page > 1:
+                previous_items, _ = await read_page(page - 1)
+                progress.pages += 1
+                previous_links = [news["link"] for news in previous_items]
+            if first_link is None or links == previous_links:
+                checkpoint.advance(code, page, last_link, 0, until)
+                return
+            logger.debug(f"[{code}] 목록이 밀려 {page} 페이지부터 이어서 가져옵니다.")
+
+        news_store.add_news(code, news_items)
+        # 저장소에 먼저 쓴 뒤 진행 상황을 기록하므로, 그 사이에 중단되어도 이 페이지를
+        # 다시 가져올 뿐 뉴스를 잃지 않습니다.
+        news_store.flush()
+        progress.items += len(news_items)
+        if reached_start:
+            # 이 페이지에는 `until` 이전 뉴스도 있으므로, 더 이전까지 가져올 때 다시 봅니다.
+            checkpoint.advance(code, page, last_link, len(news_items), until)
+            return
+        page += 1
+        last_link = first_link
+        previous_links = links
+        checkpoint.advance(code, page, last_link, len(news_items))
+
+
+async def backfill(
+    codes: List[str],
+    until: date,
+    news_store: NewsStore,
+    checkpoint: BackfillCheckpoint,
+    concurrency: int = 4,
+    rate: float = 5.0,
+    max_pages: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    report_interval: float = 10.0,
+    parse_pool: Optional[ParsePool] = None,
+) -> BackfillProgress:
+    """여러 회사의 목록 페이지를 `until`까지 가져와 `news_store`에 저장합니다.
+
+    Args:
+        codes (list[str]): 회사 코드 목록.
+        until (date): 이 날짜까지 거슬러 올라가며 가져옵니다.
+        news_store (NewsStore): 뉴스를 저장할 저장소.
+        checkpoint (BackfillCheckpoint): 회사별 진행 상황.
+        concurrency (int, optional): 동시에 가져올 최대 회사 수.
+        rate (float, optional): 초당 최대 목록 페이지 요청 수. 0이면 제한하지 않습니다.
+            동시 요청 수는 응답 시간과 오류에 따라 `concurrency`까지 조절됩니다.
+        max_pages (int | None, optional): 이번 실행에서 회사마다 가져올 최대 페이지 수.
+        session (aiohttp.ClientSession | None, optional): 함께 쓸 HTTP 세션.
+        report_interval (float, optional): 진행 상황을 기록할 간격(초).
+        parse_pool (ParsePool | None, optional): 목록 페이지를 파싱할 작업자 풀.
+    Returns:
+        BackfillProgress: 처리량 기록.
+    """
+    if session is None:
+        async with create_session(max(1, concurrency)) as own_session:
+            return await backfill(
+                codes, until, news_store, checkpoint, concurrency, rate, max_pages,
+                own_session, report_interval, parse_pool)
+
+    progress = BackfillProgress(len(codes))
+    throttle = Throttle(
+        rate=rate, initial_concurrency=max(1, concurrency), max_concurrency=max(1, concurrency))
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for code in codes:
+        queue.put_nowait(code)
+
+    async def worker() -> None:
+        while not queue.empty():
+            code = queue.get_nowait()
+            try:
+                await backfill_company(
+                    session, code, until, news_store, checkpoint, throttle, progress, max_pages,
+                    parse_pool)
+                progress.finished_companies += 1
+            except CircuitOpenError as e:
+                # 호스트가 응답하지 않는 동안 남은 회사를 모두 실패로 넘기지 않도록 기다립니다.
+                progress.failed_companies += 1
+                logger.warning(f"[{code}] {e}")
+                await asyncio.sleep(throttle.reset_timeout)
+            except Exception as e:
+                # 진행 상황은 페이지마다 기록되어 있으므로 다음 실행에서 이어서 가져옵니다.
+                progress.failed_companies += 1
+                logger.warning(f"[{code}] 백필 중 오류 발생: {e}")
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(report_interval)
+            logger.info(progress.report())
+
+    reporter = asyncio.create_task(report())
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    finally:
+        reporter.cancel()
+    logger.info(progress.report())
+    return progress
+
+
+def resolve_codes(companies: List[str]) -> List[str]:
+    """회사 이름이나 코드를 코드로 바꿉니다. 주어지지 않으면 모든 회사의 코드."""
+    if not companies:
+        return sorted(set(COMPANY_CODE.values()))
+    codes = []
+    for company in companies:
+        code = company if company.isdigit() else resolve_code(company)
+        if code is None:
+            logger.warning(f"알 수 없는 회사입니다: {company}")
+        elif code not in codes:
+            codes.append(code)
+    return codes
+
+
+def get_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="전체 종목 뉴스 목록 백필")
+    parser.add_argument(
+        "-u", "--until",
+        help="이 날짜까지 거슬러 올라가며 가져옴 (YYYY.MM.DD 형식)",
+        required=True
+    )
+    parser.add_argument(
+        "-c", "--company",
+        help="가져올 회사 코드 또는 이름 (여러 번 지정 가능, 기본값: 모든 회사)",
+        action="append",
+        default=[]
+    )
+    parser.add_argument(
+        "--watchlist",
+        help="가져올 회사 코드 또는 이름을 한 줄에 하나씩 적은 파일"
+    )
+    parser.add_argument(
+        "--concurrency",
+        help="동시에 가져올 최대 회사 수",
+        type=int,
+        default=4
+    )
+    parser.add_argument(
+        "--rate",
+        help="초당 최대 목록 페이지 요청 수 (0이면 제한하지 않음)",
+        type=float,
+        default=5.0
+    )
+    parser.add_argument(
+        "--max-pages",
+        help="이번 실행에서 회사마다 가져올 최대 페이지 수",
+        type=int,
+        default=None
+    )
+    parser.add_argument(
+        "--parse-workers",
+        help="목록 페이지를 파싱할 작업자 수 (0이면 이벤트 루프에서 파싱)",
+        type=int,
+        default=0
+    )
+    parser.add_argument(
+        "--parse-executor",
+        help="파싱 작업자 종류",
+        choices=PARSE_EXECUTORS,
+        default="process"
+    )
+    parser.add_argument(
+        "--store",
+        help="뉴스를 저장할 SQLite 파일",
+        default=str(DEFAULT_CACHE_DIR / "news.sqlite3")
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="진행 상황을 저장할 SQLite 파일",
+        default=str(DEFAULT_CACHE_DIR / "backfill.sqlite3")
+    )
+    parser.add_argument(
+        "--report-interval",
+        help="진행 상황을 기록할 간격(초)",
+        type=float,
+        default=10.0
+    )
+    parser.add_argument(
+        "--log-level",
+        help="로깅 레벨",
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        default='INFO'
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = get_arguments()
+    get_logger(__name__, args.log_level)
+    if not inspect_date_format(args.until):
+        return
+
+    companies = list(args.company)
+    if args.watchlist:
+        companies += read_watchlist(args.watchlist)
+    codes = resolve_codes(companies)
+    until = datetime.strptime(args.until, "%Y.%m.%d").date()
+    logger.info(f"백필 시작: 회사 {len(codes)}개, {until}까지")
+
+    news_store = NewsStore(args.store)
+    checkpoint = BackfillCheckpoint(args.checkpoint)
+    parse_pool = ParsePool(args.parse_workers, args.parse_executor)
+    try:
+        asyncio.run(backfill(
+            codes, until, news_store, checkpoint,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            max_pages=args.max_pages,
+            report_interval=args.report_interval,
+            parse_pool=parse_pool,
+        ))
+    except KeyboardInterrupt:
+        logger.info("중단되었습니다. 다시 실행하면 이어서 가져옵니다.")
+    finally:
+        parse_pool.close()
+        news_store.close()
+        checkpoint.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,65 @@
 import argparse
 import asyncio
+import json
+import sys
 from datetime import datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
+import aiohttp
 from dotenv import load_dotenv
 
-from stock_news_analyzer.analyzer import analyze_news
-from stock_news_analyzer.finder import get_news_list
+from stock_news_analyzer.dedup import iter_filter_similar_news
+from stock_news_analyzer.finder import inspect_date_format, iter_news_list
 from stock_news_analyzer.model import get_available_models, load_llm
+from stock_news_analyzer.parsing import PARSE_EXECUTORS, ParsePool
+from stock_news_analyzer.store import NewsStore
+from stock_news_analyzer.utils.article_index import ArticleIndex
+from stock_news_analyzer.utils.cache import (
+    DEFAULT_CACHE_DIR,
+    ResponseCache,
+    ResultCache,
+    SummaryCache,
+)
+from stock_news_analyzer.utils.company_resolver import resolve_code
+from stock_news_analyzer.utils.http import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    create_session,
+)
 from stock_news_analyzer.utils.logger import get_logger
+from stock_news_analyzer.utils.ratelimit import Throttle
+from stock_news_analyzer.utils.watchlist import read_watchlist
+from stock_news_analyzer.utils.watermark import WatermarkStore
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
 logger = get_logger(__name__)
 
 
 def get_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="주식 뉴스 분석기")
-    parser.add_argument("-c", "--company", required=True, help="회사 코드 또는 이름")
+    parser.add_argument(
+        "-c", "--company",
+        help="회사 코드 또는 이름 (여러 번 지정 가능)",
+        action="append",
+        default=[]
+    )
+    parser.add_argument(
+        "--watchlist",
+        help="분석할 회사 코드 또는 이름을 한 줄에 하나씩 적은 파일"
+    )
     parser.add_argument(
         "-f", "--date_from",
         help="시작 날짜 (YYYY.MM.DD 형식)",
@@ -37,13 +82,159 @@ def get_arguments() -> argparse.Namespace:
         type=int,
         default=5
     )
+    parser.add_argument(
+        "--links-only",
+        help="LLM 분석 없이 찾은 뉴스를 JSON Lines로 출력",
+        action="store_true"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="--links-only 결과를 저장할 파일 (기본값: 표준 출력)",
+        default="-"
+    )
+    parser.add_argument(
+        "--incremental",
+        help="회사별로 이미 본 뉴스를 기록해 두고 새 뉴스만 가져옴",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--with-history",
+        help="--incremental에서 새 뉴스 뒤에 기록된 기간 내 뉴스도 함께 사용",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--skip-seen",
+        help="처리한 기사를 <cache-dir>/articles.sqlite3에 기록해 다음 실행부터 다시 처리하지 않음",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--store",
+        help="찾은 뉴스와 본문을 검색 가능한 SQLite 저장소(<cache-dir>/news.sqlite3)에 저장",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--archive",
+        help="찾은 뉴스와 분석 결과를 추가할 Parquet 데이터셋 디렉토리 (pyarrow 필요)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        help="동시에 요청할 최대 목록 페이지 수",
+        type=int,
+        default=4
+    )
+    parser.add_argument(
+        "--seek",
+        help="종료 날짜가 포함된 페이지를 탐색한 뒤 그 페이지부터 크롤링",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        help="동시에 실행할 최대 LLM 호출 수",
+        type=int,
+        default=4
+    )
+    parser.add_argument(
+        "--no-dedup",
+        help="여러 언론사에 실린 같은 기사를 하나로 묶지 않음",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        help="map 단계 조각 하나의 최대 토큰 수 (기본값: 모델별 예산)",
+        type=int,
+        default=None
+    )
+    parser.add_argument(
+        "--max-companies",
+        help="동시에 분석할 최대 회사 수",
+        type=int,
+        default=2
+    )
+    parser.add_argument(
+        "--max-connections",
+        help="모든 회사가 함께 쓰는 최대 HTTP 연결 수",
+        type=int,
+        default=16
+    )
+    parser.add_argument(
+        "--max-connections-per-host",
+        help="호스트 하나에 대한 최대 HTTP 연결 수",
+        type=int,
+        default=8
+    )
+    parser.add_argument(
+        "--keepalive-timeout",
+        help="사용하지 않는 HTTP 연결을 유지할 시간(초)",
+        type=float,
+        default=DEFAULT_KEEPALIVE_TIMEOUT
+    )
+    parser.add_argument(
+        "--dns-cache-ttl",
+        help="DNS 조회 결과를 유지할 시간(초)",
+        type=int,
+        default=DEFAULT_DNS_CACHE_TTL
+    )
+    parser.add_argument(
+        "--rate",
+        help="호스트별 초당 최대 요청 수 (0이면 제한하지 않음)",
+        type=float,
+        default=10.0
+    )
+    parser.add_argument(
+        "--max-retries",
+        help="실패한 요청의 최대 재시도 횟수",
+        type=int,
+        default=3
+    )
+    parser.add_argument(
+        "--request-timeout",
+        help="요청 하나의 시간 제한(초)",
+        type=float,
+        default=10.0
+    )
+    parser.add_argument(
+        "--no-throttle",
+        help="속도 제한, 재시도, 회로 차단 없이 요청",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--parse-workers",
+        help="HTML을 파싱할 작업자 수 (0이면 이벤트 루프에서 파싱)",
+        type=int,
+        default=0
+    )
+    parser.add_argument(
+        "--parse-executor",
+        help="파싱 작업자 종류",
+        choices=PARSE_EXECUTORS,
+        default="process"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="HTTP 응답, 요약, 분석 결과 캐시를 저장할 디렉토리",
+        default=str(DEFAULT_CACHE_DIR)
+    )
+    parser.add_argument(
+        "--no-cache",
+        help="HTTP 응답, 요약, 분석 결과 캐시를 사용하지 않음",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--result-cache",
+        help="같은 회사와 기사 목록의 분석 결과를 캐시에서 재사용 (캐시를 확인하려면 링크를 모두 "
+             "찾은 뒤에 본문 가져오기를 시작하므로, 캐시가 없을 때는 더 느려짐)",
+        action="store_true"
+    )
     parser.add_argument(
         "--log-level",
         help="로깅 레벨",
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
         default='INFO'
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not args.company and not args.watchlist:
+        parser.error("-c/--company 또는 --watchlist 중 하나가 필요합니다.")
+    return args
 
 
 def main() -> None:
@@ -53,24 +244,337 @@ def main() -> None:
     # 전역 로깅 레벨 설정
     get_logger(__name__, args.log_level)
 
-    news_links = asyncio.run(get_news_list(
-        company=args.company,
-        date_from=args.date_from,
-        date_to=args.date_to,
-        max_pages=args.max_pages
-    ))
+    cache = None if args.no_cache else ResponseCache(Path(args.cache_dir) / "http.sqlite3")
+    use_llm_cache = not args.no_cache and not args.links_only
+    summary_cache = (
+        SummaryCache(Path(args.cache_dir) / "summary.sqlite3") if use_llm_cache else None
+    )
+    result_cache = (
+        ResultCache(Path(args.cache_dir) / "result.sqlite3")
+        if use_llm_cache and args.result_cache else None
+    )
+    watermark = (
+        WatermarkStore(Path(args.cache_dir) / "watermark.sqlite3") if args.incremental else None
+    )
+    news_store = NewsStore(Path(args.cache_dir) / "news.sqlite3") if args.store else None
+    article_index = (
+        ArticleIndex(Path(args.cache_dir) / "articles.sqlite3") if args.skip_seen else None
+    )
+    try:
+        run(args, cache, summary_cache, result_cache, watermark, news_store, article_index)
+    finally:
+        if cache is not None:
+            logger.debug(f"HTTP 캐시 통계: {cache.stats()}")
+            cache.close()
+        if summary_cache is not None:
+            logger.debug(f"요약 캐시 통계: {summary_cache.stats()}")
+            summary_cache.close()
+        if result_cache is not None:
+            result_cache.close()
+        if watermark is not None:
+            watermark.close()
+        if news_store is not None:
+            news_store.close()
+        if article_index is not None:
+            article_index.close()
+
 
-    if not news_links:
-        logger.info("분석할 뉴스가 없습니다.")
+def run(
+    args: argparse.Namespace,
+    cache: Optional[ResponseCache],
+    summary_cache: Optional[SummaryCache],
+    result_cache: Optional[ResultCache],
+    watermark: Optional[WatermarkStore] = None,
+    news_store: Optional[NewsStore] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> None:
+    if not all(inspect_date_format(date) for date in [args.date_from, args.date_to]):
+        return
+
+    companies = list(args.company)
+    if args.watchlist:
+        companies += [
+            company for company in read_watchlist(args.watchlist) if company not in companies
+        ]
+    if not companies:
+        logger.warning("분석할 회사가 없습니다.")
+        return
+
+    if args.links_only:
+        if args.output == "-":
+            asyncio.run(run_links_only(
+                companies, args, sys.stdout, cache, watermark, news_store, article_index))
+        else:
+            with open(args.output, "w", encoding="utf-8") as output:
+                asyncio.run(run_links_only(
+                    companies, args, output, cache, watermark, news_store, article_index))
         return
 
     llm = load_llm(args.model)
+    asyncio.run(run_watchlist(
+        companies, args, llm, cache, summary_cache, result_cache, watermark, news_store,
+        article_index))
+
+
+def open_session(args: argparse.Namespace) -> aiohttp.ClientSession:
+    return create_session(
+        limit=args.max_connections,
+        limit_per_host=args.max_connections_per_host,
+        keepalive_timeout=args.keepalive_timeout,
+        ttl_dns_cache=args.dns_cache_ttl,
+    )
+
+
+def make_throttle(args: argparse.Namespace) -> Optional[Throttle]:
+    if args.no_throttle:
+        return None
+    return Throttle(
+        rate=args.rate,
+        initial_concurrency=min(args.concurrency, args.max_connections_per_host),
+        max_concurrency=args.max_connections_per_host,
+        timeout=args.request_timeout,
+        max_retries=args.max_retries,
+    )
+
+
+def make_parse_pool(args: argparse.Namespace) -> ParsePool:
+    return ParsePool(args.parse_workers, args.parse_executor)
+
+
+def iter_company_links(
+    company: str,
+    args: argparse.Namespace,
+    session: aiohttp.ClientSession,
+    cache: Optional[ResponseCache],
+    watermark: Optional[WatermarkStore] = None,
+    news_store: Optional[NewsStore] = None,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> AsyncIterator[Mapping[str, Any]]:
+    news_links: AsyncIterator[Mapping[str, Any]] = iter_news_list(
+        company=company,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        max_pages=args.max_pages,
+        concurrency=args.concurrency,
+        seek=args.seek,
+        cache=cache,
+        session=session,
+        watermark=watermark,
+        with_history=args.with_history,
+        throttle=throttle,
+        parse_pool=parse_pool,
+        article_index=article_index,
+    )
+    if news_store is not None:
+        news_links = store_news_links(
+            news_links, resolve_code(company) or company, news_store)
+    if not args.no_dedup:
+        news_links = iter_filter_similar_news(news_links)
+    return news_links
+
+
+async def collect_news_links(
+    news_links: AsyncIterator[Mapping[str, Any]],
+    collected: List[Mapping[str, Any]],
+) -> AsyncIterator[Mapping[str, Any]]:
+    async for news in news_links:
+        collected.append(news)
+        yield news
+
+
+def archive_news(
+    base_dir: str,
+    company: str,
+    news_items: List[Mapping[str, Any]],
+    analysis_result: Optional[Dict[str, Any]] = None,
+    news_store: Optional[NewsStore] = None,
+) -> None:
+    # pyarrow는 선택 의존성이므로 아카이브를 쓸 때만 불러옵니다.
+    from stock_news_analyzer.archive import write_archive
+
+    records = []
+    for news in news_items:
+        record = dict(news)
+        if news_store is not None:
+            record["body"] = news_store.get_body(news["link"])
+        if analysis_result is not None:
+            record["summary"] = analysis_result["summary"]
+            record["sentiment"] = analysis_result["sentiment_analysis"]
+        records.append(record)
+    written = write_archive(base_dir, resolve_code(company) or company, records)
+    logger.info(f"[{company}] 뉴스 {written}개를 아카이브에 저장했습니다.")
+
+
+async def store_news_links(
+    news_links: AsyncIterator[Mapping[str, Any]],
+    company_code: str,
+    news_store: NewsStore,
+) -> AsyncIterator[Mapping[str, Any]]:
+    async for news in news_links:
+        news_store.add_news(company_code, [news])
+        yield news
+
+
+async def run_links_only(
+    companies: List[str],
+    args: argparse.Namespace,
+    output: TextIO,
+    cache: Optional[ResponseCache] = None,
+    watermark: Optional[WatermarkStore] = None,
+    news_store: Optional[NewsStore] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> int:
+    """LLM 없이 회사별 뉴스 목록만 JSON Lines로 씁니다.
+
+    뉴스는 찾는 대로 한 줄씩 쓰고 바로 flush하므로 다른 프로그램이 파이프로 이어서 읽을
+    수 있습니다. 각 줄에는 `company`와 함께 'date', 'source', 'title', 'link'가 들어갑니다.
+
+    Args:
+        companies (list[str]): 회사 코드 또는 이름 목록.
+        args (argparse.Namespace): 명령행 인자.
+        output (TextIO): 결과를 쓸 스트림.
+        cache (ResponseCache | None, optional): 목록 페이지 응답 캐시.
+        watermark (WatermarkStore | None, optional): 주어지면 새 뉴스만 씁니다.
+        news_store (NewsStore | None, optional): 주어지면 찾은 뉴스를 저장합니다.
+        article_index (ArticleIndex | None, optional): 주어지면 이전에 쓴 기사는 건너뛰고,
+            쓴 기사는 색인에 기록합니다.
+    Returns:
+        int: 쓴 뉴스 수.
+    """
+    semaphore = asyncio.Semaphore(max(1, args.max_companies))
+    throttle = make_throttle(args)
+    written = 0
+
+    async with open_session(args) as session, make_parse_pool(args) as parse_pool:
+        async def crawl(company: str) -> None:
+            nonlocal written
+            collected: List[Mapping[str, Any]] = []
+            news_links = iter_company_links(
+                company, args, session, cache, watermark, news_store, throttle, parse_pool,
+                article_index)
+            if args.archive:
+                news_links = collect_news_links(news_links, collected)
+            async with semaphore:
+                try:
+                    async for news in news_links:
+                        output.write(json.dumps({"company": company, **news}, ensure_ascii=False))
+                        output.write("\n")
+                        output.flush()
+                        written += 1
+                        if article_index is not None:
+                            article_index.add(news)
+                except Exception as e:
+                    logger.warning(f"[{company}] 뉴스 목록을 가져오는 중 오류 발생: {e}")
+            if args.archive:
+                archive_news(args.archive, company, collected, news_store=news_store)
 
-    analysis_result = asyncio.run(analyze_news(news_links, args.company, llm))
+        await asyncio.gather(*(crawl(company) for company in companies))
+
+    logger.info(f"총 {written}개의 뉴스를 출력했습니다.")
+    return written
+
+
+async def analyze_company(
+    company: str,
+    args: argparse.Namespace,
+    llm: "BaseChatModel",
+    session: aiohttp.ClientSession,
+    cache: Optional[ResponseCache],
+    summary_cache: Optional[SummaryCache],
+    result_cache: Optional[ResultCache],
+    watermark: Optional[WatermarkStore] = None,
+    news_store: Optional[NewsStore] = None,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> Optional[Dict[str, Any]]:
+    # LLM 단계에서만 필요한 langchain을 `--help`나 인자 오류 때 불러오지 않도록 여기서 불러옵니다.
+    from stock_news_analyzer.analyzer import analyze_news
+
+    # 링크를 찾는 대로 본문 가져오기와 요약이 이어서 진행됩니다.
+    collected: List[Mapping[str, Any]] = []
+    news_links = iter_company_links(
+        company, args, session, cache, watermark, news_store, throttle, parse_pool,
+        article_index)
+    if args.archive:
+        news_links = collect_news_links(news_links, collected)
+    analysis_result = await analyze_news(
+        news_links, company, llm, cache, args.llm_concurrency,
+        summary_cache=summary_cache,
+        result_cache=result_cache,
+        chunk_tokens=args.chunk_tokens,
+        dedup_contents=not args.no_dedup,
+        session=session,
+        news_store=news_store,
+        throttle=throttle,
+        parse_pool=parse_pool,
+        article_index=article_index,
+    )
+    if args.archive and analysis_result is not None:
+        archive_news(args.archive, company, collected, analysis_result, news_store)
+    return analysis_result
+
+
+async def run_watchlist(
+    companies: List[str],
+    args: argparse.Namespace,
+    llm: "BaseChatModel",
+    cache: Optional[ResponseCache] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    result_cache: Optional[ResultCache] = None,
+    watermark: Optional[WatermarkStore] = None,
+    news_store: Optional[NewsStore] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """여러 회사를 하나의 이벤트 루프에서 분석합니다.
+
+    CLI의 유일한 비동기 진입점으로, 하나의 HTTP 세션을 열어 목록 크롤링과 기사 본문
+    요청에 모두 넘깁니다. 모든 회사가 이 연결 풀과 LLM 클라이언트를 함께 쓰며, 동시에
+    분석하는 회사 수는 `args.max_companies`로 제한합니다. 결과는 회사별로 분석이 끝나는
+    대로 기록합니다.
+
+    Args:
+        companies (list[str]): 회사 코드 또는 이름 목록.
+        args (argparse.Namespace): 명령행 인자.
+        llm (BaseChatModel): 모든 회사가 함께 쓰는 LLM.
+    Returns:
+        dict[str, dict | None]: 회사별 분석 결과. 뉴스가 없거나 실패하면 None입니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, args.max_companies))
+    throttle = make_throttle(args)
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    async with open_session(args) as session, make_parse_pool(args) as parse_pool:
+        async def analyze(company: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            async with semaphore:
+                try:
+                    return company, await analyze_company(
+                        company, args, llm, session, cache, summary_cache, result_cache,
+                        watermark, news_store, throttle, parse_pool, article_index)
+                except Exception as e:
+                    logger.warning(f"[{company}] 분석 중 오류 발생: {e}")
+                    return company, None
+
+        # as_completed는 넘긴 코루틴을 집합으로 바꾸므로, 목록 순서대로 시작하도록
+        # 미리 태스크로 만듭니다.
+        tasks = [asyncio.create_task(analyze(company)) for company in companies]
+        for finished in asyncio.as_completed(tasks):
+            company, analysis_result = await finished
+            results[company] = analysis_result
+            log_result(company, analysis_result)
+    return results
+
+
+def log_result(company: str, analysis_result: Optional[Dict[str, Any]]) -> None:
+    if analysis_result is None:
+        logger.info(f"[{company}] 분석할 뉴스가 없습니다.")
+        return
 
-    logger.info("분석 결과:")
-    logger.info(f"요약: {analysis_result['summary']['output_text']}")
-    logger.info(f"감정 분석 및 핵심 포인트: {analysis_result['sentiment_analysis'].content}")
+    logger.info(f"[{company}] 분석 결과:")
+    logger.info(f"요약: {analysis_result['summary']}")
+    logger.info(f"감정 분석 및 핵심 포인트: {analysis_result['sentiment_analysis']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+import hashlib
+import re
+from collections import Counter
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Set
+
+from stock_news_analyzer.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FINGERPRINT_BITS = 64
+
+# SimHash 사이의 해밍 거리가 이 값 이하이면 같은 기사로 봅니다. 제목은 짧아 글자 몇 개만
+# 달라도 거리가 커지므로 바이그램과 더 넓은 거리를 씁니다.
+TITLE_NGRAM = 2
+TITLE_MAX_DISTANCE = 5
+BODY_NGRAM = 3
+BODY_MAX_DISTANCE = 3
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_text(text: str) -> str:
+    """공백, 문장 부호, 대소문자 차이를 없앱니다."""
+    return _NON_WORD.sub("", text.lower())
+
+
+def simhash(text: str, ngram: int = 3) -> int:
+    """문자 n-gram으로 64비트 SimHash를 계산합니다.
+
+    비슷한 텍스트일수록 해밍 거리가 가까운 값이 나옵니다.
+    """
+    normalized = normalize_text(text)
+    if len(normalized) <= ngram:
+        features = Counter([normalized])
+    else:
+        features = Counter(normalized[i:i + ngram] for i in range(len(normalized) - ngram + 1))
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature, count in features.items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """해밍 거리 `max_distance` 이내의 SimHash를 찾는 LSH 인덱스.
+
+    64비트를 `max_distance + 1`개의 구간으로 나누어 구간별로 버킷을 만듭니다. 거리가
+    `max_distance` 이하인 두 값은 적어도 한 구간이 같으므로(비둘기집 원리) 같은 버킷의
+    후보만 비교하면 되고, 전체를 비교하지 않아도 됩니다.
+
+    Args:
+        max_distance (int, optional): 같은 기사로 볼 최대 해밍 거리.
+    """
+
+    def __init__(self, max_distance: int = BODY_MAX_DISTANCE) -> None:
+        self.max_distance = max_distance
+        num_bands = max_distance + 1
+        band_bits = -(-FINGERPRINT_BITS // num_bands)
+        self._bands = [
+            (offset, (1 << min(band_bits, FINGERPRINT_BITS - offset)) - 1)
+            for offset in range(0, FINGERPRINT_BITS, band_bits)
+        ]
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._fingerprints: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def query(self, fingerprint: int) -> Optional[int]:
+        """가장 먼저 추가된 비슷한 항목의 번호를 반환합니다. 없으면 None."""
+        candidates: Set[int] = set()
+        for (offset, mask), buckets in zip(self._bands, self._buckets):
+            candidates.update(buckets.get(fingerprint >> offset & mask, ()))
+        for candidate in sorted(candidates):
+            if hamming_distance(self._fingerprints[candidate], fingerprint) <= self.max_distance:
+                return candidate
+        return None
+
+    def add(self, fingerprint: int) -> int:
+        """항목을 추가하고 번호를 반환합니다."""
+        index = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        for (offset, mask), buckets in zip(self._bands, self._buckets):
+            buckets.setdefault(fingerprint >> offset & mask, []).append(index)
+        return index
+
+
+class NewsDeduplicator:
+    """제목이 거의 같은 뉴스를 하나로 묶습니다.
+
+    처음 나온 뉴스가 대표가 되며, `cluster_sizes`에 대표 뉴스마다 묶인 뉴스 수를 기록합니다.
+    """
+
+    def __init__(self, max_distance: int = TITLE_MAX_DISTANCE) -> None:
+        self.index = SimHashIndex(max_distance)
+        self.representatives: List[Mapping[str, Any]] = []
+        self.cluster_sizes: List[int] = []
+
+    def add(self, news: Mapping[str, Any]) -> bool:
+        """새 대표 뉴스이면 True, 앞서 나온 뉴스와 같은 기사이면 False를 반환합니다."""
+        fingerprint = simhash(news["title"], TITLE_NGRAM)
+        match = self.index.query(fingerprint)
+        if match is not None:
+            self.cluster_sizes[match] += 1
+            logger.debug(
+                f"중복 뉴스 건너뛰기: {news['title']} ~ {self.representatives[match]['title']}")
+            return False
+
+        self.index.add(fingerprint)
+        self.representatives.append(news)
+        self.cluster_sizes.append(1)
+        return True
+
+    def report(self) -> None:
+        """여러 뉴스가 묶인 대표 뉴스와 묶인 수를 기록합니다."""
+        duplicates = sum(self.cluster_sizes) - len(self.cluster_sizes)
+        if not duplicates:
+            return
+        logger.info(f"중복 뉴스 {duplicates}개를 제외하고 {len(self.representatives)}개의 "
+                    "뉴스를 남겼습니다.")
+        for news, size in zip(self.representatives, self.cluster_sizes):
+            if size > 1:
+                logger.info(f"  {size}개 묶음: {news['title']}")
+
+
+def filter_similar_news(
+    news_links: Sequence[Mapping[str, Any]],
+    max_distance: int = TITLE_MAX_DISTANCE,
+) -> List[Dict[str, Any]]:
+    """여러 언론사에 실린 같은 기사를 하나로 묶어 대표 뉴스만 반환합니다.
+
+    Args:
+        news_links (list[dict[str, str]]): `finder.get_news_link`가 반환한 뉴스 목록.
+        max_distance (int, optional): 같은 기사로 볼 제목 SimHash의 최대 해밍 거리.
+    Returns:
+        list[dict[str, str]]: 대표 뉴스 목록. 각 뉴스에는 묶인 뉴스 수 'cluster_size'가 추가됩니다.
+    """
+    deduplicator = NewsDeduplicator(max_distance)
+    for news in news_links:
+        deduplicator.add(news)
+    deduplicator.report()
+    return [
+        {**news, "cluster_size": size}
+        for news, size in zip(deduplicator.representatives, deduplicator.cluster_sizes)
+    ]
+
+
+async def iter_filter_similar_news(
+    news_links: AsyncIterable[Mapping[str, Any]],
+    max_distance: int = TITLE_MAX_DISTANCE,
+) -> AsyncIterator[Mapping[str, Any]]:
+    """`filter_similar_news`의 비동기 제너레이터 버전.
+
+    대표 뉴스는 처음 나오는 즉시 원래 뉴스 그대로 반환합니다. 반환하는 시점에는 뒤에 나올
+    중복 수를 알 수 없으므로, 묶인 수는 입력이 끝난 뒤 로그로 남깁니다.
+    """
+    deduplicator = NewsDeduplicator(max_distance)
+    async for news in news_links:
+        if deduplicator.add(news):
+            yield news
+    deduplicator.report()
+
+
+class ContentDeduplicator:
+    """가져온 본문이 이미 본 본문과 거의 같은지 확인합니다."""
+
+    def __init__(self, max_distance: int = BODY_MAX_DISTANCE) -> None:
+        self.index = SimHashIndex(max_distance)
+        self.duplicates = 0
+
+    def is_duplicate(self, content: str) -> bool:
+        fingerprint = simhash(content, BODY_NGRAM)
+        if self.index.query(fingerprint) is not None:
+            self.duplicates += 1
+            return True
+        self.index.add(fingerprint)
+        return False
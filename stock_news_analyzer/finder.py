@@ -1,151 +1,349 @@
-import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+from datetime import date, datetime
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiohttp
-from bs4 import BeautifulSoup, Tag
 
-from stock_news_analyzer.utils.company_code import COMPANY_CODE
+from stock_news_analyzer.listing import ListingWindow, parse_listing
+from stock_news_analyzer.news import NewsItem
+
+# 기사 ID 파싱은 `news`에 있으며, 이 모듈에서 쓰던 코드를 위해 다시 내보냅니다.
+from stock_news_analyzer.news import extract_article_info as extract_article_info
+from stock_news_analyzer.news import parse_article_link as parse_article_link
+from stock_news_analyzer.parsing import ParsePool
+from stock_news_analyzer.utils.article_index import ArticleIndex
+from stock_news_analyzer.utils.cache import ResponseCache
+from stock_news_analyzer.utils.company_resolver import resolve_code
+from stock_news_analyzer.utils.http import create_session
 from stock_news_analyzer.utils.logger import get_logger
+from stock_news_analyzer.utils.ratelimit import HTTPStatusError, Throttle
+from stock_news_analyzer.utils.watermark import WatermarkStore
 
 logger = get_logger(__name__)
 
+# 날짜 탐색 시 확인할 최대 목록 페이지 번호
+SEEK_PAGE_LIMIT = 4096
+
 
 def clean_title(title: str) -> str:
     return title.strip()
 
 
-async def fetch(session: aiohttp.ClientSession, url: str) -> Any:
-    async with session.get(url) as response:
-        return await response.text()
-
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    cache: Optional[ResponseCache] = None,
+    throttle: Optional[Throttle] = None,
+) -> Any:
+    """`url`의 본문을 가져옵니다.
 
-def extract_article_info(href: str) -> tuple[str, str]:
-    match = re.search(r'article_id=(\d+)&office_id=(\d+)', href)
-    if match:
-        return match.group(2), match.group(1)
-    return '', ''
+    `throttle`이 주어지면 호스트별 속도 제한과 재시도를 거쳐 요청합니다.
 
+    Raises:
+        HTTPStatusError: 2xx 이외의 응답을 받았을 때. 차단 페이지나 오류 페이지를 빈 목록으로
+            파싱하지 않도록 합니다.
+    """
+    if cache is not None:
+        cached = cache.get_text(url)
+        if cached is not None:
+            return cached
+
+    if throttle is not None:
+        status, text = await throttle.request(session, url)
+    else:
+        async with session.get(url) as response:
+            status, text = response.status, await response.text()
+        if not 200 <= status < 300:
+            raise HTTPStatusError(status, url)
+    if cache is not None and status == 200:
+        cache.set_text(url, text)
+    return text
+
+
+def listing_url(code: str, page: int) -> str:
+    return f"https://finance.naver.com/item/news_news.nhn?code={code}&page={page}"
+
+
+def parse_news_page(
+    html_content: str,
+    today: date,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> tuple[List[NewsItem], bool]:
+    """뉴스 목록 페이지 하나를 파싱합니다.
 
-async def get_news_link(
+    Args:
+        html_content (str): 뉴스 목록 페이지의 HTML.
+        today (date): 오늘 날짜. 이후 날짜의 뉴스는 건너뜁니다.
+        start_date (date | None, optional): 시작 날짜.
+        end_date (date | None, optional): 종료 날짜.
+    Returns:
+        tuple[list[NewsItem], bool]: 뉴스 항목 목록과 시작 날짜 이전의 뉴스에
+            도달했는지 여부. 목록은 최신순이므로 도달한 경우 이후 페이지는 볼 필요가 없습니다.
+    """
+    return parse_listing(html_content, ListingWindow(today, start_date, end_date))
+
+
+async def probe_page_dates(
+    session: aiohttp.ClientSession,
+    code: str,
+    page: int,
+    today: date,
+    probed: Dict[int, str],
+    cache: Optional[ResponseCache] = None,
+    throttle: Optional[Throttle] = None,
+) -> Optional[tuple[date, date]]:
+    """목록 페이지의 첫 번째(최신)와 마지막(가장 오래된) 뉴스 날짜를 반환합니다.
+
+    가져온 HTML은 `probed`에 저장되어 이후 크롤링에서 다시 요청하지 않습니다.
+    뉴스가 없는 페이지이면 None을 반환합니다.
+    """
+    if page not in probed:
+        probed[page] = await fetch(session, listing_url(code, page), cache, throttle)
+    news_items, _ = parse_news_page(probed[page], today)
+    if not news_items:
+        return None
+    newest = news_items[0].published.date()
+    oldest = news_items[-1].published.date()
+    logger.debug(f"페이지 {page} 탐색: {newest} ~ {oldest}")
+    return newest, oldest
+
+
+async def locate_start_page(
+    session: aiohttp.ClientSession,
+    code: str,
+    end_date: date,
+    today: date,
+    probed: Dict[int, str],
+    cache: Optional[ResponseCache] = None,
+    throttle: Optional[Throttle] = None,
+) -> int:
+    """종료 날짜 이전의 뉴스가 처음 나오는 목록 페이지를 찾습니다.
+
+    1, 2, 4, 8, ... 페이지를 확인하며 범위를 넓힌 뒤(galloping), 그 안에서 이진 탐색으로
+    가장 오래된 뉴스가 종료 날짜 이전인 첫 페이지를 찾습니다. 요청 수는 O(log pages)입니다.
+    """
+    async def is_at_or_after_window(page: int) -> bool:
+        bounds = await probe_page_dates(session, code, page, today, probed, cache, throttle)
+        return bounds is None or bounds[1] <= end_date
+
+    low, high = 0, 1
+    while not await is_at_or_after_window(high):
+        if high >= SEEK_PAGE_LIMIT:
+            return SEEK_PAGE_LIMIT
+        low, high = high, min(high * 2, SEEK_PAGE_LIMIT)
+
+    # low 페이지는 종료 날짜 이후의 뉴스만 있고, high 페이지는 그렇지 않습니다.
+    while high - low > 1:
+        middle = (low + high) // 2
+        if await is_at_or_after_window(middle):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+async def iter_news_links(
     code: Optional[str] = None,
     company: Optional[str] = None,
     date_from: str = "",
     date_to: str = "",
     max_pages: int = 1,
-) -> List[Dict[str, Any]]:
-    """뉴스 링크를 비동기적으로 가져옵니다.
-
-    Args:
-        code (str | None, optional): 관련 뉴스를 가져올 코드.
-        company (str | None, optional): 관련 뉴스를 가져올 회사 이름.
-        date_from (str | None, optional): 시작 날짜 (YYYY.MM.DD 형식).
-        date_to (str | None, optional): 종료 날짜 (YYYY.MM.DD 형식).
-        max_pages (int, optional): 크롤링할 최대 페이지 수.
-    Returns:
-        list[dict[str, str]] | None: 뉴스 링크 목록 또는 None.
-            - 성공 시: 각 뉴스 항목에 대한 딕셔너리 목록 반환.
-              각 딕셔너리는 'date' (날짜), 'title' (제목), 'link' (링크) 키를 포함.
-            - 실패 시: None 반환.
+    concurrency: int = 1,
+    seek: bool = False,
+    cache: Optional[ResponseCache] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    watermark: Optional[WatermarkStore] = None,
+    with_history: bool = False,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> AsyncIterator[NewsItem]:
+    """뉴스 링크를 찾는 대로 하나씩 반환하는 비동기 제너레이터.
+
+    목록 페이지는 최대 `concurrency`개까지 동시에 요청하며, 뉴스는 페이지 순서대로 반환합니다.
+    시작 날짜 이전의 뉴스가 나온 페이지가 있으면 그 뒤의 페이지 요청은 취소합니다.
+    `seek`이 설정되면 종료 날짜가 포함된 페이지를 먼저 탐색한 뒤 그 페이지부터 크롤링합니다.
+    `watermark`가 주어지면 이미 본 뉴스가 나오는 즉시 멈추고 새 뉴스만 반환합니다. 이때
+    워터마크가 있는 회사는 첫 페이지를 먼저 확인하므로 새 뉴스가 적으면 요청이 한 번으로
+    끝납니다. 워터마크는 이미 본 뉴스나 시작 날짜에 도달했을 때만 갱신하며, 오류나 중단,
+    페이지 수 소진으로 끝나면 그대로 둡니다. `article_index`가 주어지면 이전에 처리한
+    기사는 건너뜁니다.
+    인자는 `get_news_link`와 같습니다.
     """
+    if session is None:
+        async with create_session(max(1, concurrency)) as own_session:
+            async for news in iter_news_links(
+                code=code, company=company, date_from=date_from, date_to=date_to,
+                max_pages=max_pages, concurrency=concurrency, seek=seek, cache=cache,
+                session=own_session, watermark=watermark, with_history=with_history,
+                throttle=throttle, parse_pool=parse_pool, article_index=article_index,
+            ):
+                yield news
+        return
+
     if code is None:
         if company is None:
             logger.warning("code 또는 company가 필요합니다.")
-            return []
-        if company not in COMPANY_CODE:
+            return
+        # 공백이나 오타가 섞인 이름은 가장 비슷한 회사로 해석합니다.
+        code = resolve_code(company)
+        if code is None:
             logger.warning("잘못된 company가 주어졌습니다.")
-            return []
+            return
 
-    _code: str = (
-        code if code is not None
-        else COMPANY_CODE.get(company or '', '')
-    )
+    _code: str = code
 
-    crawled_links: List[Dict[str, Any]] = []
     today = datetime.now().date()
-
-    async with aiohttp.ClientSession() as session:
-        for page in range(1, max_pages + 1):
-            url = f"https://finance.naver.com/item/news_news.nhn?code={_code}&page={page}"
-            html_content = await fetch(session, url)
-            html = BeautifulSoup(html_content, "lxml")
-
-            # relation_lst 클래스를 가진 tr과 그 하위 요소들을 모두 제외
-            for relation_lst in html.select("tr.relation_lst"):
-                relation_lst.decompose()
-
-            # 남은 tr 요소들 중 hide_news 클래스를 가진 것을 제외하고 선택
-            news_items = html.select("table.type5 tbody tr:not(.hide_news)")
-
-            for item in news_items:
-                logger.debug(item.text)
-
-            for item in news_items:
-                date_elem = item.select_one(".date")
-                if not date_elem:
-                    logger.debug("날짜 요소를 찾지 못했습니다.")
-                    continue
-
-                date = date_elem.get_text().strip()
-                info_elem = item.select_one(".info")
-                source = info_elem.get_text().strip() if info_elem else ""
-
-                title_elem = item.select_one(".title")
-                if title_elem and isinstance(title_elem, Tag):
-                    title_text = title_elem.get_text(strip=True)
-                    title_text = clean_title(title_text)
-                    link_elem = title_elem.find("a")
-                    if link_elem and isinstance(link_elem, Tag):
-                        href = link_elem.get("href")
-                        if href:
-                            office_id, article_id = extract_article_info(href)  # type: ignore[arg-type]
-                            if office_id and article_id:
-                                link = f"https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
-                            else:
-                                logger.debug(
-                                    f"올바른 article_id와 office_id를 찾지 못했습니다: {href}")
-                                continue
-                        else:
-                            logger.debug("href 속성을 찾지 못했습니다.")
-                            continue
-                    else:
-                        logger.debug("링크 요소를 찾지 못했습니다.")
-                        continue
-                else:
-                    logger.debug("제목 요소를 찾지 못했습니다.")
-                    continue
-
-                try:
-                    news_date = datetime.strptime(date, "%Y.%m.%d %H:%M")
-                except ValueError:
-                    logger.debug(f"잘못된 날짜 형식: {date}")
-                    continue
-
-                if news_date.date() > today:
-                    logger.debug(f"미래의 뉴스 건너뛰기: {date}")
-                    continue
-
-                if date_from:
-                    start_date = datetime.strptime(date_from, "%Y.%m.%d").date()
-                    if news_date.date() < start_date:
-                        logger.debug(
-                            f"시작 날짜 이전의 뉴스를 발견했습니다: {date}. 크롤링을 중단합니다.")
+    start_date = datetime.strptime(date_from, "%Y.%m.%d").date() if date_from else None
+    end_date = datetime.strptime(date_to, "%Y.%m.%d").date() if date_to else None
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    window = ListingWindow(today, start_date, end_date)
+
+    probed: Dict[int, str] = {}
+
+    first_page = 1
+    if seek and end_date:
+        first_page = await locate_start_page(
+            session, _code, end_date, today, probed, cache, throttle)
+        logger.info(f"{end_date} 이전의 뉴스는 {first_page} 페이지부터 시작합니다.")
+
+    async def crawl_page(page: int) -> tuple[List[NewsItem], bool]:
+        html_content = probed.get(page)
+        if html_content is None:
+            async with semaphore:
+                html_content = await fetch(
+                    session, listing_url(_code, page), cache, throttle)
+        if parse_pool is None:
+            return parse_listing(html_content, window)
+        return await parse_pool.run(parse_listing, html_content, window)
+
+    tasks: Dict[int, "asyncio.Task[tuple[List[NewsItem], bool]]"] = {}
+
+    def cancel_later_pages(page: int, task: "asyncio.Task[Any]") -> None:
+        if task.cancelled() or task.exception() is not None:
+            return
+        _, reached_start = task.result()
+        if reached_start:
+            # 목록은 최신순이므로 이후 페이지는 모두 시작 날짜 이전입니다.
+            for later_page, later_task in tasks.items():
+                if later_page > page:
+                    later_task.cancel()
+
+    def schedule(pages: range) -> None:
+        for page in pages:
+            task = asyncio.create_task(crawl_page(page))
+            task.add_done_callback(partial(cancel_later_pages, page))
+            tasks[page] = task
+
+    pages = range(first_page, first_page + max_pages)
+    has_watermark = watermark is not None and watermark.watermark(_code) is not None
+    if has_watermark:
+        # 새 뉴스가 첫 페이지 안에 끝나는 경우가 대부분이므로 나머지 페이지는 필요할 때 요청합니다.
+        schedule(pages[:1])
+    else:
+        schedule(pages)
+
+    new_items: List[tuple[str, str, NewsItem]] = []
+    skipped = 0
+    try:
+        reached_seen = reached_start = False
+        for page in pages:
+            if page not in tasks:
+                schedule(pages[pages.index(page):])
+            news_items, reached_start = await tasks[page]
+            for news in news_items:
+                if watermark is not None:
+                    office_id, article_id = parse_article_link(news["link"])
+                    if watermark.is_seen(_code, office_id, article_id):
+                        logger.debug(f"이미 본 뉴스에 도달했습니다: {news['title']}")
+                        reached_seen = True
                         break
+                    new_items.append((office_id, article_id, news))
+                if article_index is not None and article_index.seen(news):
+                    skipped += 1
+                    continue
+                yield news
+            if reached_start or reached_seen:
+                break
+
+        history = (
+            watermark.history(_code, start_date, end_date)
+            if watermark is not None and with_history else [])
+
+        # 이전 워터마크까지 이어지지 않은 채 멈췄다면(페이지 수 소진) 기록하지 않습니다.
+        # 기록하면 다음 실행이 이 뉴스에서 멈춰 그 사이의 뉴스를 영영 가져오지 못합니다.
+        # 오류나 호출한 쪽의 중단으로 끝난 경우에도 여기에 도달하지 않습니다.
+        if watermark is not None and (reached_start or reached_seen or not has_watermark):
+            watermark.record(_code, new_items)
+        elif watermark is not None:
+            logger.warning(f"{max_pages}페이지 안에 이미 본 뉴스에 도달하지 못해 워터마크를 "
+                           "갱신하지 않습니다.")
+
+        for news in history:
+            if article_index is not None and article_index.seen(news):
+                skipped += 1
+                continue
+            yield news
+    finally:
+        if skipped:
+            logger.info(f"이전에 처리한 뉴스 {skipped}개를 건너뛰었습니다.")
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
 
-                if date_to:
-                    end_date = datetime.strptime(date_to, "%Y.%m.%d").date()
-                    if news_date.date() > end_date:
-                        logger.debug(f"종료 날짜 이후의 뉴스 건너뛰기: {date}")
-                        continue
 
-                crawled_links.append({
-                    "date": date,
-                    "source": source,
-                    "title": title_text,
-                    "link": link
-                })
-                logger.debug(f"Added news: {date} - {title_text}")
+async def get_news_link(
+    code: Optional[str] = None,
+    company: Optional[str] = None,
+    date_from: str = "",
+    date_to: str = "",
+    max_pages: int = 1,
+    concurrency: int = 1,
+    seek: bool = False,
+    cache: Optional[ResponseCache] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    watermark: Optional[WatermarkStore] = None,
+    with_history: bool = False,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> List[NewsItem]:
+    """뉴스 링크를 비동기적으로 가져옵니다.
 
+    Args:
+        code (str | None, optional): 관련 뉴스를 가져올 코드.
+        company (str | None, optional): 관련 뉴스를 가져올 회사 이름. `COMPANY_CODE`에 없으면
+            공백과 오타를 무시하고 가장 비슷한 회사로 해석합니다.
+        date_from (str | None, optional): 시작 날짜 (YYYY.MM.DD 형식).
+        date_to (str | None, optional): 종료 날짜 (YYYY.MM.DD 형식).
+        max_pages (int, optional): 크롤링할 최대 페이지 수.
+        concurrency (int, optional): 동시에 요청할 최대 페이지 수.
+        seek (bool, optional): 종료 날짜가 포함된 페이지를 찾아 그 페이지부터 크롤링할지 여부.
+        cache (ResponseCache | None, optional): 목록 페이지 응답 캐시.
+        session (aiohttp.ClientSession | None, optional): 함께 쓸 HTTP 세션.
+            주어지지 않으면 새로 만듭니다.
+        watermark (WatermarkStore | None, optional): 회사별로 이미 본 뉴스 저장소.
+            주어지면 이미 본 뉴스에서 크롤링을 멈추고 새 뉴스만 반환합니다.
+        with_history (bool, optional): `watermark`에 저장된 기간 내 뉴스도 새 뉴스 뒤에
+            이어서 반환할지 여부.
+        throttle (Throttle | None, optional): 호스트별 속도 제한과 재시도 정책.
+        parse_pool (ParsePool | None, optional): 목록 페이지를 파싱할 작업자 풀.
+            없으면 이벤트 루프에서 파싱합니다.
+        article_index (ArticleIndex | None, optional): 이전에 처리한 기사 색인.
+            주어지면 색인에 있는 기사는 반환하지 않습니다.
+    Returns:
+        list[NewsItem] | None: 뉴스 링크 목록 또는 None.
+            - 성공 시: 각 뉴스 항목의 목록 반환. 각 항목은 딕셔너리처럼
+              'date' (날짜), 'source' (언론사), 'title' (제목), 'link' (링크) 키를 가짐.
+            - 실패 시: None 반환.
+    """
+    crawled_links = [
+        news async for news in iter_news_links(
+            code, company, date_from, date_to, max_pages, concurrency, seek, cache, session,
+            watermark, with_history, throttle, parse_pool, article_index)
+    ]
     logger.info(f"총 {len(crawled_links)}개의 뉴스를 찾았습니다.")
     return crawled_links
 
@@ -160,29 +358,67 @@ def inspect_date_format(date_str: str) -> bool:
         return False
 
 
-async def get_news_list(
+async def iter_news_list(
     company: str,
     date_from: str,
     date_to: str,
-    max_pages: int
-) -> List[Dict[str, Any]]:
+    max_pages: int,
+    concurrency: int = 1,
+    seek: bool = False,
+    cache: Optional[ResponseCache] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    watermark: Optional[WatermarkStore] = None,
+    with_history: bool = False,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> AsyncIterator[NewsItem]:
     # 날짜 형식 검증
     if not all(inspect_date_format(date) for date in [date_from, date_to]):
-        return []
+        return
 
     logger.info(f"뉴스 검색 시작: 회사 - {company}, 기간 - {date_from} ~ {date_to}")
 
     # 해당 날짜의 뉴스 가져오기
-    news_links: List[Dict[str, Any]] = await get_news_link(
+    async for news in iter_news_links(
         code=company if company.isdigit() else None,
         company=company if not company.isdigit() else None,
         date_from=date_from,
         date_to=date_to,
-        max_pages=max_pages
-    )
+        max_pages=max_pages,
+        concurrency=concurrency,
+        seek=seek,
+        cache=cache,
+        session=session,
+        watermark=watermark,
+        with_history=with_history,
+        throttle=throttle,
+        parse_pool=parse_pool,
+        article_index=article_index,
+    ):
+        logger.info(f"[{news['date']}] {news['title']} - {news['link']}")
+        yield news
 
-    if news_links:
-        for news in news_links:
-            logger.info(f"[{news['date']}] {news['title']} - {news['link']}")
 
+async def get_news_list(
+    company: str,
+    date_from: str,
+    date_to: str,
+    max_pages: int,
+    concurrency: int = 1,
+    seek: bool = False,
+    cache: Optional[ResponseCache] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    watermark: Optional[WatermarkStore] = None,
+    with_history: bool = False,
+    throttle: Optional[Throttle] = None,
+    parse_pool: Optional[ParsePool] = None,
+    article_index: Optional[ArticleIndex] = None,
+) -> List[NewsItem]:
+    news_links = [
+        news async for news in iter_news_list(
+            company, date_from, date_to, max_pages, concurrency, seek, cache, session,
+            watermark, with_history, throttle, parse_pool, article_index)
+    ]
+    logger.info(f"총 {len(news_links)}개의 뉴스를 찾았습니다.")
     return news_links
@@ -0,0 +1,136 @@
+"""Fast parser for finance.naver.com news listing pages."""
+import re
+import threading
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from lxml import etree
+
+from stock_news_analyzer.news import NewsItem, extract_article_info
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["ListingWindow", "parse_listing"]
+
+logger = get_logger(__name__)
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# `table.type5 tbody tr:not(.hide_news)` 중 관련 뉴스(tr.relation_lst) 안의 행을 뺀 것
+ROW_XPATH = etree.XPath(
+    f"//table[{_has_class('type5')}]//tbody//tr"
+    f"[not({_has_class('hide_news')})]"
+    f"[not(ancestor-or-self::tr[{_has_class('relation_lst')}])]"
+)
+DATE_XPATH = etree.XPath(f"string(.//*[{_has_class('date')}][1])")
+INFO_XPATH = etree.XPath(f"string(.//*[{_has_class('info')}][1])")
+TITLE_XPATH = etree.XPath(f".//*[{_has_class('title')}][1]")
+HREF_XPATH = etree.XPath("string(.//a[1]/@href)")
+
+# lxml 파서는 한 번에 한 문서만 파싱하도록 잠기므로, 스레드 풀에서 목록을 동시에 파싱할
+# 수 있게 스레드마다 따로 만들어 씁니다.
+_local = threading.local()
+
+
+def html_parser() -> etree.HTMLParser:
+    """현재 스레드의 HTML 파서."""
+    parser: Optional[etree.HTMLParser] = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = etree.HTMLParser()
+    return parser
+
+
+NEWS_DATE = re.compile(r'\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}')
+
+
+class ListingWindow:
+    """목록 페이지에서 남길 뉴스의 날짜 범위.
+
+    뉴스 날짜는 `YYYY.MM.DD HH:MM` 형식이므로, 경계를 같은 형식의 문자열로 한 번만 바꿔 두고
+    뉴스마다 날짜를 파싱하는 대신 앞 10자를 문자열로 비교합니다.
+
+    Args:
+        today (date): 오늘 날짜. 이후 날짜의 뉴스는 건너뜁니다.
+        start_date (date | None, optional): 시작 날짜.
+        end_date (date | None, optional): 종료 날짜.
+    """
+
+    __slots__ = ("today", "start", "end")
+
+    def __init__(
+        self,
+        today: date,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> None:
+        self.today = today.strftime("%Y.%m.%d")
+        self.start = start_date.strftime("%Y.%m.%d") if start_date else None
+        self.end = end_date.strftime("%Y.%m.%d") if end_date else None
+
+
+def parse_listing(
+    html_content: str,
+    window: ListingWindow,
+) -> Tuple[List[NewsItem], bool]:
+    """뉴스 목록 페이지 하나를 파싱합니다.
+
+    lxml XPath로 `table.type5`의 행만 골라내고, 날짜 범위는 문자열로 비교한 뒤 범위 안의
+    뉴스만 `NewsItem`으로 만듭니다.
+
+    Args:
+        html_content (str): 뉴스 목록 페이지의 HTML.
+        window (ListingWindow): 남길 뉴스의 날짜 범위.
+    Returns:
+        tuple[list[NewsItem], bool]: 뉴스 항목 목록과 시작 날짜 이전의 뉴스에
+            도달했는지 여부.
+    """
+    if not html_content or not html_content.strip():
+        return [], False
+    root = etree.fromstring(html_content, html_parser())
+    if root is None:
+        return [], False
+
+    crawled_links: List[NewsItem] = []
+    for row in ROW_XPATH(root):
+        news_date = DATE_XPATH(row).strip()
+        if not NEWS_DATE.fullmatch(news_date):
+            logger.debug(f"잘못된 날짜 형식: {news_date!r}")
+            continue
+
+        title_elems = TITLE_XPATH(row)
+        if not title_elems:
+            logger.debug("제목 요소를 찾지 못했습니다.")
+            continue
+        title_elem = title_elems[0]
+        office_id, article_id = extract_article_info(HREF_XPATH(title_elem))
+        if not office_id:
+            logger.debug("올바른 article_id와 office_id를 찾지 못했습니다.")
+            continue
+
+        day = news_date[:10]
+        if day > window.today:
+            continue
+        if window.start is not None and day < window.start:
+            return crawled_links, True
+        if window.end is not None and day > window.end:
+            continue
+
+        try:
+            published = datetime(
+                int(news_date[0:4]), int(news_date[5:7]), int(news_date[8:10]),
+                int(news_date[11:13]), int(news_date[14:16]))
+        except ValueError:
+            logger.debug(f"잘못된 날짜: {news_date!r}")
+            continue
+
+        crawled_links.append(NewsItem(
+            int(office_id),
+            int(article_id),
+            published,
+            INFO_XPATH(row).strip(),
+            "".join(s.strip() for s in title_elem.itertext()),
+        ))
+
+    return crawled_links, False
@@ -1,36 +1,49 @@
 import os
-from typing import List
-
-from langchain_core.language_models.llms import BaseLLM
-from langchain_openai import ChatOpenAI
-
-OPENAI_MODELS = [
-    "gpt-4-1106-preview",
-    "gpt-4o-2024-05-13",
-    "gpt-4-0125-preview",
-    "gpt-4-turbo-preview",
-    "gpt-3.5-turbo-16k",
-    "gpt-4o-2024-08-06",
-    "gpt-3.5-turbo-1106",
-    "gpt-3.5-turbo-instruct-0914",
-    "gpt-4o",
-    "gpt-4-turbo-2024-04-09",
-    "gpt-4-turbo",
-    "gpt-4-0613",
-    "gpt-3.5-turbo-0125",
-    "gpt-4",
-    "gpt-3.5-turbo-instruct",
-    "gpt-3.5-turbo",
-    "gpt-4o-mini-2024-07-18",
-    "gpt-4o-mini"
-]
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+# 모델별 컨텍스트 윈도우 크기(토큰)
+OPENAI_MODELS: Dict[str, int] = {
+    "gpt-4-1106-preview": 128000,
+    "gpt-4o-2024-05-13": 128000,
+    "gpt-4-0125-preview": 128000,
+    "gpt-4-turbo-preview": 128000,
+    "gpt-3.5-turbo-16k": 16385,
+    "gpt-4o-2024-08-06": 128000,
+    "gpt-3.5-turbo-1106": 16385,
+    "gpt-3.5-turbo-instruct-0914": 4096,
+    "gpt-4o": 128000,
+    "gpt-4-turbo-2024-04-09": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-0613": 8192,
+    "gpt-3.5-turbo-0125": 16385,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo-instruct": 4096,
+    "gpt-3.5-turbo": 16385,
+    "gpt-4o-mini-2024-07-18": 128000,
+    "gpt-4o-mini": 128000,
+}
+
+DEFAULT_CONTEXT_WINDOW = 4096
+
+# map 단계 한 번의 호출에 넣을 최대 토큰 수. 컨텍스트 윈도우가 커도 한 호출이 너무
+# 길어지지 않도록 제한합니다.
+CHUNK_TOKEN_LIMIT = 8000
 
 
 def get_available_models() -> List[str]:
-    return OPENAI_MODELS
+    return list(OPENAI_MODELS)
 
 
-def load_llm(model: str) -> BaseLLM:
+def get_chunk_token_budget(model: str) -> int:
+    """map 단계 조각의 토큰 예산. 프롬프트와 응답을 위해 컨텍스트의 절반을 남깁니다."""
+    context_window = OPENAI_MODELS.get(model, DEFAULT_CONTEXT_WINDOW)
+    return min(context_window // 2, CHUNK_TOKEN_LIMIT)
+
+
+def load_llm(model: str) -> "BaseChatModel":
     available_models = get_available_models()
     if model not in available_models:
         raise ValueError(
@@ -38,6 +51,9 @@ def load_llm(model: str) -> BaseLLM:
             f"사용 가능한 모델: {', '.join(available_models)}")
 
     if model.startswith("gpt"):
+        # langchain_openai는 불러오는 데 오래 걸리므로 LLM이 실제로 필요할 때 불러옵니다.
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(model=model, openai_api_key=os.getenv("OPENAI_API_KEY"))
     else:
         raise ValueError(f"지원되지 않는 모델 유형입니다: {model}")
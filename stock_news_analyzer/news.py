@@ -0,0 +1,147 @@
+"""Compact news record for stock news analyzer."""
+import re
+import sys
+from datetime import datetime
+from typing import Any, Iterator, Mapping, Tuple
+
+__all__ = ["NewsItem", "extract_article_info", "parse_article_link"]
+
+DATE_FORMAT = "%Y.%m.%d %H:%M"
+
+ARTICLE_LINK = "https://n.news.naver.com/mnews/article/{:03d}/{:010d}"
+
+# article_id는 10자리이므로 `office_id * ARTICLE_ID_BASE + article_id`는 64비트 정수 하나에
+# 겹치지 않게 들어갑니다.
+ARTICLE_ID_BASE = 10 ** 10
+
+# 기사 링크(`.../article/{office_id}/{article_id}`)와 목록 페이지의 기사 href
+# (`...?article_id=...&office_id=...`)
+ARTICLE_PATH = re.compile(r'/article/(\d+)/(\d+)')
+LISTING_ARTICLE = re.compile(r'article_id=(\d+)&office_id=(\d+)')
+
+
+def parse_article_link(link: str) -> Tuple[str, str]:
+    """`https://n.news.naver.com/mnews/article/{office_id}/{article_id}`에서 ID를 꺼냅니다.
+
+    기사 링크가 아니면 ('', '')을 반환합니다.
+    """
+    match = ARTICLE_PATH.search(link)
+    if match:
+        return match.group(1), match.group(2)
+    return '', ''
+
+
+def extract_article_info(href: str) -> Tuple[str, str]:
+    """목록 페이지의 기사 href에서 (office_id, article_id)를 꺼냅니다. 없으면 ('', '')."""
+    match = LISTING_ARTICLE.search(href)
+    if match:
+        return match.group(2), match.group(1)
+    return '', ''
+
+
+class NewsItem(Mapping[str, Any]):
+    """목록 페이지의 뉴스 하나.
+
+    뉴스를 수백만 개 모아도 메모리를 적게 쓰도록 `__slots__`에 ID는 정수로, 날짜는
+    datetime으로 저장하고 언론사 이름은 intern합니다. 기존 코드와 함께 쓸 수 있도록
+    'date', 'source', 'title', 'link' 키를 가진 읽기 전용 Mapping처럼 동작하며, 'date'와
+    'link'는 읽을 때 만듭니다. 같은 기사인지는 (office_id, article_id)로 판단합니다.
+
+    네이버 뉴스의 office_id는 3자리, article_id는 10자리이므로 링크는 그 길이로 만듭니다.
+
+    Args:
+        office_id (int): 언론사 ID.
+        article_id (int): 기사 ID.
+        published (datetime): 기사 날짜(분 단위).
+        source (str): 언론사 이름.
+        title (str): 제목.
+    """
+
+    __slots__ = ("office_id", "article_id", "published", "source", "title")
+
+    KEYS = ("date", "source", "title", "link")
+
+    def __init__(
+        self,
+        office_id: int,
+        article_id: int,
+        published: datetime,
+        source: str,
+        title: str,
+    ) -> None:
+        self.office_id = office_id
+        self.article_id = article_id
+        self.published = published
+        self.source = sys.intern(source)
+        self.title = title
+
+    @classmethod
+    def from_dict(cls, news: Mapping[str, Any]) -> "NewsItem":
+        """'date', 'source', 'title', 'link' 키를 가진 뉴스로 만듭니다.
+
+        Raises:
+            ValueError: 링크나 날짜 형식이 잘못되었을 때.
+        """
+        if isinstance(news, NewsItem):
+            return news
+        office_id, article_id = parse_article_link(news["link"])
+        if not office_id:
+            raise ValueError(f"기사 링크가 아닙니다: {news['link']}")
+        return cls(
+            int(office_id),
+            int(article_id),
+            datetime.strptime(news["date"], DATE_FORMAT),
+            news.get("source") or "",
+            news["title"],
+        )
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return self.office_id, self.article_id
+
+    @property
+    def packed_key(self) -> int:
+        return self.office_id * ARTICLE_ID_BASE + self.article_id
+
+    @property
+    def date(self) -> str:
+        return self.published.strftime(DATE_FORMAT)
+
+    @property
+    def link(self) -> str:
+        return ARTICLE_LINK.format(self.office_id, self.article_id)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "date":
+            return self.date
+        if key == "source":
+            return self.source
+        if key == "title":
+            return self.title
+        if key == "link":
+            return self.link
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __hash__(self) -> int:
+        return hash((self.office_id, self.article_id))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NewsItem):
+            return self.key == other.key
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.date!r}, {self.source!r}, {self.title!r}, {self.link!r})"
+
+    def __getstate__(self) -> Tuple[int, int, datetime, str, str]:
+        return self.office_id, self.article_id, self.published, self.source, self.title
+
+    def __setstate__(self, state: Tuple[int, int, datetime, str, str]) -> None:
+        # 작업 프로세스에서 받은 언론사 이름도 intern되도록 생성자를 거칩니다.
+        NewsItem.__init__(self, *state)
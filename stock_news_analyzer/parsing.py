@@ -0,0 +1,89 @@
+"""Article parsing and an optional worker pool that keeps parsing off the event loop.
+
+이 모듈은 프로세스 풀의 작업 프로세스에서도 불러오므로 LLM 관련 패키지를 불러오지 않습니다.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import Any, Callable, Optional, Type, TypeVar
+
+import bs4
+
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["PARSE_EXECUTORS", "ParsePool", "parse_article"]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+PARSE_EXECUTORS = ("process", "thread")
+
+ARTICLE_STRAINER = bs4.SoupStrainer(
+    "div",
+    attrs={"class": ["newsct_article _article_body", "media_end_head_title"]},
+)
+
+
+def parse_article(html: str) -> str:
+    return bs4.BeautifulSoup(html, "html.parser", parse_only=ARTICLE_STRAINER).get_text()
+
+
+class ParsePool:
+    """HTML 파싱을 이벤트 루프 밖에서 실행합니다.
+
+    파싱은 CPU를 쓰므로 이벤트 루프에서 실행하면 그동안 다른 요청이 모두 멈춥니다.
+    `workers`가 1 이상이면 파싱을 작업 프로세스(또는 스레드)로 보내 코어 수만큼 나눠
+    처리합니다. 작업자에게는 HTML만 보내고 파싱한 결과만 돌려받습니다. `html.parser`를
+    쓰는 본문 파싱은 GIL을 잡고 있으므로 "process"를, GIL을 놓는 lxml 목록 파싱만
+    보낸다면 "thread"를 사용할 수 있습니다.
+
+    Args:
+        workers (int, optional): 작업자 수. 0이면 이벤트 루프에서 바로 파싱합니다.
+        executor (str, optional): "process" 또는 "thread".
+    """
+
+    def __init__(self, workers: int = 0, executor: str = "process") -> None:
+        if executor not in PARSE_EXECUTORS:
+            raise ValueError(f"알 수 없는 실행기입니다: {executor}")
+        self.workers = max(0, workers)
+        self.executor_type = executor
+        self._executor: Optional[Executor] = None
+        if self.workers == 0:
+            return
+        if executor == "thread":
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="parse")
+        else:
+            # 이벤트 루프와 연결 풀의 스레드를 복제하지 않도록 fork 대신 spawn을 사용합니다.
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn"))
+        logger.debug(f"파싱 작업자 {self.workers}개({executor})를 사용합니다.")
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """`func(*args)`를 작업자에서 실행합니다. 작업자가 없으면 바로 실행합니다.
+
+        프로세스 풀에서는 `func`와 인자, 반환값을 pickle할 수 있어야 합니다.
+        """
+        if self._executor is None:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "ParsePool":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        # 남은 작업자를 기다리는 동안 이벤트 루프를 막지 않습니다.
+        await asyncio.to_thread(self.close)
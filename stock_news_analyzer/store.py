@@ -0,0 +1,258 @@
+"""SQLite news store with an FTS5 full-text index."""
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from stock_news_analyzer.news import parse_article_link
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["NewsStore"]
+
+logger = get_logger(__name__)
+
+# 쓰기를 이 개수만큼 모아 하나의 트랜잭션으로 저장합니다.
+DEFAULT_BATCH_SIZE = 256
+
+# trigram 토크나이저는 세 글자보다 짧은 검색어를 색인으로 찾지 못합니다.
+MIN_MATCH_LENGTH = 3
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS articles ("
+    " id INTEGER PRIMARY KEY,"
+    " office_id TEXT NOT NULL,"
+    " article_id TEXT NOT NULL,"
+    " link TEXT NOT NULL,"
+    " title TEXT NOT NULL,"
+    " body TEXT,"
+    " UNIQUE (office_id, article_id))",
+    "CREATE TABLE IF NOT EXISTS news ("
+    " company_code TEXT NOT NULL,"
+    " article INTEGER NOT NULL REFERENCES articles (id),"
+    " datetime TEXT NOT NULL,"
+    " source TEXT NOT NULL,"
+    " PRIMARY KEY (company_code, article))",
+    "CREATE INDEX IF NOT EXISTS news_company_datetime ON news (company_code, datetime)",
+    "CREATE INDEX IF NOT EXISTS news_datetime ON news (datetime)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    " title, body, content='articles', content_rowid='id', tokenize='trigram')",
+    # articles_fts는 articles의 내용을 색인만 하므로 트리거로 함께 갱신합니다.
+    "CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN"
+    " INSERT INTO articles_fts (rowid, title, body) VALUES (new.id, new.title, new.body);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN"
+    " INSERT INTO articles_fts (articles_fts, rowid, title, body)"
+    " VALUES ('delete', old.id, old.title, old.body);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN"
+    " INSERT INTO articles_fts (articles_fts, rowid, title, body)"
+    " VALUES ('delete', old.id, old.title, old.body);"
+    " INSERT INTO articles_fts (rowid, title, body) VALUES (new.id, new.title, new.body);"
+    " END",
+]
+
+
+class NewsStore:
+    """뉴스 목록과 본문을 저장하는 SQLite 저장소.
+
+    `finder.get_news_link`의 뉴스는 회사 코드별로, `analyzer.fetch_news_content`의 본문은
+    기사별로 저장합니다. 제목과 본문은 FTS5(trigram) 색인으로 검색할 수 있어 네트워크 없이
+    지난 뉴스를 다시 분석하거나 검색할 수 있습니다.
+
+    쓰기는 `batch_size`개씩 모아 하나의 트랜잭션으로 저장하며, 조회 전이나 `flush`,
+    `close`를 호출할 때 남은 쓰기를 저장합니다.
+
+    Args:
+        path (str | Path): 저장 파일 경로.
+        batch_size (int, optional): 한 트랜잭션에 모을 쓰기 수.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn:
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+        self._pending_news: List[Tuple[str, str, str, str, str, str, str]] = []
+        self._pending_bodies: List[Tuple[str, str, str]] = []
+
+    def add_news(self, company_code: str, news_items: Iterable[Mapping[str, Any]]) -> None:
+        """회사의 뉴스 목록을 저장합니다. 이미 있는 뉴스는 건너뜁니다.
+
+        Args:
+            company_code (str): 회사 코드.
+            news_items (Iterable[dict[str, str]]): 'date', 'source', 'title', 'link'를 가진 뉴스.
+        """
+        for news in news_items:
+            office_id, article_id = parse_article_link(news["link"])
+            if not office_id:
+                continue
+            self._pending_news.append((
+                company_code, office_id, article_id, news["link"], news["title"],
+                news["date"], news.get("source", ""),
+            ))
+        self._flush_if_full()
+
+    def add_body(self, news: Mapping[str, Any], body: str) -> None:
+        """기사 본문을 저장합니다. 뉴스 목록보다 먼저 저장해도 됩니다."""
+        office_id, article_id = parse_article_link(news["link"])
+        if not office_id:
+            return
+        self._pending_bodies.append((body, office_id, article_id))
+        # 본문만 먼저 들어와도 저장할 수 있도록 기사 행을 만들어 둡니다.
+        self._pending_news.append((
+            "", office_id, article_id, news["link"], news.get("title", ""), "", ""))
+        self._flush_if_full()
+
+    def _flush_if_full(self) -> None:
+        if len(self._pending_news) + len(self._pending_bodies) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """모아 둔 쓰기를 하나의 트랜잭션으로 저장합니다."""
+        if not self._pending_news and not self._pending_bodies:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO articles (office_id, article_id, link, title) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (office_id, article_id) DO UPDATE SET title = excluded.title"
+                " WHERE excluded.title != '' AND articles.title != excluded.title",
+                [news[1:5] for news in self._pending_news],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO news (company_code, article, datetime, source)"
+                " SELECT ?, id, ?, ? FROM articles WHERE office_id = ? AND article_id = ?",
+                [
+                    (code, datetime, source, office_id, article_id)
+                    for code, office_id, article_id, _, _, datetime, source in self._pending_news
+                    if code
+                ],
+            )
+            self._conn.executemany(
+                "UPDATE articles SET body = ?"
+                " WHERE office_id = ? AND article_id = ? AND body IS NOT ?",
+                [(body, office_id, article_id, body)
+                 for body, office_id, article_id in self._pending_bodies],
+            )
+        logger.debug(
+            f"뉴스 {len(self._pending_news)}개, 본문 {len(self._pending_bodies)}개를 저장했습니다.")
+        self._pending_news.clear()
+        self._pending_bodies.clear()
+
+    def get_body(self, link: str) -> Optional[str]:
+        """저장된 기사 본문. 없으면 None."""
+        office_id, article_id = parse_article_link(link)
+        # 본문을 읽을 때마다 flush하면 쓰기를 모으는 의미가 없으므로 대기 중인 본문을 먼저 봅니다.
+        for body, pending_office_id, pending_article_id in reversed(self._pending_bodies):
+            if (pending_office_id, pending_article_id) == (office_id, article_id):
+                return body
+        row = self._conn.execute(
+            "SELECT body FROM articles WHERE office_id = ? AND article_id = ?",
+            (office_id, article_id),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def news(
+        self,
+        company_code: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        with_body: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """회사의 저장된 뉴스를 최신순으로 반환합니다.
+
+        Args:
+            company_code (str): 회사 코드.
+            start_date (date | None, optional): 시작 날짜.
+            end_date (date | None, optional): 종료 날짜.
+            with_body (bool, optional): 각 뉴스에 'body'를 포함할지 여부.
+        Returns:
+            list[dict[str, str]]: 'date', 'source', 'title', 'link'를 가진 뉴스 목록.
+        """
+        return self._select("", [], company_code, start_date, end_date, with_body, None)
+
+    def search(
+        self,
+        query: str,
+        company_code: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        with_body: bool = False,
+        limit: Optional[int] = 100,
+    ) -> List[Dict[str, Any]]:
+        """제목이나 본문에 `query`가 들어간 뉴스를 최신순으로 반환합니다.
+
+        Args:
+            query (str): 찾을 문자열.
+            company_code (str | None, optional): 회사 코드. 없으면 모든 회사에서 찾습니다.
+            start_date (date | None, optional): 시작 날짜.
+            end_date (date | None, optional): 종료 날짜.
+            with_body (bool, optional): 각 뉴스에 'body'를 포함할지 여부.
+            limit (int | None, optional): 최대 결과 수.
+        Returns:
+            list[dict[str, str]]: 뉴스 목록. `company_code`가 없으면 'company_code'가 추가됩니다.
+        """
+        if len(query) >= MIN_MATCH_LENGTH:
+            # 큰따옴표로 감싸 검색어 전체를 하나의 문자열로 찾습니다.
+            condition = "articles.id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)"
+            params = ['"' + query.replace('"', '""') + '"']
+        else:
+            # 짧은 검색어는 색인을 쓸 수 없으므로 LIKE로 찾습니다.
+            condition = (
+                "(articles.title LIKE ? ESCAPE '!' OR articles.body LIKE ? ESCAPE '!')")
+            escaped = query.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+            params = [f"%{escaped}%", f"%{escaped}%"]
+        return self._select(
+            condition, params, company_code, start_date, end_date, with_body, limit)
+
+    def _select(
+        self,
+        condition: str,
+        params: List[Any],
+        company_code: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        with_body: bool,
+        limit: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        self.flush()
+        conditions = [condition] if condition else []
+        if company_code is not None:
+            conditions.append("news.company_code = ?")
+            params.append(company_code)
+        if start_date is not None:
+            conditions.append("news.datetime >= ?")
+            params.append(start_date.strftime("%Y.%m.%d"))
+        if end_date is not None:
+            # 'YYYY.MM.DD HH:MM'은 'YYYY.MM.DD'로 시작하므로 다음 글자보다 작으면 그날입니다.
+            conditions.append("news.datetime < ?")
+            params.append(end_date.strftime("%Y.%m.%d") + "~")
+
+        query = (
+            "SELECT news.company_code, news.datetime, news.source, articles.title,"
+            " articles.link, articles.body"
+            " FROM news JOIN articles ON articles.id = news.article"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY news.datetime DESC, articles.office_id, articles.article_id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        results = []
+        for code, datetime, source, title, link, body in self._conn.execute(query, params):
+            news = {"date": datetime, "source": source, "title": title, "link": link}
+            if company_code is None:
+                news["company_code"] = code
+            if with_body:
+                news["body"] = body
+            results.append(news)
+        return results
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
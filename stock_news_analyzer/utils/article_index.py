@@ -0,0 +1,192 @@
+"""Persistent cross-run index of processed articles for stock news analyzer."""
+import math
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, List, Mapping, Optional, Set, Union
+
+from stock_news_analyzer.news import NewsItem
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["ArticleIndex", "BloomFilter", "article_key"]
+
+logger = get_logger(__name__)
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value: int) -> int:
+    """splitmix64의 마지막 단계. 연속된 기사 ID도 고르게 흩어 놓습니다."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+def article_key(news: Mapping[str, Any]) -> Optional[int]:
+    """뉴스의 `office_id * 10**10 + article_id` 키. 기사 링크가 아니면 None."""
+    if not isinstance(news, NewsItem):
+        try:
+            news = NewsItem.from_dict(news)
+        except (KeyError, ValueError):
+            return None
+    return news.packed_key
+
+
+class BloomFilter:
+    """정수 키의 Bloom filter.
+
+    `capacity`개를 넣었을 때 거짓 양성 비율이 `error_rate`가 되도록 크기를 정하며, 그 뒤로는
+    크기가 늘지 않으므로 메모리 사용량은 일정합니다(100만 개, 1%에 약 1.2MB).
+
+    Args:
+        capacity (int): 넣을 것으로 예상하는 키 수.
+        error_rate (float, optional): `capacity`개일 때의 거짓 양성 비율.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: int) -> List[int]:
+        # 두 해시의 선형 결합으로 k개의 위치를 만듭니다(Kirsch-Mitzenmacher).
+        h1 = _mix64(key & _MASK64)
+        h2 = _mix64(h1 ^ 0x9E3779B97F4A7C15) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: int) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: int) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class ArticleIndex:
+    """이미 처리한 기사를 (office_id, article_id)로 기억하는 색인.
+
+    여러 회사에 함께 실린 기사나 겹치는 기간의 기사를 다시 가져오고 요약하지 않도록,
+    `finder`와 `analyzer`가 네트워크나 LLM 작업 전에 확인합니다. 키는 SQLite 파일에
+    정확히 저장하고, 메모리에는 Bloom filter만 두어 처음 보는 기사는 파일을 읽지 않고 O(1)에
+    판단합니다. Bloom filter가 있다고 답한 경우에만 파일에서 확인하므로 잘못 건너뛰는
+    기사는 없습니다.
+
+    Bloom filter의 비트 배열은 닫을 때 같은 파일에 저장하고, 다음 실행에서 저장된 키 수가
+    같으면 그대로 불러옵니다. 다른 프로세스가 키를 추가했거나 비정상 종료로 저장하지 못했다면
+    키를 모두 읽어 다시 만듭니다.
+
+    Args:
+        path (str | Path): 저장 파일 경로.
+        capacity (int, optional): Bloom filter의 예상 키 수. 크기는 이 값으로 고정되며, 키가 더
+            많아지면 거짓 양성이 늘어 파일 조회가 잦아질 뿐 결과는 정확합니다.
+        error_rate (float, optional): Bloom filter의 거짓 양성 비율.
+        batch_size (int, optional): 모아서 한 번에 저장할 키 수.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        batch_size: int = 256,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " key INTEGER PRIMARY KEY,"
+                " added_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bloom ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0),"
+                " size INTEGER NOT NULL,"
+                " hash_count INTEGER NOT NULL,"
+                " count INTEGER NOT NULL,"
+                " bits BLOB NOT NULL)"
+            )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        if self._count > capacity:
+            logger.warning(
+                f"처리한 기사 {self._count}개가 Bloom filter 용량 {capacity}개를 넘었습니다. "
+                "capacity를 늘리면 파일 조회가 줄어듭니다."
+            )
+        self._bloom = BloomFilter(capacity, error_rate)
+        if not self._load_bloom():
+            self._rebuild_bloom()
+        self._pending: Set[int] = set()
+        logger.debug(f"처리한 기사 {self._count}개를 불러왔습니다: {self.path}")
+
+    def _load_bloom(self) -> bool:
+        """저장된 비트 배열을 불러옵니다. 크기나 키 수가 맞지 않으면 False."""
+        row = self._conn.execute(
+            "SELECT size, hash_count, count, bits FROM bloom WHERE id = 0").fetchone()
+        if row is None:
+            return False
+        size, hash_count, count, bits = row
+        if (size, hash_count, count) != (self._bloom.size, self._bloom.hash_count, self._count):
+            return False
+        self._bloom.bits = bytearray(bits)
+        return True
+
+    def _rebuild_bloom(self) -> None:
+        for (key,) in self._conn.execute("SELECT key FROM articles"):
+            self._bloom.add(key)
+
+    def _save_bloom(self) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bloom (id, size, hash_count, count, bits)"
+                " VALUES (0, ?, ?, ?, ?)",
+                (self._bloom.size, self._bloom.hash_count, self._count, bytes(self._bloom.bits)),
+            )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: int) -> bool:
+        if key not in self._bloom:
+            return False
+        if key in self._pending:
+            return True
+        row = self._conn.execute("SELECT 1 FROM articles WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def seen(self, news: Mapping[str, Any]) -> bool:
+        """이미 처리한 기사인지 확인합니다. 기사 링크가 아니면 False."""
+        key = article_key(news)
+        return key is not None and key in self
+
+    def add(self, news: Mapping[str, Any]) -> bool:
+        """기사를 처리한 것으로 기록합니다. 새로 기록했으면 True."""
+        key = article_key(news)
+        if key is None or key in self:
+            return False
+        self._bloom.add(key)
+        self._pending.add(key)
+        self._count += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO articles (key, added_at) VALUES (?, ?)",
+                [(key, now) for key in self._pending],
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._save_bloom()
+        self._conn.close()
@@ -0,0 +1,255 @@
+"""On-disk caches for stock news analyzer."""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["DEFAULT_CACHE_DIR", "DiskCache", "ResponseCache", "ResultCache", "SummaryCache"]
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("STOCK_NEWS_ANALYZER_CACHE_DIR", Path.home() / ".cache" / "stock_news_analyzer")
+).expanduser()
+
+# URL 종류별 캐시 유지 시간(초). None이면 만료되지 않습니다.
+LISTING_TTL: Optional[float] = 5 * 60
+ARTICLE_TTL: Optional[float] = None
+DEFAULT_TTL: Optional[float] = 60 * 60
+
+LISTING_URL_PATTERN = re.compile(r"^https?://finance\.naver\.com/item/news_news\.nhn")
+ARTICLE_URL_PATTERN = re.compile(r"^https?://n\.news\.naver\.com/mnews/article/\d+/\d+")
+
+
+class DiskCache:
+    """SQLite 파일에 저장되는 크기 제한 LRU 캐시.
+
+    전체 크기가 `max_bytes`를 넘으면 가장 오래전에 사용된 항목부터 `max_bytes * low_water`
+    이하가 될 때까지 한꺼번에 삭제하므로, 가득 찬 뒤에도 저장할 때마다 삭제하지 않습니다.
+    조회 시각은 메모리에 모아 두었다가 `touch_batch`개마다, 또는 삭제하거나 닫기 전에
+    한 번에 기록합니다.
+
+    Args:
+        path (str | Path): 캐시 파일 경로.
+        max_bytes (int, optional): 캐시에 저장할 최대 바이트 수.
+        low_water (float, optional): 넘쳤을 때 줄일 크기의 `max_bytes`에 대한 비율.
+        touch_batch (int, optional): 모아서 기록할 조회 시각 수.
+    """
+
+    # 오래된 항목을 한 번에 읽어 삭제할 개수
+    EVICT_BATCH = 256
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        low_water: float = 0.9,
+        touch_batch: int = 256,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self.touch_batch = touch_batch
+        self._touched: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)")
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        self._total_bytes: int = row[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            self.delete(key)
+            self.misses += 1
+            return None
+
+        self._touched[key] = now
+        if len(self._touched) >= self.touch_batch:
+            self.flush()
+        self.hits += 1
+        return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._conn:
+            self._delete(key)
+            self._conn.execute(
+                "INSERT INTO entries (key, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), expires_at, now),
+            )
+            self._total_bytes += len(value)
+            self._evict()
+
+    def flush(self) -> None:
+        """모아 둔 조회 시각을 기록합니다."""
+        if not self._touched:
+            return
+        with self._conn:
+            self._write_touched()
+
+    def _write_touched(self) -> None:
+        self._conn.executemany(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def delete(self, key: str) -> None:
+        with self._conn:
+            self._delete(key)
+
+    def _delete(self, key: str) -> None:
+        self._touched.pop(key, None)
+        row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        target = int(self.max_bytes * self.low_water)
+        # 삭제 순서가 최근 조회를 반영하도록 조회 시각을 먼저 기록합니다.
+        self._write_touched()
+
+        # 만료된 항목을 먼저 지우고, 그래도 넘치면 오래전에 사용된 순서로 지웁니다.
+        now = time.time()
+        expired = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE expires_at <= ?", (now,)
+        ).fetchone()
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        self._total_bytes -= expired[1]
+        evicted = expired[0]
+
+        while self._total_bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT ?", (self.EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            keys = []
+            for key, size in rows:
+                if self._total_bytes <= target:
+                    break
+                keys.append((key,))
+                self._total_bytes -= size
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", keys)
+            evicted += len(keys)
+        logger.debug(f"캐시 항목 {evicted}개를 삭제했습니다: {self.path}")
+
+    @property
+    def size(self) -> int:
+        return self._total_bytes
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "bytes": self._total_bytes}
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+class ResponseCache(DiskCache):
+    """네이버 목록/기사 페이지 응답 캐시.
+
+    목록 페이지는 새 뉴스가 계속 추가되므로 짧게, 기사 본문은 office_id/article_id로
+    고정되므로 만료 없이 저장합니다.
+    """
+
+    @staticmethod
+    def ttl_for(url: str) -> Optional[float]:
+        if LISTING_URL_PATTERN.match(url):
+            return LISTING_TTL
+        if ARTICLE_URL_PATTERN.match(url):
+            return ARTICLE_TTL
+        return DEFAULT_TTL
+
+    def get_text(self, url: str) -> Optional[str]:
+        value = self.get(url)
+        return value.decode("utf-8") if value is not None else None
+
+    def set_text(self, url: str, text: str) -> None:
+        self.set(url, text.encode("utf-8"), ttl=self.ttl_for(url))
+
+
+class SummaryCache(DiskCache):
+    """본문 조각별 LLM 요약 캐시.
+
+    키는 (본문 해시, 모델 이름, 프롬프트 버전)이므로 같은 조각을 같은 모델과 프롬프트로
+    다시 요약할 때만 재사용됩니다.
+    """
+
+    @staticmethod
+    def key_for(text: str, model: str, prompt_version: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{prompt_version}:{digest}"
+
+    def get_summary(self, text: str, model: str, prompt_version: str) -> Optional[str]:
+        value = self.get(self.key_for(text, model, prompt_version))
+        return value.decode("utf-8") if value is not None else None
+
+    def set_summary(self, text: str, model: str, prompt_version: str, summary: str) -> None:
+        self.set(self.key_for(text, model, prompt_version), summary.encode("utf-8"))
+
+
+class ResultCache(DiskCache):
+    """회사별 전체 분석 결과 캐시.
+
+    키에 기사 ID 목록이 포함되므로 기간 안에 새 기사가 나타나면 자동으로 다른 키가 됩니다.
+    결과를 바꾸는 설정(`settings`)이 다르면 역시 다른 키가 됩니다.
+    """
+
+    @staticmethod
+    def key_for(
+        company: str,
+        article_ids: Iterable[str],
+        model: str,
+        prompt_versions: Iterable[str],
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        payload = json.dumps(
+            [company, sorted(set(article_ids)), model, list(prompt_versions), settings or {}],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_result(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set_result(self, key: str, result: Dict[str, Any]) -> None:
+        self.set(key, json.dumps(result, ensure_ascii=False).encode("utf-8"))
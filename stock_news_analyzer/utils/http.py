@@ -0,0 +1,39 @@
+"""Shared HTTP session for stock news analyzer."""
+import os
+
+import aiohttp
+
+__all__ = ["DEFAULT_DNS_CACHE_TTL", "DEFAULT_KEEPALIVE_TIMEOUT", "create_session"]
+
+# 목록 페이지와 기사 본문을 연달아 요청하므로 연결과 DNS 결과를 기본값보다 오래 유지합니다.
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_DNS_CACHE_TTL = 300
+
+
+def create_session(
+    limit: int = 16,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ttl_dns_cache: int = DEFAULT_DNS_CACHE_TTL,
+) -> aiohttp.ClientSession:
+    """크롤링과 기사 본문 요청에 함께 쓰는 HTTP 세션을 만듭니다.
+
+    환경 변수 `USER_AGENT`가 설정되어 있으면 모든 요청에 사용합니다.
+
+    Args:
+        limit (int, optional): 최대 동시 연결 수. 0이면 제한하지 않습니다.
+        limit_per_host (int, optional): 호스트 하나에 대한 최대 동시 연결 수.
+            0이면 제한하지 않습니다.
+        keepalive_timeout (float, optional): 사용하지 않는 연결을 유지할 시간(초).
+        ttl_dns_cache (int, optional): DNS 조회 결과를 유지할 시간(초).
+    Returns:
+        aiohttp.ClientSession: 새 세션. 호출한 쪽에서 닫아야 합니다.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+    headers = {"User-Agent": os.environ["USER_AGENT"]} if "USER_AGENT" in os.environ else None
+    return aiohttp.ClientSession(connector=connector, headers=headers)
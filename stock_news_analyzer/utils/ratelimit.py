@@ -0,0 +1,343 @@
+"""Per-host throttling, retry and circuit breaking for stock news analyzer."""
+import asyncio
+import random
+import time
+from collections import Counter
+from types import TracebackType
+from typing import Dict, Mapping, Optional, Tuple, Type
+
+import aiohttp
+from yarl import URL
+
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = [
+    "AIMDController",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "HTTPStatusError",
+    "HostThrottle",
+    "Throttle",
+    "TokenBucket",
+]
+
+logger = get_logger(__name__)
+
+# 잠시 뒤 다시 시도하면 성공할 수 있는 응답 코드
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """호스트의 회로가 열려 있어 요청을 보내지 않았습니다."""
+
+
+class HTTPStatusError(Exception):
+    """다시 시도해도 소용없는 응답 코드(403, 404 등)를 받았습니다."""
+
+    def __init__(self, status: int, url: str) -> None:
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+        self.url = url
+
+
+class RetryableStatusError(Exception):
+    def __init__(self, status: int, retry_after: Optional[float] = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """초당 `rate`개의 토큰이 채워지고 최대 `capacity`개까지 쌓이는 토큰 버킷.
+
+    Args:
+        rate (float): 초당 요청 수. 0이면 제한하지 않습니다.
+        capacity (float | None, optional): 한 번에 몰아서 보낼 수 있는 최대 요청 수.
+            없으면 `rate`와 같습니다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AIMDController:
+    """응답 시간과 오류에 따라 동시 요청 수를 조절합니다.
+
+    요청이 `latency_target`초 안에 성공할 때마다 창을 `increase / 창`만큼 늘려 창 하나
+    분량의 요청이 성공하면 1이 늘어나고, 오류나 느린 응답이 나오면 창을 `decrease`배로
+    줄입니다. 한 번의 혼잡에 여러 요청이 동시에 실패해도 한 번만 줄이도록, 줄인 뒤
+    `latency_target`초 동안은 다시 줄이지 않습니다.
+
+    Args:
+        initial (float, optional): 처음 동시 요청 수.
+        minimum (int, optional): 최소 동시 요청 수.
+        maximum (int, optional): 최대 동시 요청 수.
+        increase (float, optional): 창 하나 분량의 요청이 성공할 때 늘릴 동시 요청 수.
+        decrease (float, optional): 혼잡할 때 곱할 값.
+        latency_target (float, optional): 이보다 오래 걸린 응답은 혼잡으로 봅니다(초).
+    """
+
+    def __init__(
+        self,
+        initial: float = 4,
+        minimum: int = 1,
+        maximum: int = 32,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target: float = 2.0,
+    ) -> None:
+        self.window = float(min(max(initial, minimum), maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self._decreased_at = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return max(self.minimum, int(self.window))
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.latency_target:
+            self.on_congestion()
+            return
+        self.window = min(float(self.maximum), self.window + self.increase / self.window)
+
+    def on_congestion(self) -> None:
+        now = time.monotonic()
+        if now - self._decreased_at < self.latency_target:
+            return
+        self._decreased_at = now
+        self.window = max(float(self.minimum), self.window * self.decrease)
+        logger.debug(f"동시 요청 수를 {self.limit}개로 줄였습니다.")
+
+
+class CircuitBreaker:
+    """연속으로 `failure_threshold`번 실패하면 `reset_timeout`초 동안 요청을 막습니다.
+
+    시간이 지나면 요청 하나만 시험 삼아 보내고(half-open), 성공하면 요청을 다시 허용합니다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self._trial_in_flight:
+                logger.warning(f"연속 {self.failures}번 실패하여 {self.reset_timeout}초 동안 "
+                               "요청을 멈춥니다.")
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """시험 요청이 결과 없이 끝났을 때(취소 등) 다음 요청이 다시 시험할 수 있게 합니다."""
+        self._trial_in_flight = False
+
+
+class HostThrottle:
+    """호스트 하나의 토큰 버킷, 동시 요청 수 조절, 회로 차단기."""
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        controller: AIMDController,
+        breaker: CircuitBreaker,
+    ) -> None:
+        self.bucket = bucket
+        self.controller = controller
+        self.breaker = breaker
+
+
+class Throttle:
+    """호스트별로 요청 속도를 조절하고 실패한 요청을 다시 시도합니다.
+
+    호스트마다 토큰 버킷으로 초당 요청 수를, AIMD로 동시 요청 수를 제한하므로 처리량은
+    호스트가 견디는 가장 높은 수준에 맞춰집니다. 연결 오류, 시간 초과, 429/5xx 응답은
+    지수적으로 늘어나는 임의 지연(full jitter) 뒤에 최대 `max_retries`번 다시 시도하며,
+    `Retry-After` 헤더가 있으면 그만큼 기다립니다. 연속으로 실패한 호스트는 회로 차단기가
+    잠시 막아 `CircuitOpenError`를 냅니다.
+
+    Args:
+        rate (float, optional): 호스트별 초당 최대 요청 수. 0이면 제한하지 않습니다.
+        burst (float | None, optional): 호스트별로 한 번에 몰아서 보낼 수 있는 요청 수.
+        initial_concurrency (int, optional): 호스트별 처음 동시 요청 수.
+        max_concurrency (int, optional): 호스트별 최대 동시 요청 수.
+        latency_target (float, optional): 이보다 오래 걸린 응답은 혼잡으로 봅니다(초).
+        timeout (float, optional): 요청 하나의 시간 제한(초).
+        max_retries (int, optional): 최대 재시도 횟수.
+        backoff_base (float, optional): 첫 재시도 지연의 상한(초).
+        backoff_max (float, optional): 재시도 지연의 최대값(초).
+        failure_threshold (int, optional): 회로를 열 연속 실패 수.
+        reset_timeout (float, optional): 회로를 열어 둘 시간(초).
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: Optional[float] = None,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 16,
+        latency_target: float = 2.0,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hosts: Dict[str, HostThrottle] = {}
+        # 재시도하지 않는 2xx 이외의 응답 코드별 횟수
+        self.status_errors: Counter[int] = Counter()
+
+    def for_host(self, host: str) -> HostThrottle:
+        if host not in self.hosts:
+            self.hosts[host] = HostThrottle(
+                TokenBucket(self.rate, self.burst),
+                AIMDController(
+                    self.initial_concurrency, maximum=self.max_concurrency,
+                    latency_target=self.latency_target),
+                CircuitBreaker(self.failure_threshold, self.reset_timeout),
+            )
+        return self.hosts[host]
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def request(self, session: aiohttp.ClientSession, url: str) -> Tuple[int, str]:
+        """`url`을 GET으로 요청해 (상태 코드, 본문)을 반환합니다.
+
+        Raises:
+            CircuitOpenError: 호스트의 회로가 열려 있을 때.
+            HTTPStatusError: 재시도하지 않는 2xx 이외의 응답을 받았을 때.
+            aiohttp.ClientError | asyncio.TimeoutError | RetryableStatusError:
+                재시도를 모두 실패했을 때 마지막 오류.
+        """
+        host = self.for_host(URL(url).host or "")
+        for attempt in range(self.max_retries + 1):
+            trial = host.breaker.state == "half_open"
+            if not host.breaker.allow():
+                raise CircuitOpenError(f"요청을 잠시 멈춘 호스트입니다: {url}")
+
+            retry_after = None
+            try:
+                await host.bucket.acquire()
+                async with host.controller:
+                    started_at = time.monotonic()
+                    try:
+                        async with session.get(url, timeout=self.timeout) as response:
+                            text = await response.text()
+                            if response.status in RETRY_STATUSES:
+                                raise RetryableStatusError(
+                                    response.status, parse_retry_after(response.headers))
+                            if not 200 <= response.status < 300:
+                                # 차단이나 오류 페이지를 빈 목록으로 파싱하지 않도록 알립니다.
+                                # 호스트의 혼잡과는 관계없으므로 성공이나 실패로 세지 않습니다.
+                                self.status_errors[response.status] += 1
+                                raise HTTPStatusError(response.status, url)
+                    except (aiohttp.ClientError, asyncio.TimeoutError, RetryableStatusError) as e:
+                        host.controller.on_congestion()
+                        host.breaker.record_failure()
+                        if attempt == self.max_retries:
+                            raise
+                        if isinstance(e, RetryableStatusError):
+                            retry_after = e.retry_after
+                        logger.debug(f"요청 실패({e!r}), 다시 시도합니다: {url}")
+                    else:
+                        host.controller.on_success(time.monotonic() - started_at)
+                        host.breaker.record_success()
+                        return response.status, text
+            except BaseException:
+                # 취소되거나 예상하지 못한 오류로 끝난 시험 요청이 회로를 계속 막지 않도록 합니다.
+                if trial:
+                    host.breaker.release_trial()
+                raise
+
+            await asyncio.sleep(
+                min(retry_after, self.backoff_max) if retry_after is not None
+                else self.backoff(attempt))
+        raise AssertionError("unreachable")
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """`Retry-After` 헤더의 초 단위 값. 없거나 날짜 형식이면 None."""
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
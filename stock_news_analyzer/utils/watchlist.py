@@ -0,0 +1,23 @@
+"""Watchlist file reader shared by the CLI and backfill."""
+from pathlib import Path
+from typing import List, Union
+
+__all__ = ["read_watchlist"]
+
+
+def read_watchlist(path: Union[str, Path]) -> List[str]:
+    """관심 종목 파일을 읽습니다.
+
+    한 줄에 회사 코드 또는 이름 하나를 적으며, 빈 줄과 '#'으로 시작하는 주석은 무시합니다.
+
+    Args:
+        path (str | Path): 관심 종목 파일 경로.
+    Returns:
+        list[str]: 중복을 제외한 회사 목록.
+    """
+    companies: List[str] = []
+    for line in Path(path).expanduser().read_text(encoding="utf-8").splitlines():
+        company = line.split("#", 1)[0].strip()
+        if company and company not in companies:
+            companies.append(company)
+    return companies
@@ -0,0 +1,134 @@
+"""Per-company crawl watermark for stock news analyzer."""
+import sqlite3
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from stock_news_analyzer.news import DATE_FORMAT, NewsItem
+from stock_news_analyzer.utils.logger import get_logger
+
+__all__ = ["WatermarkStore"]
+
+logger = get_logger(__name__)
+
+
+class WatermarkStore:
+    """회사 코드별로 이미 본 뉴스와 가장 최근 뉴스(워터마크)를 SQLite 파일에 저장합니다.
+
+    목록은 최신순이므로 이미 본 뉴스가 나오면 그 뒤는 모두 이전에 본 뉴스입니다.
+    `finder.iter_news_links`는 이를 이용해 새 뉴스만 가져오고 페이지 요청을 멈춥니다.
+
+    Args:
+        path (str | Path): 저장 파일 경로.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                " code TEXT PRIMARY KEY,"
+                " date TEXT NOT NULL,"
+                " office_id TEXT NOT NULL,"
+                " article_id TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                " code TEXT NOT NULL,"
+                " office_id TEXT NOT NULL,"
+                " article_id TEXT NOT NULL,"
+                " date TEXT NOT NULL,"
+                " source TEXT NOT NULL,"
+                " title TEXT NOT NULL,"
+                " link TEXT NOT NULL,"
+                " PRIMARY KEY (code, office_id, article_id))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS history_code_date ON history (code, date)")
+
+    def watermark(self, code: str) -> Optional[Tuple[str, str, str]]:
+        """가장 최근에 본 뉴스의 (날짜, office_id, article_id). 본 적이 없으면 None."""
+        row = self._conn.execute(
+            "SELECT date, office_id, article_id FROM watermarks WHERE code = ?", (code,)
+        ).fetchone()
+        return (row[0], row[1], row[2]) if row is not None else None
+
+    def is_seen(self, code: str, office_id: str, article_id: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM history WHERE code = ? AND office_id = ? AND article_id = ?",
+            (code, office_id, article_id),
+        ).fetchone()
+        return row is not None
+
+    def record(self, code: str, news_items: Iterable[Tuple[str, str, Mapping[str, Any]]]) -> None:
+        """새로 본 뉴스를 저장하고 워터마크를 갱신합니다.
+
+        Args:
+            code (str): 회사 코드.
+            news_items (Iterable[tuple[str, str, dict]]): (office_id, article_id, 뉴스) 목록.
+        """
+        rows = [
+            (code, office_id, article_id, news["date"], news["source"], news["title"],
+             news["link"])
+            for office_id, article_id, news in news_items
+        ]
+        if not rows:
+            return
+
+        # 날짜는 'YYYY.MM.DD HH:MM' 형식이므로 문자열 비교로 최신 뉴스를 고를 수 있습니다.
+        _, office_id, article_id, newest_date, *_ = max(rows, key=lambda row: row[3])
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO history"
+                " (code, office_id, article_id, date, source, title, link)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT INTO watermarks (code, date, office_id, article_id, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (code) DO UPDATE SET"
+                " date = excluded.date, office_id = excluded.office_id,"
+                " article_id = excluded.article_id, updated_at = excluded.updated_at"
+                " WHERE excluded.date >= watermarks.date",
+                (code, newest_date, office_id, article_id, time.time()),
+            )
+        logger.debug(f"[{code}] 새 뉴스 {len(rows)}개를 기록했습니다. 워터마크: {newest_date}")
+
+    def history(
+        self,
+        code: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[NewsItem]:
+        """저장된 뉴스를 최신순으로 반환합니다.
+
+        Args:
+            code (str): 회사 코드.
+            start_date (date | None, optional): 시작 날짜.
+            end_date (date | None, optional): 종료 날짜.
+        Returns:
+            list[NewsItem]: 뉴스 목록.
+        """
+        query = "SELECT office_id, article_id, date, source, title FROM history WHERE code = ?"
+        params: List[str] = [code]
+        if start_date is not None:
+            query += " AND date >= ?"
+            params.append(start_date.strftime("%Y.%m.%d"))
+        if end_date is not None:
+            # 'YYYY.MM.DD HH:MM'은 'YYYY.MM.DD'로 시작하므로 다음 글자보다 작으면 그날입니다.
+            query += " AND date < ?"
+            params.append(end_date.strftime("%Y.%m.%d") + "~")
+        query += " ORDER BY date DESC, office_id, article_id"
+        return [
+            NewsItem(int(row[0]), int(row[1]), datetime.strptime(row[2], DATE_FORMAT),
+                     row[3], row[4])
+            for row in self._conn.execute(query, params)
+        ]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,44 @@
+import asyncio
+from typing import Any, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+class FakeChatModel(BaseChatModel):
+    """프롬프트 앞부분을 돌려주고 호출 수와 최대 동시 실행 수를 기록하는 테스트용 모델."""
+
+    model_name: str = "fake-model"
+    delay: float = 0.0
+    calls: int = 0
+    active: int = 0
+    peak: int = 0
+    prompts: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def get_num_tokens(self, text: str) -> int:
+        return len(text.split())
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        prompt = str(messages[-1].content)
+        self.calls += 1
+        self.prompts.append(prompt)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"요약{self.calls}"))])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        return self._respond(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._respond(messages)
+        finally:
+            self.active -= 1
@@ -0,0 +1,288 @@
+import asyncio
+import re
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from stock_news_analyzer.analyzer import (
+    ChunkPacker,
+    analyze_news,
+    analyze_sentiment,
+    fetch_news_content,
+    parse_article,
+    reduce_summaries,
+    summarize_news,
+)
+from stock_news_analyzer.utils.cache import ResultCache, SummaryCache
+
+from .fake_llm import FakeChatModel
+
+ARTICLE_HTML = """<html><body>
+<div class="media_end_head_title"><h2>제목 {n}</h2></div>
+<div class="byline">기자</div>
+<div class="newsct_article _article_body"><article>본문 {n}</article></div>
+</body></html>"""
+
+
+async def serve_articles(handler, links):
+    app = web.Application()
+    app.router.add_get("/mnews/article/{office_id}/{article_id}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        news_links = [{"link": str(server.make_url(path))} for path in links]
+        return await fetch_news_content(news_links, concurrency=4)
+    finally:
+        await server.close()
+
+
+def test_parse_article_keeps_title_and_body_only():
+    content = parse_article(ARTICLE_HTML.format(n=1))
+    assert "제목 1" in content
+    assert "본문 1" in content
+    assert "기자" not in content
+
+
+def test_fetch_news_content_keeps_input_order_and_isolates_errors():
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        article_id = int(request.match_info["article_id"])
+        active += 1
+        peak = max(peak, active)
+        # 앞의 기사일수록 늦게 응답합니다.
+        await asyncio.sleep(0.01 * (10 - article_id))
+        active -= 1
+        if article_id == 3:
+            raise web.HTTPInternalServerError()
+        return web.Response(text=ARTICLE_HTML.format(n=article_id), content_type="text/html")
+
+    links = [f"/mnews/article/009/{n}" for n in range(8)]
+    contents = asyncio.run(serve_articles(handler, links))
+
+    assert [re.search(r"본문 (\d)", content).group(1) for content in contents] == [
+        "0", "1", "2", "4", "5", "6", "7"]
+    assert 1 < peak <= 4
+
+
+def test_summarize_news_limits_map_concurrency():
+    llm = FakeChatModel(delay=0.01, prompts=[])
+    contents = [f"기사 {n} 내용" for n in range(6)]
+
+    summary = asyncio.run(summarize_news(contents, llm, max_concurrency=2, chunk_tokens=3))
+
+    # 기사마다 map 호출 한 번과 마지막 reduce 호출 한 번
+    assert llm.calls == 7
+    assert llm.peak == 2
+    assert summary == "요약7"
+    assert "요약1" in llm.prompts[-1]
+
+
+def test_reduce_summaries_collapses_large_inputs():
+    llm = FakeChatModel(prompts=[])
+    summaries = ["단어 " * 40 for _ in range(10)]
+
+    asyncio.run(reduce_summaries(summaries, llm, token_max=100))
+
+    # 100 토큰 이하로 묶어 5번 병합한 뒤, 다시 한 번에 합칩니다.
+    assert llm.calls == 6
+
+
+def test_reduce_summaries_splits_a_single_oversized_summary():
+    llm = FakeChatModel(prompts=[])
+
+    summary = asyncio.run(reduce_summaries(["단어 " * 250], llm, token_max=100))
+
+    # 100 토큰 이하 조각 3개를 병합한 뒤 한 번 더 합치고, 같은 요약을 다시 병합하지 않습니다.
+    assert llm.calls == 4
+    assert summary == "요약4"
+    assert all(len(prompt.split()) <= 100 + 50 for prompt in llm.prompts)
+
+
+def test_reduce_summaries_truncates_when_merging_does_not_shrink():
+    class VerboseModel(FakeChatModel):
+        def _respond(self, messages):
+            result = super()._respond(messages)
+            result.generations[0].message.content = "긴 " * 90
+            return result
+
+    llm = VerboseModel(prompts=[])
+    asyncio.run(reduce_summaries(["단어 " * 90 for _ in range(3)], llm, token_max=100))
+
+    # 병합 결과가 줄지 않으면 잘라서 마지막 병합 한 번만 더 합니다.
+    assert llm.calls == 4
+    assert len(llm.prompts[-1].split()) <= 100 + 50
+
+
+def test_analyze_sentiment_returns_text():
+    llm = FakeChatModel(prompts=[])
+    result = asyncio.run(analyze_sentiment("요약", "SK하이닉스", llm))
+    assert result == "요약1"
+    assert "SK하이닉스" in llm.prompts[0]
+
+
+def test_analyze_news_streams_links_into_map_stage():
+    llm = FakeChatModel(prompts=[])
+    calls_before_last_link = []
+
+    async def handler(request):
+        article_id = int(request.match_info["article_id"])
+        return web.Response(text=ARTICLE_HTML.format(n=article_id), content_type="text/html")
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/mnews/article/{office_id}/{article_id}", handler)
+        server = TestServer(app)
+        await server.start_server()
+
+        async def news_links():
+            for n in range(5):
+                if n == 4:
+                    calls_before_last_link.append(llm.calls)
+                yield {"link": str(server.make_url(f"/mnews/article/009/{n}"))}
+                await asyncio.sleep(0.05)
+
+        try:
+            return await analyze_news(news_links(), "SK하이닉스", llm, chunk_tokens=4)
+        finally:
+            await server.close()
+
+    result = asyncio.run(run())
+
+    # 마지막 링크를 찾기 전에 이미 앞의 기사들의 요약이 시작되었습니다.
+    assert calls_before_last_link[0] > 0
+    # map 5번, reduce 1번, 감정 분석 1번
+    assert llm.calls == 7
+    assert result == {"summary": "요약6", "sentiment_analysis": "요약7"}
+    # 첫 번째 map 호출은 첫 번째 기사를 요약합니다.
+    assert "본문 0" in llm.prompts[0]
+
+
+def test_analyze_news_without_contents_returns_none():
+    llm = FakeChatModel(prompts=[])
+    assert asyncio.run(analyze_news([], "SK하이닉스", llm)) is None
+    assert llm.calls == 0
+
+
+def test_summarize_news_reuses_cached_chunk_summaries(tmp_path):
+    summary_cache = SummaryCache(tmp_path / "summary.sqlite3")
+    contents = [f"기사 {n} 내용" for n in range(3)]
+
+    first = FakeChatModel(prompts=[])
+    asyncio.run(summarize_news(contents, first, summary_cache=summary_cache, chunk_tokens=3))
+    assert first.calls == 4
+
+    # 새 기사 하나만 map 단계에서 요약하고, 나머지는 캐시된 요약으로 reduce합니다.
+    second = FakeChatModel(prompts=[])
+    asyncio.run(summarize_news(
+        contents + ["기사 3 내용"], second, summary_cache=summary_cache, chunk_tokens=3))
+    assert second.calls == 2
+    assert "기사 3 내용" in second.prompts[0]
+    assert "요약1" in second.prompts[1]
+
+    # 모델이 다르면 캐시를 쓰지 않습니다.
+    other = FakeChatModel(model_name="other-model", prompts=[])
+    asyncio.run(summarize_news(contents, other, summary_cache=summary_cache, chunk_tokens=3))
+    assert other.calls == 4
+
+
+def test_analyze_news_returns_cached_result_until_new_article(tmp_path):
+    result_cache = ResultCache(tmp_path / "result.sqlite3")
+
+    async def fake_fetch(session, url, cache=None, throttle=None):
+        return ARTICLE_HTML.format(n=int(url.rsplit("/", 1)[-1]))
+
+    def links(count):
+        return [{"link": f"https://n.news.naver.com/mnews/article/009/{n:010d}"}
+                for n in range(count)]
+
+    with patch("stock_news_analyzer.analyzer.fetch", fake_fetch):
+        first = FakeChatModel(prompts=[])
+        result = asyncio.run(analyze_news(
+            links(2), "SK하이닉스", first, result_cache=result_cache, chunk_tokens=4))
+        assert first.calls == 4
+
+        # 같은 기사 집합이면 순서가 달라도 LLM을 호출하지 않습니다.
+        second = FakeChatModel(prompts=[])
+        cached = asyncio.run(analyze_news(
+            links(2)[::-1], "SK하이닉스", second, result_cache=result_cache, chunk_tokens=4))
+        assert second.calls == 0
+        assert cached == result
+
+        # 회사 이름 대신 코드로 요청해도 같은 결과를 씁니다.
+        by_code = FakeChatModel(prompts=[])
+        assert asyncio.run(analyze_news(
+            links(2), "000660", by_code, result_cache=result_cache, chunk_tokens=4)) == result
+        assert by_code.calls == 0
+
+        # 결과를 바꾸는 설정이 다르면 다시 분석합니다.
+        for settings in ({"chunk_tokens": 8}, {"chunk_tokens": 4, "dedup_contents": False}):
+            other_settings = FakeChatModel(prompts=[])
+            asyncio.run(analyze_news(
+                links(2), "SK하이닉스", other_settings, result_cache=result_cache, **settings))
+            assert other_settings.calls > 0
+
+        # 새 기사가 추가되면 다시 분석합니다.
+        third = FakeChatModel(prompts=[])
+        asyncio.run(analyze_news(
+            links(3), "SK하이닉스", third, result_cache=result_cache, chunk_tokens=4))
+        assert third.calls == 5
+
+
+def test_chunk_packer_packs_whole_articles_within_budget():
+    llm = FakeChatModel(prompts=[])
+    packer = ChunkPacker(llm, token_budget=50)
+    contents = [f"기사{n} " + "내용 " * 9 for n in range(20)]
+    contents.insert(5, "긴기사 " + "문장. " * 120)
+
+    chunks = [chunk for content in contents for chunk in packer.add(content)]
+    chunks.extend(packer.flush())
+
+    assert all(llm.get_num_tokens(chunk) <= 50 for chunk in chunks)
+    assert len(chunks) < len(contents)
+    assert packer.num_articles == 21
+    assert packer.num_chunks == len(chunks)
+    # 내용을 잃지 않습니다.
+    assert sum(llm.get_num_tokens(chunk) for chunk in chunks) == packer.num_tokens == 20 * 10 + 121
+    assert "본문 21개를" in packer.report()
+
+
+def test_chunk_packer_keeps_later_chunks_when_articles_are_prepended():
+    def pack(contents):
+        packer = ChunkPacker(FakeChatModel(prompts=[]), token_budget=1000)
+        chunks = [chunk for content in contents for chunk in packer.add(content)]
+        return chunks + packer.flush()
+
+    contents = [f"기사 {n} 내용" for n in range(40)]
+    before = pack(contents)
+    after = pack(["새 기사 하나", "새 기사 둘"] + contents)
+
+    # 해시 경계 덕분에 첫 조각 이후의 조각은 그대로입니다.
+    assert len(before) > 2
+    assert len(set(before) & set(after)) >= len(before) - 1
+
+
+def test_summarize_news_picks_strategy_by_input_size(caplog):
+    caplog.set_level("INFO", logger="stock_news_analyzer.analyzer")
+    contents = [f"기사 {n} 내용" for n in range(6)]
+
+    small = FakeChatModel(prompts=[])
+    asyncio.run(summarize_news(contents, small))
+    assert small.calls == 1
+    assert "요약 전략: stuff, LLM 호출 1회" in caplog.text
+    assert all(content in small.prompts[0] for content in contents)
+
+    medium = FakeChatModel(prompts=[])
+    asyncio.run(summarize_news(contents, medium, chunk_tokens=9))
+    assert "요약 전략: map_reduce" in caplog.text
+
+    large = FakeChatModel(prompts=[])
+    with patch("stock_news_analyzer.analyzer.REDUCE_TOKEN_MAX", 2):
+        asyncio.run(summarize_news(contents, large, chunk_tokens=3))
+    assert "요약 전략: tree_reduce" in caplog.text
+    # 6개 조각 요약 -> 3개 -> 2개로 병합한 뒤 마지막으로 합칩니다.
+    assert large.calls == 6 + 3 + 2 + 1
+    assert "병합 단계 2개" in caplog.text
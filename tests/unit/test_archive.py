@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from stock_news_analyzer.archive import read_archive, write_archive  # noqa: E402
+
+
+def make_news(article_id, day, month=5, **extra):
+    return {
+        "date": f"2024.{month:02d}.{day:02d} 09:{article_id % 60:02d}",
+        "source": "매일경제",
+        "title": f"뉴스 {article_id}",
+        "link": f"https://n.news.naver.com/mnews/article/009/{article_id:010d}",
+        **extra,
+    }
+
+
+def test_write_archive_partitions_by_month_and_company(tmp_path):
+    write_archive(tmp_path, "000660", [make_news(1, 31), make_news(2, 1, month=6)])
+    write_archive(tmp_path, "005930", [make_news(3, 2, month=6)])
+
+    partitions = sorted(
+        str(path.parent.relative_to(tmp_path)) for path in tmp_path.rglob("*.parquet"))
+    assert partitions == [
+        "month=2024-05/company_code=000660",
+        "month=2024-06/company_code=000660",
+        "month=2024-06/company_code=005930",
+    ]
+
+
+def test_read_archive_filters_and_projects_appended_runs(tmp_path):
+    write_archive(tmp_path, "000660", [make_news(1, 1), make_news(2, 10)])
+    # 다음 실행의 결과는 기존 파일을 덮어쓰지 않고 추가됩니다.
+    write_archive(tmp_path, "000660", [make_news(3, 20, summary="요약", sentiment="긍정")])
+    write_archive(tmp_path, "005930", [make_news(4, 15)])
+
+    table = read_archive(
+        tmp_path,
+        start_date=date(2024, 5, 5),
+        end_date=date(2024, 5, 31),
+        company_codes=["000660"],
+        columns=["date", "title", "summary"],
+    )
+
+    assert table.column_names == ["date", "title", "summary"]
+    rows = sorted(table.to_pylist(), key=lambda row: row["date"])
+    assert rows == [
+        {"date": date(2024, 5, 10), "title": "뉴스 2", "summary": None},
+        {"date": date(2024, 5, 20), "title": "뉴스 3", "summary": "요약"},
+    ]
+    assert read_archive(tmp_path).num_rows == 4
+
+
+def test_read_archive_keeps_latest_row_of_rearchived_articles(tmp_path):
+    write_archive(tmp_path, "000660", [make_news(1, 1), make_news(2, 2)])
+    # 다음 날 같은 기간을 다시 저장합니다.
+    write_archive(tmp_path, "000660", [make_news(2, 2, summary="새 요약"), make_news(3, 3)])
+    write_archive(tmp_path, "005930", [make_news(2, 2)])
+
+    table = read_archive(tmp_path, columns=["company_code", "title", "summary"])
+
+    rows = sorted(table.to_pylist(), key=lambda row: (row["company_code"], row["title"]))
+    assert rows == [
+        {"company_code": "000660", "title": "뉴스 1", "summary": None},
+        {"company_code": "000660", "title": "뉴스 2", "summary": "새 요약"},
+        {"company_code": "000660", "title": "뉴스 3", "summary": None},
+        {"company_code": "005930", "title": "뉴스 2", "summary": None},
+    ]
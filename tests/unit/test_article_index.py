@@ -0,0 +1,145 @@
+import asyncio
+import sqlite3
+from unittest.mock import patch
+
+from stock_news_analyzer.analyzer import SENTIMENT_FAILURE, analyze_news, fetch_news_content
+from stock_news_analyzer.finder import get_news_link
+from stock_news_analyzer.news import NewsItem
+from stock_news_analyzer.store import NewsStore
+from stock_news_analyzer.utils.article_index import ArticleIndex, BloomFilter, article_key
+
+from .fake_llm import FakeChatModel
+from .test_analyzer import ARTICLE_HTML
+from .test_finder_crawl import build_pages, fake_fetch
+
+
+def make_news(article_id):
+    return {
+        "date": "2024.05.10 09:00",
+        "source": "매일경제",
+        "title": f"뉴스 {article_id}",
+        "link": f"https://n.news.naver.com/mnews/article/009/{article_id:010d}",
+    }
+
+
+def test_article_key_packs_office_and_article_ids():
+    assert article_key(make_news(5371234)) == 9 * 10 ** 10 + 5371234
+    assert article_key(NewsItem.from_dict(make_news(1))) == article_key(make_news(1))
+    assert article_key({"link": "https://example.com/"}) is None
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(10_000, error_rate=0.01)
+    for key in range(10_000):
+        bloom.add(key)
+
+    assert all(key in bloom for key in range(10_000))
+    false_positives = sum(key in bloom for key in range(10_000, 20_000))
+    assert false_positives < 300
+    assert len(bloom.bits) < 12_000
+
+
+def test_article_index_persists_across_runs(tmp_path):
+    index = ArticleIndex(tmp_path / "articles.sqlite3", batch_size=2)
+    assert index.add(make_news(1)) and index.add(make_news(2)) and index.add(make_news(3))
+    assert not index.add(make_news(1))
+    # 아직 저장하지 않은 키도 찾을 수 있습니다.
+    assert index.seen(make_news(3)) and not index.seen(make_news(4))
+    index.close()
+
+    reopened = ArticleIndex(tmp_path / "articles.sqlite3", capacity=1)
+    assert len(reopened) == 3
+    assert all(reopened.seen(make_news(i)) for i in (1, 2, 3))
+    assert not reopened.seen(make_news(4))
+    reopened.close()
+
+
+def test_article_index_reuses_saved_bloom_filter_unless_keys_changed(tmp_path):
+    path = tmp_path / "articles.sqlite3"
+    index = ArticleIndex(path, capacity=100)
+    for i in range(10):
+        index.add(make_news(i))
+    index.close()
+
+    rebuild = patch.object(
+        ArticleIndex, "_rebuild_bloom", autospec=True, side_effect=ArticleIndex._rebuild_bloom)
+    with rebuild as rebuilt:
+        reopened = ArticleIndex(path, capacity=100)
+        assert all(reopened.seen(make_news(i)) for i in range(10))
+        assert not reopened.seen(make_news(10))
+        reopened.close()
+        assert rebuilt.call_count == 0
+
+        # 저장 뒤에 다른 곳에서 추가된 키가 있으면 다시 만듭니다.
+        with sqlite3.connect(path) as conn:
+            conn.execute("INSERT INTO articles (key, added_at) VALUES (?, 0)",
+                         (article_key(make_news(10)),))
+        conn.close()
+        changed = ArticleIndex(path, capacity=100)
+        assert changed.seen(make_news(10))
+        changed.close()
+        assert rebuilt.call_count == 1
+
+        # 크기가 다르면 저장된 비트 배열을 쓰지 않습니다.
+        ArticleIndex(path, capacity=1000).close()
+        assert rebuilt.call_count == 2
+
+
+def test_finder_and_analyzer_skip_processed_articles(tmp_path):
+    index = ArticleIndex(tmp_path / "articles.sqlite3")
+    pages = build_pages(1)
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, [])):
+        news_links = asyncio.run(get_news_link(code="000660"))
+    index.add(news_links[0])
+
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, [])):
+        unseen = asyncio.run(get_news_link(code="000660", article_index=index))
+    assert unseen == news_links[1:]
+
+    fetched = []
+
+    async def fetch_article_html(session, url, cache=None, throttle=None):
+        fetched.append(url)
+        return ARTICLE_HTML.format(n=len(fetched))
+
+    with patch("stock_news_analyzer.analyzer.fetch", fetch_article_html):
+        contents = asyncio.run(fetch_news_content(news_links, article_index=index))
+        result = asyncio.run(analyze_news(
+            news_links, "SK하이닉스", FakeChatModel(prompts=[]), article_index=index))
+        again = asyncio.run(analyze_news(
+            news_links, "SK하이닉스", FakeChatModel(prompts=[]), article_index=index))
+
+    assert len(contents) == 2
+    assert result is not None and again is None
+    assert sorted(fetched) == sorted([news["link"] for news in news_links[1:]] * 2)
+    index.close()
+
+
+def test_article_index_records_only_analyzed_articles(tmp_path):
+    index = ArticleIndex(tmp_path / "articles.sqlite3")
+    store = NewsStore(tmp_path / "news.sqlite3")
+    stored, fetched = make_news(1), make_news(2)
+    store.add_body(stored, "저장된 본문")
+    store.flush()
+
+    async def fetch_article_html(session, url, cache=None, throttle=None):
+        return ARTICLE_HTML.format(n=2)
+
+    async def fail_sentiment(summary, company, llm):
+        return SENTIMENT_FAILURE
+
+    def analyze():
+        return asyncio.run(analyze_news(
+            [stored, fetched], "SK하이닉스", FakeChatModel(prompts=[]), news_store=store,
+            article_index=index))
+
+    with patch("stock_news_analyzer.analyzer.fetch", fetch_article_html):
+        with patch("stock_news_analyzer.analyzer.analyze_sentiment", fail_sentiment):
+            analyze()
+        assert not index.seen(stored) and not index.seen(fetched)
+
+        analyze()
+    # 저장소에서 읽은 본문의 기사도 기록합니다.
+    assert index.seen(stored) and index.seen(fetched)
+    store.close()
+    index.close()
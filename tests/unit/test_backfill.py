@@ -0,0 +1,90 @@
+import asyncio
+import re
+from datetime import timedelta
+from unittest.mock import patch
+
+from stock_news_analyzer.backfill import BackfillCheckpoint, backfill
+from stock_news_analyzer.store import NewsStore
+
+from .test_finder_crawl import NOW, build_pages
+
+
+def listing_fetch(pages_by_code, requested):
+    """마지막 페이지를 넘으면 마지막 페이지를 다시 보여주는 목록 페이지."""
+    async def _fetch(session, url, cache=None, throttle=None):
+        code = re.search(r"code=(\d+)", url).group(1)
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        requested.append((code, page))
+        pages = pages_by_code[code]
+        return pages[min(page, max(pages))]
+    return _fetch
+
+
+def run_backfill(tmp_path, pages_by_code, requested, until, **kwargs):
+    news_store = NewsStore(tmp_path / "news.sqlite3")
+    checkpoint = BackfillCheckpoint(tmp_path / "backfill.sqlite3")
+    try:
+        with patch("stock_news_analyzer.backfill.fetch", listing_fetch(pages_by_code, requested)):
+            return asyncio.run(backfill(
+                sorted(pages_by_code), until, news_store, checkpoint, rate=0, **kwargs))
+    finally:
+        news_store.close()
+        checkpoint.close()
+
+
+def test_backfill_resumes_without_refetching(tmp_path):
+    pages_by_code = {"000660": build_pages(5), "005930": build_pages(5)}
+    until = (NOW - timedelta(days=2)).date()
+
+    requested = []
+    progress = run_backfill(tmp_path, pages_by_code, requested, until, max_pages=2)
+    assert sorted(requested) == [("000660", 1), ("000660", 2), ("005930", 1), ("005930", 2)]
+    assert progress.pages == 4
+
+    requested = []
+    progress = run_backfill(tmp_path, pages_by_code, requested, until)
+    # 3 페이지까지 저장하고, 4 페이지에서 `until` 이전 뉴스를 만나 끝납니다.
+    assert sorted(requested) == [("000660", 3), ("000660", 4), ("005930", 3), ("005930", 4)]
+    assert progress.finished_companies == 2
+    assert progress.items == 6
+
+    requested = []
+    run_backfill(tmp_path, pages_by_code, requested, until)
+    assert requested == []
+
+    news_store = NewsStore(tmp_path / "news.sqlite3")
+    assert len(news_store.news("000660")) == 9
+    news_store.close()
+
+
+def test_backfill_stops_at_end_of_listing_and_extends_further_back(tmp_path):
+    pages_by_code = {"000660": build_pages(2)}
+
+    requested = []
+    run_backfill(tmp_path, pages_by_code, requested, (NOW - timedelta(days=30)).date())
+    # 3 페이지는 2 페이지와 같으므로 목록의 끝입니다.
+    assert requested == [("000660", 1), ("000660", 2), ("000660", 3)]
+
+    requested = []
+    run_backfill(tmp_path, pages_by_code, requested, (NOW - timedelta(days=60)).date())
+    # 다시 시작할 때는 앞 페이지를 다시 가져와 목록의 끝인지 확인합니다.
+    assert requested == [("000660", 3), ("000660", 2)]
+
+
+def test_backfill_resumes_after_listing_shifted_by_one_page(tmp_path):
+    until = (NOW - timedelta(days=30)).date()
+    old_pages = build_pages(4)
+    run_backfill(tmp_path, {"000660": old_pages}, [], until, max_pages=2)
+
+    # 다시 실행하기 전에 한 페이지만큼 새 뉴스가 올라와 기존 페이지가 하나씩 밀렸습니다.
+    # 새 1 페이지는 다시 가져오지 않으므로 내용은 상관없습니다.
+    shifted = {1: old_pages[1], **{page + 1: html for page, html in old_pages.items()}}
+    requested = []
+    progress = run_backfill(tmp_path, {"000660": shifted}, requested, until)
+
+    assert progress.finished_companies == 1
+    assert requested[:2] == [("000660", 3), ("000660", 2)]
+    news_store = NewsStore(tmp_path / "news.sqlite3")
+    assert len(news_store.news("000660")) == 12
+    news_store.close()
+
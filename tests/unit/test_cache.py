@@ -0,0 +1,80 @@
+import time
+from unittest.mock import patch
+
+from stock_news_analyzer.utils.cache import DiskCache, ResponseCache
+
+LISTING_URL = "https://finance.naver.com/item/news_news.nhn?code=000660&page=1"
+ARTICLE_URL = "https://n.news.naver.com/mnews/article/009/0005371516"
+
+
+def test_disk_cache_hit_and_miss(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    assert cache.get("a") is None
+    cache.set("a", b"value")
+    assert cache.get("a") == b"value"
+    assert cache.stats() == {"hits": 1, "misses": 1, "bytes": 5}
+
+
+def test_disk_cache_persists_between_instances(tmp_path):
+    DiskCache(tmp_path / "cache.sqlite3").set("a", b"value")
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    assert cache.get("a") == b"value"
+    assert cache.size == 5
+
+
+def test_disk_cache_expires_entries(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    cache.set("a", b"value", ttl=10)
+    with patch("stock_news_analyzer.utils.cache.time.time", return_value=time.time() + 11):
+        assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.size == 8
+
+
+def test_response_cache_ttl_by_url_class(tmp_path):
+    assert ResponseCache.ttl_for(LISTING_URL) == 300
+    assert ResponseCache.ttl_for(ARTICLE_URL) is None
+
+    cache = ResponseCache(tmp_path / "http.sqlite3")
+    cache.set_text(ARTICLE_URL, "<div>기사</div>")
+    assert cache.get_text(ARTICLE_URL) == "<div>기사</div>"
+
+
+def test_disk_cache_evicts_down_to_low_water_mark(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=100, low_water=0.5)
+    for i in range(10):
+        cache.set(f"k{i}", b"x" * 10)
+    assert cache.size == 100
+
+    cache.set("k10", b"x" * 10)
+    assert cache.size == 50
+    assert [cache.get(f"k{i}") is None for i in (5, 6)] == [True, False]
+
+    # 다음 저장은 여유가 있으므로 아무것도 지우지 않습니다.
+    cache.set("k11", b"x" * 10)
+    assert cache.size == 60
+
+
+def test_disk_cache_batches_access_times(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = DiskCache(path, max_bytes=10, touch_batch=100)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")
+    cache.close()
+
+    reopened = DiskCache(path, max_bytes=10)
+    reopened.set("c", b"1234")
+    assert reopened.get("b") is None
+    assert reopened.get("a") == b"1234"
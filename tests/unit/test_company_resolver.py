@@ -0,0 +1,50 @@
+import asyncio
+from unittest.mock import patch
+
+from stock_news_analyzer.finder import get_news_link
+from stock_news_analyzer.utils.company_resolver import CompanyResolver, get_resolver, resolve_code
+
+from .test_finder_crawl import build_pages
+
+COMPANIES = {"SK하이닉스": "000660", "삼성전자": "005930", "삼성전기": "009150", "LG전자": "066570"}
+
+
+def test_resolve_normalizes_spacing_case_and_width():
+    resolver = CompanyResolver(COMPANIES)
+
+    for query in ["SK하이닉스 ", "sk하이닉스", "ＳＫ 하이닉스", "000660"]:
+        assert resolver.resolve(query)[0] == ("SK하이닉스", "000660", 1.0)
+    assert resolver.resolve("삼성 전자")[0].code == "005930"
+
+
+def test_resolve_ranks_typos_and_prefixes():
+    resolver = CompanyResolver(COMPANIES)
+
+    matches = resolver.resolve("삼성전쟈")
+    assert [match.name for match in matches[:2]] == ["삼성전자", "삼성전기"]
+    assert matches[0].score > matches[1].score
+    assert resolver.resolve("하이닉스")[0].name == "SK하이닉스"
+    assert [match.name for match in resolver.complete("삼성전")] == ["삼성전기", "삼성전자"]
+
+
+def test_resolve_code_rejects_unknown_and_ambiguous_names():
+    assert resolve_code("SK하이닉스") == "000660"
+    assert resolve_code("삼성전쟈") == "005930"
+    # '삼성전기'와 '삼성전자'가 같은 점수이므로 고르지 않습니다.
+    assert resolve_code("삼성전") is None
+    assert resolve_code("완전히 없는 회사") is None
+    assert get_resolver() is get_resolver()
+
+
+def test_get_news_link_accepts_noisy_company_name():
+    requested = []
+
+    async def fake_fetch(session, url, cache=None, throttle=None):
+        requested.append(url)
+        return build_pages(1)[1]
+
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch):
+        result = asyncio.run(get_news_link(company="SK 하이닉스 "))
+
+    assert len(result) == 3
+    assert "code=000660" in requested[0]
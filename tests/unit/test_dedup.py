@@ -0,0 +1,98 @@
+import asyncio
+import random
+
+from stock_news_analyzer.dedup import (
+    ContentDeduplicator,
+    SimHashIndex,
+    filter_similar_news,
+    hamming_distance,
+    iter_filter_similar_news,
+    simhash,
+)
+
+
+def news(title, article_id):
+    return {"date": "2024.09.27 17:52", "source": "언론사", "title": title,
+            "link": f"https://n.news.naver.com/mnews/article/009/{article_id:010d}"}
+
+
+NEWS_LINKS = [
+    news("하이닉스 사는 외국인, 삼성전자는 내다 판다", 1),
+    news("[속보] 반도체 핵심기술 중국 유출…전 삼성전자 임원 등 2명 구속기소", 2),
+    news("하이닉스 사는 외국인…삼성전자는 내다 판다", 3),
+    news("반도체 핵심기술 중국 유출…전 삼성전자 임원 등 2명 구속기소", 4),
+    news("SK하이닉스 주가 상승", 5),
+    news("SK하이닉스 주가 하락", 6),
+]
+
+
+def test_simhash_is_close_for_near_duplicate_titles():
+    assert hamming_distance(simhash(NEWS_LINKS[0]["title"], 2), simhash(NEWS_LINKS[2]["title"], 2)) == 0
+    assert hamming_distance(simhash(NEWS_LINKS[0]["title"], 2), simhash(NEWS_LINKS[1]["title"], 2)) > 10
+
+
+def test_filter_similar_news_keeps_first_of_each_cluster():
+    result = filter_similar_news(NEWS_LINKS)
+
+    assert [item["link"][-1] for item in result] == ["1", "2", "5", "6"]
+    assert [item["cluster_size"] for item in result] == [2, 2, 1, 1]
+    assert "cluster_size" not in NEWS_LINKS[0]
+
+
+def test_iter_filter_similar_news_yields_representatives_as_they_arrive():
+    async def stream():
+        for item in NEWS_LINKS:
+            yield item
+
+    async def collect():
+        # 반환되는 순간의 내용을 확인합니다.
+        return [dict(item) async for item in iter_filter_similar_news(stream())]
+
+    result = asyncio.run(collect())
+    assert [item["link"][-1] for item in result] == ["1", "2", "5", "6"]
+    assert all("cluster_size" not in item for item in result)
+    assert result[0] == NEWS_LINKS[0]
+
+
+def test_simhash_index_matches_brute_force():
+    rng = random.Random(0)
+    fingerprints = [rng.getrandbits(64) for _ in range(2000)]
+    # 일부는 기존 값에서 비트 몇 개만 바꾼 값
+    for _ in range(200):
+        base = rng.choice(fingerprints)
+        for bit in rng.sample(range(64), rng.randint(0, 5)):
+            base ^= 1 << bit
+        fingerprints.append(base)
+
+    index = SimHashIndex(max_distance=3)
+    for fingerprint in fingerprints:
+        expected = next(
+            (i for i in range(len(index)) if hamming_distance(index._fingerprints[i], fingerprint) <= 3),
+            None,
+        )
+        assert index.query(fingerprint) == expected
+        index.add(fingerprint)
+
+
+def test_content_deduplicator_skips_syndicated_bodies():
+    body = "SK하이닉스가 고대역폭 메모리 수요 증가에 힘입어 3분기 사상 최대 실적을 기록했다. " * 5
+    deduplicator = ContentDeduplicator()
+    assert not deduplicator.is_duplicate(body)
+    assert deduplicator.is_duplicate("(서울=연합뉴스) " + body)
+    assert not deduplicator.is_duplicate("삼성전자가 새 폴더블 스마트폰을 공개했다. " * 5)
+    assert deduplicator.duplicates == 1
+
+
+def test_iter_filter_similar_news_reports_cluster_sizes_at_the_end(caplog):
+    async def stream():
+        for item in NEWS_LINKS:
+            yield item
+
+    async def collect():
+        return [item async for item in iter_filter_similar_news(stream())]
+
+    with caplog.at_level("INFO", logger="stock_news_analyzer.dedup"):
+        asyncio.run(collect())
+
+    assert "중복 뉴스 2개를 제외하고 4개의 뉴스를 남겼습니다." in caplog.text
+    assert f"2개 묶음: {NEWS_LINKS[0]['title']}" in caplog.text
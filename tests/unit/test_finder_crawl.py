@@ -0,0 +1,85 @@
+import asyncio
+import re
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from benchmarks.naver_pages import make_listing_page
+from stock_news_analyzer.finder import get_news_link, parse_news_page
+
+NOW = datetime.now().replace(second=0, microsecond=0)
+
+
+def build_pages(num_pages, per_page=3):
+    """페이지마다 하루씩 이전 날짜의 뉴스를 담은 목록 페이지를 만듭니다."""
+    pages = {}
+    article_id = 1000
+    for page in range(1, num_pages + 1):
+        rows = []
+        for i in range(per_page):
+            article_id -= 1
+            news_date = NOW - timedelta(days=page - 1, minutes=i)
+            rows.append((news_date, "009", f"{article_id:010d}", f"뉴스 {page}-{i}", "매일경제"))
+        pages[page] = make_listing_page(rows)
+    return pages
+
+
+def fake_fetch(pages, requested, delays=None):
+    async def _fetch(session, url, cache=None, throttle=None):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        requested.append(page)
+        await asyncio.sleep((delays or {}).get(page, 0))
+        return pages[page]
+    return _fetch
+
+
+def test_parse_news_page_skips_related_and_hidden_rows():
+    html = build_pages(1)[1]
+    news_items, reached_start = parse_news_page(html, NOW.date())
+    assert not reached_start
+    assert [news["title"] for news in news_items] == ["뉴스 1-0", "뉴스 1-1", "뉴스 1-2"]
+    assert news_items[0]["link"] == "https://n.news.naver.com/mnews/article/009/0000000999"
+    assert news_items[0]["source"] == "매일경제"
+
+
+def test_concurrent_crawl_keeps_page_order():
+    pages = build_pages(5)
+    requested = []
+    # 앞 페이지가 더 늦게 도착해도 결과는 페이지 순서를 유지해야 합니다.
+    delays = {1: 0.05, 2: 0.03, 3: 0.01}
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, requested, delays)):
+        result = asyncio.run(get_news_link(code="000660", max_pages=5, concurrency=5))
+
+    assert len(result) == 15
+    assert [news["title"] for news in result][:4] == ["뉴스 1-0", "뉴스 1-1", "뉴스 1-2", "뉴스 2-0"]
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+
+
+def test_concurrent_crawl_stops_before_date_from():
+    pages = build_pages(10)
+    requested = []
+    date_from = (NOW - timedelta(days=1)).strftime("%Y.%m.%d")
+    delays = {page: 0.01 * page for page in pages}
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, requested, delays)):
+        result = asyncio.run(get_news_link(
+            code="000660", date_from=date_from, max_pages=10, concurrency=3))
+
+    assert [news["title"] for news in result] == [
+        "뉴스 1-0", "뉴스 1-1", "뉴스 1-2", "뉴스 2-0", "뉴스 2-1", "뉴스 2-2"]
+    # 3페이지에서 시작 날짜 이전의 뉴스를 만나면 나머지 페이지는 요청하지 않습니다.
+    assert max(requested) < 10
+
+
+def test_seek_crawls_only_pages_in_window():
+    pages = build_pages(64)
+    requested = []
+    date_from = (NOW - timedelta(days=22)).strftime("%Y.%m.%d")
+    date_to = (NOW - timedelta(days=20)).strftime("%Y.%m.%d")
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, requested)):
+        result = asyncio.run(get_news_link(
+            code="000660", date_from=date_from, date_to=date_to, max_pages=10, seek=True))
+
+    assert [news["title"] for news in result][::3] == ["뉴스 21-0", "뉴스 22-0", "뉴스 23-0"]
+    assert len(result) == 9
+    # 페이지 1부터 차례로 보지 않고 탐색한 페이지와 범위 안의 페이지만 요청합니다.
+    assert len(set(requested)) < 16
+    assert 5 not in requested
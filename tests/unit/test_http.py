@@ -0,0 +1,22 @@
+import asyncio
+
+from stock_news_analyzer.utils.http import create_session
+
+
+def test_create_session_configures_connector(monkeypatch):
+    monkeypatch.setenv("USER_AGENT", "stock-news-analyzer-test")
+
+    async def inspect():
+        async with create_session(
+            limit=10, limit_per_host=4, keepalive_timeout=45, ttl_dns_cache=600
+        ) as session:
+            connector = session.connector
+            return (
+                connector.limit,
+                connector.limit_per_host,
+                connector._keepalive_timeout,
+                connector._cached_hosts._ttl,
+                session.headers["User-Agent"],
+            )
+
+    assert asyncio.run(inspect()) == (10, 4, 45, 600, "stock-news-analyzer-test")
@@ -0,0 +1,41 @@
+import os
+import re
+import subprocess
+import sys
+
+# 크롤링만 하는 경로(`stock_news_analyzer.cli`)를 불러오는 데 허용하는 누적 시간(마이크로초).
+# langchain을 함께 불러오면 이 값을 훨씬 넘습니다.
+IMPORT_TIME_BUDGET_US = int(os.getenv("STOCK_NEWS_ANALYZER_IMPORT_BUDGET_US", 1_000_000))
+
+HEAVY_MODULES = ("langchain", "langchain_core", "langchain_community", "langchain_openai", "openai")
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(module):
+    """`python -X importtime`으로 `module`을 새 프로세스에서 불러와 모듈별 누적 시간을 반환합니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(3)] = int(match.group(1))
+    return times
+
+
+def test_cli_does_not_import_llm_stack():
+    times = import_times("stock_news_analyzer.cli")
+
+    heavy = sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+
+
+def test_cli_cold_start_within_budget():
+    times = import_times("stock_news_analyzer.cli")
+
+    assert times["stock_news_analyzer.cli"] < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,27 @@
+import asyncio
+import io
+import json
+from unittest.mock import patch
+
+from stock_news_analyzer.cli import run_links_only
+
+from .test_finder_crawl import NOW, build_pages, fake_fetch
+from .test_watchlist import make_args
+
+
+def test_run_links_only_writes_json_lines():
+    pages = build_pages(3)
+    requested = []
+    date = NOW.strftime("%Y.%m.%d")
+    args = make_args(
+        date_from=date, date_to=date, max_pages=3, concurrency=2, seek=False, no_dedup=True)
+    output = io.StringIO()
+
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, requested)):
+        written = asyncio.run(run_links_only(["000660"], args, output))
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert written == len(lines) == 3
+    assert [news["title"] for news in lines] == ["뉴스 1-0", "뉴스 1-1", "뉴스 1-2"]
+    assert set(lines[0]) == {"company", "date", "source", "title", "link"}
+    assert lines[0]["company"] == "000660"
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+from benchmarks.naver_pages import make_listing_page
+from stock_news_analyzer.listing import ListingWindow, parse_listing
+
+NOW = datetime(2024, 5, 10, 9, 30)
+
+
+def make_page():
+    rows = [
+        (NOW + timedelta(days=1), "009", "0000000005", "내일 뉴스", "매일경제"),
+        (NOW, "009", "0000000004", " <b>오늘</b> 뉴스 ", "매일경제"),
+        (NOW - timedelta(days=1), "015", "0000000003", "어제 뉴스", "한국경제"),
+        (NOW - timedelta(days=2), "009", "0000000002", "그제 뉴스", "매일경제"),
+    ]
+    return make_listing_page(rows)
+
+
+def test_parse_listing_returns_compact_records_in_window():
+    window = ListingWindow(NOW.date(), start_date=(NOW - timedelta(days=1)).date())
+    news_items, reached_start = parse_listing(make_page(), window)
+
+    assert reached_start
+    assert news_items == [
+        {
+            "date": "2024.05.10 09:30",
+            "source": "매일경제",
+            "title": "오늘뉴스",
+            "link": "https://n.news.naver.com/mnews/article/009/0000000004",
+        },
+        {
+            "date": "2024.05.09 09:30",
+            "source": "한국경제",
+            "title": "어제 뉴스",
+            "link": "https://n.news.naver.com/mnews/article/015/0000000003",
+        },
+    ]
+
+
+def test_parse_listing_skips_after_end_date_and_empty_pages():
+    window = ListingWindow(NOW.date(), end_date=(NOW - timedelta(days=1)).date())
+    news_items, reached_start = parse_listing(make_page(), window)
+
+    assert not reached_start
+    assert [news["title"] for news in news_items] == ["어제 뉴스", "그제 뉴스"]
+    assert parse_listing("", window) == ([], False)
+    assert parse_listing("<html><body>점검 중</body></html>", window) == ([], False)
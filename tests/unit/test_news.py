@@ -0,0 +1,52 @@
+import json
+import pickle
+from datetime import datetime
+
+from stock_news_analyzer import finder
+from stock_news_analyzer.news import NewsItem, extract_article_info, parse_article_link
+
+NEWS = {
+    "date": "2024.09.27 22:43",
+    "source": "매일경제",
+    "title": "SK하이닉스, HBM 공급 확대",
+    "link": "https://n.news.naver.com/mnews/article/009/0005371234",
+}
+
+
+def test_news_item_is_a_dict_compatible_view():
+    news = NewsItem(9, 5371234, datetime(2024, 9, 27, 22, 43), "매일경제", NEWS["title"])
+
+    assert news == NEWS
+    assert dict(news) == NEWS
+    assert news["link"] == NEWS["link"] and news.get("body") is None
+    assert json.loads(json.dumps({"company": "SK하이닉스", **news})) == {
+        "company": "SK하이닉스", **NEWS}
+    assert not hasattr(news, "__dict__")
+
+
+def test_news_items_hash_on_article_ids():
+    news = NewsItem.from_dict(NEWS)
+    renamed = NewsItem.from_dict({**NEWS, "title": "다른 제목"})
+
+    assert news.key == (9, 5371234)
+    assert news == renamed and len({news, renamed}) == 1
+    assert news != NewsItem.from_dict({**NEWS, "link": NEWS["link"][:-1] + "5"})
+
+
+def test_pickled_news_item_keeps_interned_source():
+    news = NewsItem.from_dict(NEWS)
+    restored = pickle.loads(pickle.dumps(news))
+
+    assert restored == news and restored.published == news.published
+    assert restored.source is news.source
+
+
+def test_article_id_helpers_parse_links_and_listing_hrefs():
+    href = "/item/news_read.naver?article_id=0005371516&office_id=009&code=000660&page=1"
+    link = "https://n.news.naver.com/mnews/article/009/0005371516"
+
+    assert extract_article_info(href) == parse_article_link(link) == ("009", "0005371516")
+    assert extract_article_info("/item/news.naver") == parse_article_link("/") == ("", "")
+    # 기존 코드가 finder에서 불러오던 이름도 그대로 씁니다.
+    assert finder.extract_article_info is extract_article_info
+    assert finder.parse_article_link is parse_article_link
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from lxml import etree
+
+from stock_news_analyzer import listing
+from stock_news_analyzer.finder import get_news_link
+from stock_news_analyzer.listing import ListingWindow, parse_listing
+from stock_news_analyzer.parsing import ParsePool, parse_article
+
+from .test_analyzer import ARTICLE_HTML
+from .test_finder_crawl import NOW, build_pages, fake_fetch
+
+
+def test_process_pool_returns_same_results_as_inline():
+    html = build_pages(1)[1]
+    window = ListingWindow(NOW.date())
+
+    async def run():
+        async with ParsePool(workers=2) as pool:
+            return await asyncio.gather(
+                pool.run(parse_listing, html, window),
+                pool.run(parse_article, ARTICLE_HTML.format(n=1)),
+            )
+
+    listing, article = asyncio.run(run())
+    assert listing == parse_listing(html, window)
+    assert article == parse_article(ARTICLE_HTML.format(n=1))
+
+
+def test_crawl_parses_pages_in_thread_pool():
+    pages = build_pages(3)
+    requested = []
+
+    async def run():
+        async with ParsePool(workers=2, executor="thread") as pool:
+            return await get_news_link(
+                code="000660", max_pages=3, concurrency=3, parse_pool=pool)
+
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, requested)):
+        result = asyncio.run(run())
+
+    assert [news["title"] for news in result][:4] == ["뉴스 1-0", "뉴스 1-1", "뉴스 1-2", "뉴스 2-0"]
+    assert len(result) == 9
+
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValueError):
+        ParsePool(workers=1, executor="gpu")
+
+
+def test_thread_pool_parses_listings_in_parallel():
+    html = build_pages(1)[1]
+    window = ListingWindow(NOW.date())
+    # 두 스레드가 모두 파싱 도중에 만나야 통과합니다. 파서를 함께 쓰면 한 스레드가 파서를
+    # 기다리는 동안 다른 스레드의 대기 시간이 끝나 BrokenBarrierError가 납니다.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class MeetingTreeBuilder(etree.TreeBuilder):
+        met = False
+
+        def start(self, tag, attrs, nsmap=None):
+            if not self.met:
+                self.met = True
+                barrier.wait()
+            return super().start(tag, attrs)
+
+    html_parser = etree.HTMLParser
+
+    def make_parser():
+        return html_parser(target=MeetingTreeBuilder())
+
+    async def run():
+        async with ParsePool(workers=2, executor="thread") as pool:
+            return await asyncio.gather(
+                pool.run(parse_listing, html, window), pool.run(parse_listing, html, window))
+
+    with patch.object(listing, "_local", threading.local()), \
+            patch.object(listing.etree, "HTMLParser", side_effect=make_parser):
+        first, second = asyncio.run(run())
+
+    assert first == second == parse_listing(html, window)
@@ -0,0 +1,179 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from stock_news_analyzer.utils.ratelimit import (
+    AIMDController,
+    CircuitBreaker,
+    CircuitOpenError,
+    HTTPStatusError,
+    RetryableStatusError,
+    Throttle,
+    TokenBucket,
+)
+
+
+def fault_app(responses, requested):
+    """`responses`에 적힌 순서대로 (상태 코드, 헤더, 지연)으로 응답하는 서버."""
+    async def handler(request):
+        requested.append(asyncio.get_running_loop().time())
+        status, headers, delay = responses.pop(0) if responses else (200, {}, 0)
+        await asyncio.sleep(delay)
+        return web.Response(status=status, text=f"status {status}", headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    return app
+
+
+def request_all(throttle, responses, count=1):
+    requested = []
+
+    async def run():
+        async with TestServer(fault_app(responses, requested)) as server:
+            async with aiohttp.ClientSession() as session:
+                url = str(server.make_url("/"))
+                results = []
+                for _ in range(count):
+                    try:
+                        results.append(await throttle.request(session, url))
+                    except Exception as e:
+                        results.append(e)
+                return results
+
+    return asyncio.run(run()), requested
+
+
+def test_retries_faults_and_honours_retry_after():
+    throttle = Throttle(rate=0, max_retries=3, backoff_base=0.01)
+    responses = [(503, {}, 0), (429, {"Retry-After": "0.2"}, 0), (200, {}, 0)]
+
+    results, requested = request_all(throttle, responses)
+
+    assert results == [(200, "status 200")]
+    assert len(requested) == 3
+    assert requested[2] - requested[1] >= 0.2
+
+
+def test_gives_up_after_max_retries_and_opens_circuit():
+    throttle = Throttle(
+        rate=0, max_retries=1, backoff_base=0.01, failure_threshold=2, reset_timeout=60)
+    responses = [(500, {}, 0)] * 3
+
+    results, requested = request_all(throttle, responses, count=2)
+
+    assert results[0].status == 500
+    assert isinstance(results[1], CircuitOpenError)
+    assert len(requested) == 2
+
+
+def test_timeouts_are_retried():
+    throttle = Throttle(rate=0, timeout=0.1, max_retries=1, backoff_base=0.01)
+
+    results, requested = request_all(throttle, [(200, {}, 0.5)])
+
+    assert results == [(200, "status 200")]
+    assert len(requested) == 2
+    controller = next(iter(throttle.hosts.values())).controller
+    assert controller.limit == 2
+
+
+def test_token_bucket_spaces_requests():
+    async def measure():
+        bucket = TokenBucket(rate=50, capacity=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(6):
+            await bucket.acquire()
+        return loop.time() - started
+
+    assert asyncio.run(measure()) >= 0.09
+
+
+def test_aimd_grows_by_one_per_window_and_halves_on_congestion():
+    controller = AIMDController(initial=4, maximum=8, latency_target=1.0)
+    for _ in range(4):
+        controller.on_success(0.1)
+    assert controller.limit == 4 and controller.window == pytest.approx(4.9, abs=0.05)
+
+    controller.on_success(0.1)
+    assert controller.limit == 5
+
+    controller.on_success(5.0)
+    assert controller.limit == 2
+    # 같은 혼잡으로 동시에 실패한 요청은 창을 한 번만 줄입니다.
+    controller.on_congestion()
+    assert controller.limit == 2
+
+
+def test_aimd_limits_requests_in_flight():
+    async def run():
+        controller = AIMDController(initial=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        return peak
+
+    assert asyncio.run(run()) == 2
+
+
+def test_circuit_breaker_half_open_allows_a_single_trial():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_cancelled_half_open_trial_does_not_block_the_host():
+    throttle = Throttle(rate=0, max_retries=0, failure_threshold=1, reset_timeout=0.05)
+    responses = [(500, {}, 0), (200, {}, 5)]
+    requested = []
+
+    async def run():
+        async with TestServer(fault_app(responses, requested)) as server:
+            async with aiohttp.ClientSession() as session:
+                url = str(server.make_url("/"))
+                with pytest.raises(RetryableStatusError):
+                    await throttle.request(session, url)
+                await asyncio.sleep(0.1)
+
+                trial = asyncio.create_task(throttle.request(session, url))
+                while len(requested) < 2:
+                    await asyncio.sleep(0.01)
+                trial.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await trial
+
+                return await throttle.request(session, url)
+
+    assert asyncio.run(run()) == (200, "status 200")
+    assert next(iter(throttle.hosts.values())).breaker.state == "closed"
+
+
+def test_non_retryable_error_status_is_raised_and_not_counted_as_success():
+    throttle = Throttle(rate=0, max_retries=3, backoff_base=0.01, failure_threshold=1)
+
+    results, requested = request_all(throttle, [(403, {}, 0), (404, {}, 0)], count=2)
+
+    assert [type(result) for result in results] == [HTTPStatusError, HTTPStatusError]
+    assert [result.status for result in results] == [403, 404]
+    assert len(requested) == 2
+    assert throttle.status_errors == {403: 1, 404: 1}
+    host = next(iter(throttle.hosts.values()))
+    assert host.controller.window == throttle.initial_concurrency
+    assert host.breaker.state == "closed"
@@ -0,0 +1,96 @@
+import asyncio
+import sqlite3
+from datetime import date
+from unittest.mock import patch
+
+from stock_news_analyzer.analyzer import fetch_news_content
+from stock_news_analyzer.store import NewsStore
+from stock_news_analyzer.utils.article_index import ArticleIndex
+from stock_news_analyzer.utils.cache import DiskCache
+from stock_news_analyzer.utils.watermark import WatermarkStore
+
+
+def make_news(article_id, title, day=1, office_id="009"):
+    return {
+        "date": f"2024.05.{day:02d} 09:00",
+        "source": "매일경제",
+        "title": title,
+        "link": f"https://n.news.naver.com/mnews/article/{office_id}/{article_id:010d}",
+    }
+
+
+def test_search_by_title_and_body(tmp_path):
+    store = NewsStore(tmp_path / "news.sqlite3")
+    hbm = make_news(1, "SK하이닉스, HBM 공급 확대", day=1)
+    fab = make_news(2, "반도체 공장 증설 발표", day=2)
+    other = make_news(3, "삼성전자 실적 발표", day=3)
+    store.add_news("000660", [hbm, fab])
+    store.add_news("005930", [other])
+    store.add_body(fab, "SK하이닉스가 고대역폭메모리 생산을 위해 공장을 늘립니다.")
+
+    assert [news["title"] for news in store.search("고대역폭메모리")] == [fab["title"]]
+    assert [news["title"] for news in store.search("하이닉스")] == [fab["title"], hbm["title"]]
+    assert [news["title"] for news in store.search("발표", company_code="005930")] == [
+        other["title"]]
+    # 세 글자보다 짧은 검색어는 색인 대신 LIKE로 찾습니다.
+    assert [news["company_code"] for news in store.search("발표")] == ["005930", "000660"]
+    assert store.search("하이닉스", start_date=date(2024, 5, 2), end_date=date(2024, 5, 2)) == [
+        {**{key: fab[key] for key in ("date", "source", "title", "link")},
+         "company_code": "000660"}]
+    store.close()
+
+
+def test_writes_are_batched_and_persisted(tmp_path):
+    path = tmp_path / "news.sqlite3"
+    store = NewsStore(path, batch_size=3)
+    store.add_news("000660", [make_news(1, "첫 번째 뉴스"), make_news(2, "두 번째 뉴스")])
+
+    def count():
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM news").fetchone()[0]
+
+    assert count() == 0
+    store.add_news("000660", [make_news(3, "세 번째 뉴스")])
+    assert count() == 3
+    store.add_news("000660", [make_news(4, "네 번째 뉴스")])
+    store.close()
+
+    reopened = NewsStore(path)
+    news = reopened.news("000660", with_body=True)
+    assert [item["title"] for item in news] == ["첫 번째 뉴스", "두 번째 뉴스", "세 번째 뉴스", "네 번째 뉴스"]
+    assert all(item["body"] is None for item in news)
+    reopened.close()
+
+
+def test_fetch_news_content_reads_stored_bodies(tmp_path):
+    store = NewsStore(tmp_path / "news.sqlite3")
+    news = make_news(1, "저장된 뉴스")
+    store.add_news("000660", [news])
+    store.add_body(news, "저장된 본문")
+    store.flush()
+
+    async def fail_fetch(session, url, cache=None, throttle=None):
+        raise AssertionError("저장된 본문은 다시 가져오지 않아야 합니다.")
+
+    with patch("stock_news_analyzer.analyzer.fetch", fail_fetch):
+        contents = asyncio.run(fetch_news_content([news], news_store=store))
+
+    assert contents == ["저장된 본문"]
+    store.close()
+
+
+def test_sqlite_stores_expand_home_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    stores = [
+        NewsStore("~/cache/news.sqlite3"),
+        DiskCache("~/cache/http.sqlite3"),
+        WatermarkStore("~/cache/watermark.sqlite3"),
+        ArticleIndex("~/cache/articles.sqlite3"),
+    ]
+    for store in stores:
+        store.close()
+
+    assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == [
+        "articles.sqlite3", "http.sqlite3", "news.sqlite3", "watermark.sqlite3"]
+    assert not (tmp_path / "~").exists()
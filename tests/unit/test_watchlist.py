@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+from unittest.mock import patch
+
+from stock_news_analyzer.cli import run_watchlist
+from stock_news_analyzer.utils.watchlist import read_watchlist
+
+
+def make_args(**overrides):
+    args = {
+        "max_companies": 2,
+        "max_connections": 16,
+        "max_connections_per_host": 8,
+        "keepalive_timeout": 30.0,
+        "dns_cache_ttl": 300,
+        "with_history": False,
+        "archive": None,
+        "no_throttle": True,
+        "parse_workers": 0,
+        "parse_executor": "process",
+    }
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def test_read_watchlist_skips_comments_and_duplicates(tmp_path):
+    path = tmp_path / "watchlist.txt"
+    path.write_text("# 반도체\n삼성전자\n000660  # SK하이닉스\n\n삼성전자\n", encoding="utf-8")
+
+    assert read_watchlist(str(path)) == ["삼성전자", "000660"]
+
+
+def test_run_watchlist_shares_session_and_limits_companies():
+    sessions = set()
+    active = 0
+    peak = 0
+    delays = {"A": 0.1, "B": 0.01, "C": 0.03}
+
+    async def fake_analyze_company(company, args, llm, session, *caches):
+        nonlocal active, peak
+        sessions.add(id(session))
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(delays[company])
+        active -= 1
+        if company == "C":
+            raise RuntimeError("boom")
+        return {"summary": company, "sentiment_analysis": "긍정"}
+
+    finished = []
+    with (
+        patch("stock_news_analyzer.cli.analyze_company", fake_analyze_company),
+        patch("stock_news_analyzer.cli.log_result", lambda company, _: finished.append(company)),
+    ):
+        results = asyncio.run(run_watchlist(["A", "B", "C"], make_args(), llm=None))
+
+    assert len(sessions) == 1
+    assert peak == 2
+    # 끝나는 순서대로 기록되고, 한 회사의 오류가 다른 회사의 결과에 영향을 주지 않습니다.
+    assert finished == ["B", "C", "A"]
+    assert results == {
+        "A": {"summary": "A", "sentiment_analysis": "긍정"},
+        "B": {"summary": "B", "sentiment_analysis": "긍정"},
+        "C": None,
+    }
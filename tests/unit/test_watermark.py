@@ -0,0 +1,95 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.naver_pages import make_listing_page
+from stock_news_analyzer.finder import get_news_link
+from stock_news_analyzer.utils.watermark import WatermarkStore
+
+from .test_finder_crawl import NOW, fake_fetch
+
+
+def paginate(rows, per_page=3):
+    return {
+        page + 1: make_listing_page(rows[start:start + per_page])
+        for page, start in enumerate(range(0, len(rows), per_page))
+    }
+
+
+def make_rows(first_id, count):
+    """`first_id`부터 1분씩 이전 시각의 뉴스를 최신순으로 만듭니다."""
+    return [
+        (NOW - timedelta(minutes=first_id - article_id), "009", f"{article_id:010d}",
+         f"뉴스 {article_id}", "매일경제")
+        for article_id in range(first_id, first_id - count, -1)
+    ]
+
+
+def crawl(pages, requested, watermark, with_history=False):
+    with patch("stock_news_analyzer.finder.fetch", fake_fetch(pages, requested)):
+        return asyncio.run(get_news_link(
+            code="000660", max_pages=3, concurrency=3,
+            watermark=watermark, with_history=with_history))
+
+
+def test_incremental_crawl_stops_at_seen_article(tmp_path):
+    store = WatermarkStore(tmp_path / "watermark.sqlite3")
+    old_rows = make_rows(100, 9)
+
+    requested = []
+    first = crawl(paginate(old_rows), requested, store)
+    assert [news["title"] for news in first] == [f"뉴스 {i}" for i in range(100, 91, -1)]
+    assert sorted(requested) == [1, 2, 3]
+    assert store.watermark("000660")[2] == f"{100:010d}"
+
+    # 새 뉴스 두 개가 앞에 추가되어 기존 뉴스가 뒤로 밀려납니다.
+    new_rows = make_rows(102, 2) + old_rows
+    requested = []
+    second = crawl(paginate(new_rows), requested, store)
+    assert [news["title"] for news in second] == ["뉴스 102", "뉴스 101"]
+    assert requested == [1]
+    assert store.watermark("000660")[2] == f"{102:010d}"
+
+    requested = []
+    third = crawl(paginate(new_rows), requested, store)
+    assert third == []
+    assert requested == [1]
+    store.close()
+
+
+def test_incremental_crawl_merges_history(tmp_path):
+    store = WatermarkStore(tmp_path / "watermark.sqlite3")
+    old_rows = make_rows(100, 9)
+    crawl(paginate(old_rows), [], store)
+
+    merged = crawl(paginate(make_rows(101, 1) + old_rows), [], store, with_history=True)
+
+    assert [news["title"] for news in merged] == [f"뉴스 {i}" for i in range(101, 91, -1)]
+    assert len(store.history("000660")) == 10
+    store.close()
+
+
+def test_failed_or_truncated_crawl_keeps_the_watermark(tmp_path):
+    store = WatermarkStore(tmp_path / "watermark.sqlite3")
+    old_rows = make_rows(100, 9)
+    crawl(paginate(old_rows), [], store)
+
+    new_rows = make_rows(106, 6) + old_rows
+    broken = paginate(new_rows)
+    del broken[2]
+    with pytest.raises(KeyError):
+        crawl(broken, [], store)
+    assert store.watermark("000660")[2] == f"{100:010d}"
+
+    # 새 뉴스가 세 페이지보다 많아 이미 본 뉴스에 도달하지 못한 경우
+    many_rows = make_rows(115, 15) + old_rows
+    truncated = crawl(paginate(many_rows), [], store)
+    assert len(truncated) == 9
+    assert store.watermark("000660")[2] == f"{100:010d}"
+
+    recovered = crawl(paginate(new_rows), [], store)
+    assert [news["title"] for news in recovered] == [f"뉴스 {i}" for i in range(106, 100, -1)]
+    assert store.watermark("000660")[2] == f"{106:010d}"
+    store.close()